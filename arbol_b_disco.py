@@ -0,0 +1,528 @@
+"""
+Árbol B+ en disco con la misma interfaz que arboles.ArbolAVL.
+
+Los nodos son páginas de tamaño fijo dentro de un fichero accedido con
+mmap. Una caché LRU guarda las páginas decodificadas más usadas y solo
+escribe en el fichero las modificadas al expulsarlas o al sincronizar.
+Todos los valores viven en las hojas, que están enlazadas entre sí para
+recorrer rangos sin volver a bajar por el árbol.
+
+Formato del fichero:
+    Página 0: metadatos (raíz, lista de páginas libres, contadores)
+    Página n: cabecera (tipo, número de claves, siguiente) + claves
+              [+ hijos si es un nodo interno]
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+
+HOJA, INTERNO, LIBRE = 0, 1, 2
+MAGIA = b"ARBOLB+1"
+
+CABECERA = struct.Struct("<BxHI")            # tipo, número de claves, siguiente
+METADATOS = struct.Struct("<8sIIIQQ")        # magia, tamaño página, raíz, libre, páginas, total
+TAMANO_HIJO = 4                              # número de página en 'I'
+
+
+class Pagina:
+    """
+    Página decodificada en memoria.
+
+    Atributos:
+        numero: Posición de la página en el fichero
+        tipo: HOJA o INTERNO
+        claves: Lista ordenada de claves
+        hijos: Números de página de los hijos (solo nodos internos)
+        siguiente: Hoja siguiente en orden (0 = ninguna)
+        sucia: True si hay cambios sin escribir en el fichero
+    """
+
+    __slots__ = ("numero", "tipo", "claves", "hijos", "siguiente", "sucia")
+
+    def __init__(self, numero, tipo, claves=None, hijos=None, siguiente=0):
+        self.numero = numero
+        self.tipo = tipo
+        self.claves = claves if claves is not None else []
+        self.hijos = hijos if hijos is not None else []
+        self.siguiente = siguiente
+        self.sucia = True
+
+    @property
+    def es_hoja(self):
+        return self.tipo == HOJA
+
+
+class ArbolBDisco:
+    """
+    Árbol B+ paginado sobre un fichero mmap.
+
+    Atributos:
+        ruta: Fichero que almacena el árbol
+        tamano_pagina: Bytes por página
+        capacidad_cache: Páginas decodificadas que se mantienen en memoria
+    """
+
+    def __init__(self, ruta, formato_clave="<q", tamano_pagina=4096, capacidad_cache=1024):
+        """
+        Abre (o crea) el árbol en 'ruta'.
+
+        Args:
+            ruta: Fichero de datos
+            formato_clave: Formato 'struct' de un solo campo para las claves
+            tamano_pagina: Bytes por página (fijo para un fichero ya creado)
+            capacidad_cache: Máximo de páginas en la caché LRU
+        """
+        self.ruta = ruta
+        self.capacidad_cache = max(8, capacidad_cache)
+        self._cache = OrderedDict()
+        self._orden = formato_clave[0] if formato_clave[0] in "<>!=@" else "<"
+        self._codigo = formato_clave.lstrip("<>!=@")
+        self._tamano_clave = struct.calcsize(self._orden + self._codigo)
+        self._structs = {}
+
+        nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        self._archivo = open(ruta, "w+b" if nuevo else "r+b")
+        if nuevo:
+            self.tamano_pagina = tamano_pagina
+            self._archivo.truncate(tamano_pagina * 16)
+            self._mapear()
+            self._raiz, self._libre, self._num_paginas, self._total = 0, 0, 1, 0
+            raiz = self._nueva_pagina(HOJA)
+            self._raiz = raiz.numero
+            self._escribir_metadatos()
+        else:
+            cabecera = self._archivo.read(METADATOS.size)
+            magia, self.tamano_pagina, self._raiz, self._libre, self._num_paginas, self._total = \
+                METADATOS.unpack(cabecera)
+            if magia != MAGIA:
+                raise ValueError(f"{ruta!r} no es un fichero de ArbolBDisco")
+            self._mapear()
+
+        self._max_hoja = (self.tamano_pagina - CABECERA.size) // self._tamano_clave
+        self._max_interno = (self.tamano_pagina - CABECERA.size - TAMANO_HIJO) // \
+            (self._tamano_clave + TAMANO_HIJO)
+        if self._max_hoja < 3 or self._max_interno < 3:
+            raise ValueError("Página demasiado pequeña para este formato de clave")
+
+    # ==================== FICHERO Y CACHÉ ====================
+
+    def _mapear(self):
+        self._archivo.flush()
+        self._mm = mmap.mmap(self._archivo.fileno(), 0)
+
+    def _asegurar_capacidad(self, paginas):
+        """Hace crecer el fichero (al doble) si no caben 'paginas' páginas."""
+        necesario = paginas * self.tamano_pagina
+        if necesario > len(self._mm):
+            nuevo = max(necesario, 2 * len(self._mm))
+            self._mm.close()
+            self._archivo.truncate(nuevo)
+            self._mapear()
+
+    def _struct_pagina(self, tipo, n):
+        """Struct del cuerpo de una página con n claves (se cachea)."""
+        clave = (tipo, n)
+        if clave not in self._structs:
+            formato = f"{self._orden}{n}{self._codigo}"
+            if tipo == INTERNO:
+                formato += f"{n + 1}I"
+            self._structs[clave] = struct.Struct(formato)
+        return self._structs[clave]
+
+    def _leer(self, numero):
+        """
+        Devuelve la página 'numero', desde la caché o decodificándola.
+
+        Returns:
+            Pagina: Página pedida
+        """
+        pagina = self._cache.get(numero)
+        if pagina is not None:
+            self._cache.move_to_end(numero)
+            return pagina
+        desplazamiento = numero * self.tamano_pagina
+        tipo, n, siguiente = CABECERA.unpack_from(self._mm, desplazamiento)
+        campos = self._struct_pagina(tipo, n).unpack_from(self._mm, desplazamiento + CABECERA.size)
+        if tipo == INTERNO:
+            pagina = Pagina(numero, tipo, list(campos[:n]), list(campos[n:]), siguiente)
+        else:
+            pagina = Pagina(numero, tipo, list(campos), None, siguiente)
+        pagina.sucia = False
+        self._guardar_en_cache(pagina)
+        return pagina
+
+    def _marcar(self, pagina):
+        """Registra que la página ha cambiado (y la vuelve a poner en caché)."""
+        pagina.sucia = True
+        self._guardar_en_cache(pagina)
+
+    def _guardar_en_cache(self, pagina):
+        self._cache[pagina.numero] = pagina
+        self._cache.move_to_end(pagina.numero)
+        while len(self._cache) > self.capacidad_cache:
+            _, expulsada = self._cache.popitem(last=False)
+            if expulsada.sucia:
+                self._volcar(expulsada)
+
+    def _volcar(self, pagina):
+        """Codifica la página en su posición del fichero."""
+        desplazamiento = pagina.numero * self.tamano_pagina
+        n = len(pagina.claves)
+        CABECERA.pack_into(self._mm, desplazamiento, pagina.tipo, n, pagina.siguiente)
+        cuerpo = self._struct_pagina(pagina.tipo, n)
+        if pagina.tipo == INTERNO:
+            cuerpo.pack_into(self._mm, desplazamiento + CABECERA.size, *pagina.claves, *pagina.hijos)
+        elif pagina.tipo == HOJA:
+            cuerpo.pack_into(self._mm, desplazamiento + CABECERA.size, *pagina.claves)
+        pagina.sucia = False
+
+    def _nueva_pagina(self, tipo):
+        """Reserva una página (reutilizando libres si las hay)."""
+        if self._libre:
+            numero = self._libre
+            self._libre = CABECERA.unpack_from(self._mm, numero * self.tamano_pagina)[2]
+        else:
+            numero = self._num_paginas
+            self._num_paginas += 1
+            self._asegurar_capacidad(self._num_paginas)
+        pagina = Pagina(numero, tipo)
+        self._marcar(pagina)
+        return pagina
+
+    def _liberar(self, pagina):
+        """Devuelve la página a la lista de libres."""
+        self._cache.pop(pagina.numero, None)
+        CABECERA.pack_into(self._mm, pagina.numero * self.tamano_pagina, LIBRE, 0, self._libre)
+        self._libre = pagina.numero
+
+    def _escribir_metadatos(self):
+        METADATOS.pack_into(self._mm, 0, MAGIA, self.tamano_pagina, self._raiz,
+                            self._libre, self._num_paginas, self._total)
+
+    def sincronizar(self):
+        """Escribe las páginas sucias y los metadatos, y vuelca el mmap a disco."""
+        for pagina in self._cache.values():
+            if pagina.sucia:
+                self._volcar(pagina)
+        self._escribir_metadatos()
+        self._mm.flush()
+
+    def cerrar(self):
+        """Sincroniza y cierra el fichero."""
+        if self._mm.closed:
+            return
+        self.sincronizar()
+        self._cache.clear()
+        self._mm.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # ==================== DESCENSO ====================
+
+    def _bajar(self, valor):
+        """
+        Baja hasta la hoja que debería contener 'valor'.
+
+        Returns:
+            tuple: (hoja, camino) con camino = [(página interna, índice del hijo)]
+        """
+        camino = []
+        pagina = self._leer(self._raiz)
+        while not pagina.es_hoja:
+            i = bisect_right(pagina.claves, valor)
+            camino.append((pagina, i))
+            pagina = self._leer(pagina.hijos[i])
+        return pagina, camino
+
+    # ==================== INSERCIÓN ====================
+
+    def insertar(self, valor):
+        """
+        Inserta un valor (los duplicados se ignoran).
+
+        Args:
+            valor: Valor a insertar
+        """
+        hoja, camino = self._bajar(valor)
+        i = bisect_left(hoja.claves, valor)
+        if i < len(hoja.claves) and hoja.claves[i] == valor:
+            return
+        hoja.claves.insert(i, valor)
+        self._total += 1
+        self._marcar(hoja)
+
+        # Dividir hacia arriba mientras haya páginas desbordadas
+        pagina = hoja
+        while len(pagina.claves) > (self._max_hoja if pagina.es_hoja else self._max_interno):
+            separador, nueva = self._dividir(pagina)
+            if camino:
+                padre, i = camino.pop()
+                padre.claves.insert(i, separador)
+                padre.hijos.insert(i + 1, nueva.numero)
+                self._marcar(padre)
+                pagina = padre
+            else:
+                raiz = self._nueva_pagina(INTERNO)
+                raiz.claves = [separador]
+                raiz.hijos = [pagina.numero, nueva.numero]
+                self._raiz = raiz.numero
+                break
+
+    def _dividir(self, pagina):
+        """
+        Parte una página llena en dos.
+
+        Returns:
+            tuple: (clave separadora, nueva página derecha)
+        """
+        nueva = self._nueva_pagina(pagina.tipo)
+        medio = len(pagina.claves) // 2
+        if pagina.es_hoja:
+            nueva.claves = pagina.claves[medio:]
+            pagina.claves = pagina.claves[:medio]
+            nueva.siguiente = pagina.siguiente
+            pagina.siguiente = nueva.numero
+            separador = nueva.claves[0]
+        else:
+            separador = pagina.claves[medio]
+            nueva.claves = pagina.claves[medio + 1:]
+            nueva.hijos = pagina.hijos[medio + 1:]
+            pagina.claves = pagina.claves[:medio]
+            pagina.hijos = pagina.hijos[:medio + 1]
+        self._marcar(pagina)
+        self._marcar(nueva)
+        return separador, nueva
+
+    # ==================== BÚSQUEDA ====================
+
+    def buscar(self, valor):
+        """
+        Busca un valor en el árbol.
+
+        Returns:
+            bool: True si el valor existe, False en caso contrario
+        """
+        hoja, _ = self._bajar(valor)
+        i = bisect_left(hoja.claves, valor)
+        return i < len(hoja.claves) and hoja.claves[i] == valor
+
+    # ==================== ELIMINACIÓN ====================
+
+    def eliminar(self, valor):
+        """
+        Elimina un valor, prestando o fusionando páginas si quedan escasas.
+
+        Args:
+            valor: Valor a eliminar
+        """
+        hoja, camino = self._bajar(valor)
+        i = bisect_left(hoja.claves, valor)
+        if i == len(hoja.claves) or hoja.claves[i] != valor:
+            return
+        del hoja.claves[i]
+        self._total -= 1
+        self._marcar(hoja)
+
+        pagina = hoja
+        while camino:
+            minimo = self._max_hoja // 2 if pagina.es_hoja else self._max_interno // 2
+            if len(pagina.claves) >= minimo:
+                return
+            padre, i = camino.pop()
+            self._reequilibrar(padre, i, pagina, minimo)
+            pagina = padre
+
+        # La raíz interna sin claves cede su único hijo
+        if not pagina.es_hoja and not pagina.claves:
+            self._raiz = pagina.hijos[0]
+            self._liberar(pagina)
+
+    def _reequilibrar(self, padre, i, pagina, minimo):
+        """Arregla 'pagina' (hijo i de 'padre') pidiendo prestado o fusionando."""
+        izquierda = self._leer(padre.hijos[i - 1]) if i > 0 else None
+        derecha = self._leer(padre.hijos[i + 1]) if i + 1 < len(padre.hijos) else None
+
+        # Préstamo desde la derecha
+        if derecha is not None and len(derecha.claves) > minimo:
+            if pagina.es_hoja:
+                pagina.claves.append(derecha.claves.pop(0))
+                padre.claves[i] = derecha.claves[0]
+            else:
+                pagina.claves.append(padre.claves[i])
+                pagina.hijos.append(derecha.hijos.pop(0))
+                padre.claves[i] = derecha.claves.pop(0)
+            for p in (pagina, derecha, padre):
+                self._marcar(p)
+            return
+
+        # Préstamo desde la izquierda
+        if izquierda is not None and len(izquierda.claves) > minimo:
+            if pagina.es_hoja:
+                pagina.claves.insert(0, izquierda.claves.pop())
+                padre.claves[i - 1] = pagina.claves[0]
+            else:
+                pagina.claves.insert(0, padre.claves[i - 1])
+                pagina.hijos.insert(0, izquierda.hijos.pop())
+                padre.claves[i - 1] = izquierda.claves.pop()
+            for p in (pagina, izquierda, padre):
+                self._marcar(p)
+            return
+
+        # Fusión: siempre se vuelca la de la derecha sobre la de la izquierda
+        if derecha is not None:
+            izq, der, separador = pagina, derecha, i
+        else:
+            izq, der, separador = izquierda, pagina, i - 1
+        if izq.es_hoja:
+            izq.claves.extend(der.claves)
+            izq.siguiente = der.siguiente
+        else:
+            izq.claves.append(padre.claves[separador])
+            izq.claves.extend(der.claves)
+            izq.hijos.extend(der.hijos)
+        del padre.claves[separador]
+        del padre.hijos[separador + 1]
+        self._marcar(izq)
+        self._marcar(padre)
+        self._liberar(der)
+
+    # ==================== RECORRIDOS ====================
+
+    def _hoja_extrema(self, derecha=False):
+        pagina = self._leer(self._raiz)
+        while not pagina.es_hoja:
+            pagina = self._leer(pagina.hijos[-1 if derecha else 0])
+        return pagina
+
+    def rango(self, desde=None, hasta=None):
+        """
+        Genera los valores en [desde, hasta] siguiendo las hojas enlazadas.
+
+        Args:
+            desde: Límite inferior (None = desde el mínimo)
+            hasta: Límite superior (None = hasta el máximo)
+        """
+        if desde is None:
+            hoja, i = self._hoja_extrema(), 0
+        else:
+            hoja, _ = self._bajar(desde)
+            i = bisect_left(hoja.claves, desde)
+        while True:
+            claves = hoja.claves
+            for j in range(i, len(claves)):
+                if hasta is not None and claves[j] > hasta:
+                    return
+                yield claves[j]
+            if not hoja.siguiente:
+                return
+            hoja, i = self._leer(hoja.siguiente), 0
+
+    def recorrido_inorden(self):
+        """
+        Realiza un recorrido inorden.
+
+        Returns:
+            list: Lista con los valores en orden
+        """
+        return list(self.rango())
+
+    def recorrido_preorden(self):
+        """
+        En un árbol B+ todos los valores están en las hojas, así que visitar
+        cada página antes (o después) que sus hijos da el mismo orden que el
+        inorden. Se mantiene por compatibilidad con ArbolAVL.
+
+        Returns:
+            list: Lista con los valores
+        """
+        return self.recorrido_inorden()
+
+    def recorrido_postorden(self):
+        """Ver recorrido_preorden."""
+        return self.recorrido_inorden()
+
+    # ==================== CONSULTAS ====================
+
+    def es_vacio(self):
+        return self._total == 0
+
+    def obtener_altura_arbol(self):
+        """
+        Returns:
+            int: Niveles de páginas (1 si solo hay la hoja raíz)
+        """
+        altura = 1
+        pagina = self._leer(self._raiz)
+        while not pagina.es_hoja:
+            pagina = self._leer(pagina.hijos[0])
+            altura += 1
+        return altura
+
+    def contar_nodos(self):
+        """
+        Returns:
+            int: Número de valores almacenados
+        """
+        return self._total
+
+    def contar_hojas(self):
+        """
+        Returns:
+            int: Número de páginas hoja
+        """
+        hojas = 1
+        hoja = self._hoja_extrema()
+        while hoja.siguiente:
+            hoja = self._leer(hoja.siguiente)
+            hojas += 1
+        return hojas
+
+    def obtener_minimo(self):
+        hoja = self._hoja_extrema()
+        return hoja.claves[0] if hoja.claves else None
+
+    def obtener_maximo(self):
+        hoja = self._hoja_extrema(derecha=True)
+        return hoja.claves[-1] if hoja.claves else None
+
+    def __len__(self):
+        return self._total
+
+    # ==================== VISUALIZACIÓN ====================
+
+    def mostrar_arbol(self, numero=None, prefijo=""):
+        """Muestra las páginas del árbol en la consola."""
+        pagina = self._leer(self._raiz if numero is None else numero)
+        etiqueta = "hoja" if pagina.es_hoja else "interno"
+        print(f"{prefijo}[{etiqueta} {pagina.numero}] {pagina.claves}")
+        for hijo in pagina.hijos:
+            self.mostrar_arbol(hijo, prefijo + "   ")
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "indice.btree")
+        with ArbolBDisco(ruta, tamano_pagina=64, capacidad_cache=8) as arbol:
+            for valor in [50, 25, 75, 10, 30, 60, 80, 5, 15, 27, 55, 65, 90]:
+                arbol.insertar(valor)
+            arbol.mostrar_arbol()
+            print(f"Rango [20, 60]: {list(arbol.rango(20, 60))}")
+
+        # Al reabrir, el árbol sigue ahí
+        with ArbolBDisco(ruta) as arbol:
+            arbol.eliminar(50)
+            print(f"Inorden tras reabrir y eliminar 50: {arbol.recorrido_inorden()}")
+            print(f"Mínimo: {arbol.obtener_minimo()}  Máximo: {arbol.obtener_maximo()}")
@@ -0,0 +1,241 @@
+"""
+Árbol (bosque) de expansión mínima sobre dijkstra_mochila.Grafo.
+
+El grafo se trata como no dirigido a través de una VistaSimetrica: arrays
+planos con las aristas (para Kruskal) y una adyacencia compacta en ambos
+sentidos (para Prim). La vista se construye una vez y sirve para ambos.
+
+- Prim: cola de prioridad indexada (ejercicio2.MonticuloDireccionable)
+  con cambiar_prioridad en vez de entradas obsoletas.
+- Kruskal: aristas ordenadas por peso + conjuntos disjuntos con compresión
+  de caminos y unión por rango.
+"""
+
+from array import array
+
+from ejercicio2 import MonticuloDireccionable
+
+
+# ===========================================================
+# VISTA SIMÉTRICA DEL GRAFO
+# ===========================================================
+class VistaSimetrica:
+    """
+    Vista no dirigida y compacta de un dijkstra_mochila.Grafo.
+
+    Atributos:
+        nombres: Nombre de cada vértice por índice
+        origenes, destinos, pesos: Una entrada por arista (sin lazos); los
+            pesos son int64 si todos son enteros que caben y float64 si no,
+            así el árbol conserva el tipo numérico de la entrada
+        desplazamientos: Los vecinos de u son vecinos[desplazamientos[u]:desplazamientos[u + 1]]
+        vecinos, pesos_vecinos: Adyacencia en ambos sentidos
+    """
+
+    def __init__(self, grafo):
+        self.nombres = list(grafo.vertices)
+        indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self.origenes, self.destinos = array('q'), array('q')
+        pesos = []
+        for vertice in grafo.vertices.values():
+            u = indice[vertice.nombre]
+            for arista in vertice.aristas:
+                w = indice[arista.destino.nombre]
+                if u != w:  # los lazos nunca entran en el árbol
+                    self.origenes.append(u)
+                    self.destinos.append(w)
+                    pesos.append(arista.peso)
+        try:
+            self.pesos = array('q', pesos)
+        except (TypeError, OverflowError):  # algún peso real o fuera de 64 bits
+            self.pesos = array('d', pesos)
+
+        # Adyacencia simétrica por conteo (cada arista aparece en sus dos extremos)
+        n = len(self.nombres)
+        grados = [0] * (n + 1)
+        for u in self.origenes:
+            grados[u + 1] += 1
+        for w in self.destinos:
+            grados[w + 1] += 1
+        for i in range(n):
+            grados[i + 1] += grados[i]
+        self.desplazamientos = array('q', grados)
+        total = grados[n]
+        self.vecinos = array('q', bytes(8 * total))
+        self.pesos_vecinos = array(self.pesos.typecode, bytes(8 * total))
+        siguiente = grados[:n]
+        for u, w, p in zip(self.origenes, self.destinos, self.pesos):
+            self.vecinos[siguiente[u]] = w
+            self.pesos_vecinos[siguiente[u]] = p
+            siguiente[u] += 1
+            self.vecinos[siguiente[w]] = u
+            self.pesos_vecinos[siguiente[w]] = p
+            siguiente[w] += 1
+
+    @property
+    def num_vertices(self):
+        return len(self.nombres)
+
+    @property
+    def num_aristas(self):
+        return len(self.pesos)
+
+    def densidad(self):
+        """Aristas respecto al máximo de un grafo simple no dirigido."""
+        n = self.num_vertices
+        return 0.0 if n < 2 else self.num_aristas / (n * (n - 1) / 2)
+
+
+# ===========================================================
+# CONJUNTOS DISJUNTOS (UNION-FIND)
+# ===========================================================
+class ConjuntosDisjuntos:
+    """Union-find con compresión de caminos (por mitades) y unión por rango."""
+
+    def __init__(self, n):
+        self.padre = list(range(n))
+        self.rango = [0] * n
+
+    def encontrar(self, x):
+        padre = self.padre
+        while padre[x] != x:
+            padre[x] = padre[padre[x]]  # compresión por mitades
+            x = padre[x]
+        return x
+
+    def unir(self, a, b):
+        """Une los conjuntos de a y b. Devuelve False si ya estaban juntos."""
+        a, b = self.encontrar(a), self.encontrar(b)
+        if a == b:
+            return False
+        if self.rango[a] < self.rango[b]:
+            a, b = b, a
+        self.padre[b] = a
+        if self.rango[a] == self.rango[b]:
+            self.rango[a] += 1
+        return True
+
+
+# ===========================================================
+# ALGORITMOS
+# ===========================================================
+def kruskal(vista):
+    """
+    Returns:
+        tuple: (aristas [(u, v, peso)] con nombres, peso total)
+    """
+    n = vista.num_vertices
+    pesos, origenes, destinos = vista.pesos, vista.origenes, vista.destinos
+    orden = sorted(range(len(pesos)), key=pesos.__getitem__)
+
+    conjuntos = ConjuntosDisjuntos(n)
+    padre = conjuntos.padre
+    rango = conjuntos.rango
+    elegidas = []
+    for i in orden:
+        # encontrar() en línea: es el bucle más caliente
+        a = origenes[i]
+        while padre[a] != a:
+            padre[a] = padre[padre[a]]
+            a = padre[a]
+        b = destinos[i]
+        while padre[b] != b:
+            padre[b] = padre[padre[b]]
+            b = padre[b]
+        if a == b:
+            continue
+        if rango[a] < rango[b]:
+            a, b = b, a
+        padre[b] = a
+        if rango[a] == rango[b]:
+            rango[a] += 1
+        elegidas.append(i)
+        if len(elegidas) == n - 1:
+            break  # árbol completo: el resto de aristas sobra
+
+    nombres = vista.nombres
+    aristas = [(nombres[origenes[i]], nombres[destinos[i]], pesos[i]) for i in elegidas]
+    return aristas, sum(pesos[i] for i in elegidas)
+
+
+def prim(vista, aridad=4):
+    """
+    Prim desde cada vértice no alcanzado (bosque si el grafo no es conexo).
+
+    Returns:
+        tuple: (aristas [(u, v, peso)] con nombres, peso total)
+    """
+    n = vista.num_vertices
+    desplazamientos, vecinos, pesos = vista.desplazamientos, vista.vecinos, vista.pesos_vecinos
+    INF = float('inf')
+    mejor = [INF] * n        # peso de la arista más barata que conecta cada vértice
+    padre = [-1] * n
+    en_arbol = [False] * n
+    asas = [None] * n
+    aristas = []
+    total = 0
+
+    for raiz in range(n):
+        if en_arbol[raiz]:
+            continue
+        cola = MonticuloDireccionable(aridad=aridad)
+        mejor[raiz] = 0
+        asas[raiz] = cola.agregar(raiz, 0)
+        while cola.tamano:
+            u = cola.quitar()
+            en_arbol[u] = True
+            if padre[u] >= 0:
+                aristas.append((vista.nombres[padre[u]], vista.nombres[u], mejor[u]))
+                total += mejor[u]
+            for j in range(desplazamientos[u], desplazamientos[u + 1]):
+                w = vecinos[j]
+                p = pesos[j]
+                if not en_arbol[w] and p < mejor[w]:
+                    mejor[w] = p
+                    padre[w] = u
+                    if asas[w] is None:
+                        asas[w] = cola.agregar(w, p)
+                    else:
+                        cola.cambiar_prioridad(asas[w], p)
+    return aristas, total
+
+
+# Medido con pesos aleatorios: Kruskal gana por debajo de ~5% de densidad
+# (ordenar en C y cortar pronto) y Prim por encima de ~10%.
+UMBRAL_DENSIDAD_PRIM = 0.08
+
+
+def arbol_expansion_minima(grafo, metodo=None):
+    """
+    Calcula el árbol (o bosque) de expansión mínima tratando el grafo como
+    no dirigido.
+
+    Args:
+        grafo: dijkstra_mochila.Grafo o una VistaSimetrica ya construida
+        metodo: "prim", "kruskal" o None para elegir según la densidad
+
+    Returns:
+        tuple: (aristas [(u, v, peso)], peso total)
+    """
+    vista = grafo if isinstance(grafo, VistaSimetrica) else VistaSimetrica(grafo)
+    if metodo is None:
+        metodo = "prim" if vista.densidad() >= UMBRAL_DENSIDAD_PRIM else "kruskal"
+    if metodo == "prim":
+        return prim(vista)
+    if metodo == "kruskal":
+        return kruskal(vista)
+    raise ValueError(f"Método desconocido: {metodo!r}")
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    from dijkstra_mochila import Grafo
+
+    g = Grafo()
+    for u, v, p in [("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 5), ("C", "D", 8), ("D", "E", 3)]:
+        g.agregar_arista(u, v, p)
+
+    for metodo in ("prim", "kruskal"):
+        aristas, total = arbol_expansion_minima(g, metodo)
+        print(f"{metodo:8} peso {total}: {aristas}")
@@ -0,0 +1,322 @@
+"""
+Índice ordenado repartido por rangos entre varios procesos.
+
+Cada trabajador es dueño de un arboles.ArbolAVL con los valores de un
+tramo [corte[i-1], corte[i]). Las operaciones van por lotes: el proceso
+principal reparte el lote por tramo con bisect, manda a la vez un mensaje
+por tramo y recoge las respuestas, así que los árboles trabajan en
+paralelo (cada uno en su núcleo) y el coste de comunicación se paga una
+vez por lote, no por valor.
+
+- Los cortes se eligen con una muestra de los datos (el primer lote, o
+  los valores iniciales).
+- Una consulta de rango solo pregunta a los tramos que la cortan y une
+  sus respuestas en orden de tramo (ya quedan ordenadas).
+- Si un tramo crece más de 'max_desequilibrio' veces la media, se
+  redistribuye todo en tramos iguales con cortes nuevos: O(n), pero solo
+  después de que el sesgo haya crecido en proporción al tamaño.
+"""
+
+import random
+from bisect import bisect_right
+from multiprocessing import get_context
+
+from arboles import ArbolAVL
+
+
+# ===========================================================
+# TRABAJADOR
+# ===========================================================
+def _cargar(arbol, ordenados):
+    """Sustituye el contenido por una lista ordenada y sin repetidos, en O(n)."""
+    arbol._reconstruir_con([arbol._nuevo_nodo(v) for v in ordenados])
+
+
+def _trabajador(conexion):
+    """Bucle de un proceso: atiende órdenes (orden, datos) sobre su tramo."""
+    arbol = ArbolAVL()
+    tamano = 0
+    while True:
+        orden, datos = conexion.recv()
+        try:
+            if orden == "insertar":
+                nuevos = 0
+                for valor in datos:
+                    if not arbol.buscar(valor):
+                        arbol.insertar(valor)
+                        nuevos += 1
+                tamano += nuevos
+                respuesta = (nuevos, tamano)
+            elif orden == "buscar":
+                respuesta = [arbol.buscar(valor) for valor in datos]
+            elif orden == "eliminar":
+                presentes = [valor for valor in datos if arbol.buscar(valor)]
+                if len(presentes) > tamano // 8:
+                    arbol.eliminar_muchos(presentes)  # reconstruye en O(n + k log k)
+                else:
+                    for valor in presentes:
+                        arbol.eliminar(valor)
+                tamano -= len(presentes)
+                respuesta = (len(presentes), tamano)
+            elif orden == "rango":
+                respuesta = list(arbol.rango(*datos))
+            elif orden == "volcar":
+                respuesta = arbol.recorrido_inorden()
+            elif orden == "cargar":
+                _cargar(arbol, datos)
+                tamano = len(datos)
+                respuesta = tamano
+            elif orden == "fin":
+                conexion.send((True, None))
+                return
+            else:
+                raise ValueError(f"Orden desconocida: {orden!r}")
+        except Exception as error:
+            conexion.send((False, error))
+        else:
+            conexion.send((True, respuesta))
+
+
+# ===========================================================
+# ÍNDICE PARTICIONADO
+# ===========================================================
+class ArbolParticionado:
+    """
+    Atributos:
+        procesos: Número de tramos (uno por proceso trabajador)
+        cortes: Lista ordenada de procesos - 1 valores; el tramo i guarda
+            los valores v con cortes[i-1] <= v < cortes[i]
+        max_desequilibrio: Tamaño máximo de un tramo, en veces la media,
+            antes de redistribuir
+        reequilibrados: Veces que se ha redistribuido
+    """
+
+    def __init__(self, valores=None, procesos=2, max_desequilibrio=2.0,
+                 minimo_reequilibrio=1000, tamano_muestra=64, semilla=None):
+        """
+        Args:
+            valores: Iterable inicial (opcional; los repetidos se ignoran)
+            procesos: Número de procesos trabajadores
+            max_desequilibrio: Ver atributos
+            minimo_reequilibrio: Por debajo de este total no se redistribuye
+            tamano_muestra: Valores muestreados por tramo para elegir los cortes
+            semilla: Semilla del muestreo
+        """
+        if procesos < 1:
+            raise ValueError("Hace falta al menos un proceso")
+        if max_desequilibrio <= 1:
+            raise ValueError("max_desequilibrio debe ser mayor que 1")
+        self.procesos = procesos
+        self.max_desequilibrio = max_desequilibrio
+        self.minimo_reequilibrio = minimo_reequilibrio
+        self.tamano_muestra = tamano_muestra
+        self.cortes = None  # se fijan con los primeros datos
+        self.reequilibrados = 0
+        self._azar = random.Random(semilla)
+        self._tamanos = [0] * procesos
+
+        # 'spawn': los trabajadores arrancan limpios, sin copiar este proceso
+        contexto = get_context("spawn")
+        self._conexiones = []
+        self._procesos = []
+        for _ in range(procesos):
+            propia, remota = contexto.Pipe()
+            proceso = contexto.Process(target=_trabajador, args=(remota,), daemon=True)
+            proceso.start()
+            remota.close()
+            self._conexiones.append(propia)
+            self._procesos.append(proceso)
+
+        if valores is not None:
+            self._repartir(sorted(set(valores)))
+
+    # -------- comunicación --------
+    def _pedir(self, ordenes):
+        """
+        Envía {tramo: (orden, datos)} a la vez y devuelve {tramo: respuesta}.
+        Si algún trabajador falla, relanza su excepción tras recoger el resto.
+        """
+        if self._conexiones is None:
+            raise RuntimeError("El árbol particionado está cerrado")
+        for tramo, mensaje in ordenes.items():
+            self._conexiones[tramo].send(mensaje)
+        respuestas, error = {}, None
+        for tramo in ordenes:
+            correcto, respuesta = self._conexiones[tramo].recv()
+            if correcto:
+                respuestas[tramo] = respuesta
+            elif error is None:
+                error = respuesta
+        if error is not None:
+            raise error
+        return respuestas
+
+    def _tramo(self, valor):
+        return bisect_right(self.cortes, valor)
+
+    def _agrupar(self, valores):
+        """Reparte los valores por tramo: {tramo: [valores]} y la posición original de cada uno."""
+        grupos = {}
+        posiciones = {}
+        tramo = self._tramo
+        for i, valor in enumerate(valores):
+            t = tramo(valor)
+            if t not in grupos:
+                grupos[t], posiciones[t] = [], []
+            grupos[t].append(valor)
+            posiciones[t].append(i)
+        return grupos, posiciones
+
+    # -------- cortes y reequilibrado --------
+    def _elegir_cortes(self, muestra):
+        """Cuantiles de una muestra ordenada (sin repetidos) como cortes."""
+        if not muestra:
+            return []
+        k = self.procesos
+        return sorted({muestra[len(muestra) * i // k] for i in range(1, k)})
+
+    def _repartir(self, ordenados):
+        """Carga todos los valores (ordenados, sin repetidos) en tramos iguales."""
+        k = self.procesos
+        n = len(ordenados)
+        # Corte = primer valor de cada tramo (con menos valores que tramos sobran tramos)
+        self.cortes = sorted({ordenados[n * i // k] for i in range(1, k) if n * i // k < n})
+        grupos, _ = self._agrupar(ordenados)
+        respuestas = self._pedir({t: ("cargar", grupos.get(t, [])) for t in range(k)})
+        self._tamanos = [respuestas[t] for t in range(k)]
+
+    def desequilibrado(self):
+        """True si el tramo mayor supera max_desequilibrio veces la media."""
+        total = sum(self._tamanos)
+        if total < self.minimo_reequilibrio or self.procesos == 1:
+            return False
+        return max(self._tamanos) > self.max_desequilibrio * total / self.procesos
+
+    def reequilibrar(self):
+        """Redistribuye todos los valores en tramos del mismo tamaño."""
+        volcados = self._pedir({t: ("volcar", None) for t in range(self.procesos)})
+        ordenados = [v for t in range(self.procesos) for v in volcados[t]]
+        self._repartir(ordenados)
+        self.reequilibrados += 1
+
+    def _tras_modificar(self, respuestas):
+        for t, (_, tamano) in respuestas.items():
+            self._tamanos[t] = tamano
+        if self.desequilibrado():
+            self.reequilibrar()
+
+    # -------- operaciones por lotes --------
+    def insertar(self, valores):
+        """
+        Inserta un lote de valores (los repetidos se ignoran).
+
+        Returns:
+            int: Número de valores nuevos
+        """
+        lote = sorted(set(valores))
+        if not lote:
+            return 0
+        if self.cortes is None:
+            muestra = lote if len(lote) <= self.tamano_muestra * self.procesos else \
+                sorted(self._azar.sample(lote, self.tamano_muestra * self.procesos))
+            self.cortes = self._elegir_cortes(muestra)
+        grupos, _ = self._agrupar(lote)
+        respuestas = self._pedir({t: ("insertar", grupo) for t, grupo in grupos.items()})
+        self._tras_modificar(respuestas)
+        return sum(nuevos for nuevos, _ in respuestas.values())
+
+    def buscar(self, valores):
+        """
+        Returns:
+            list: bool por valor, en el orden dado
+        """
+        valores = list(valores)
+        if self.cortes is None:
+            return [False] * len(valores)
+        grupos, posiciones = self._agrupar(valores)
+        respuestas = self._pedir({t: ("buscar", grupo) for t, grupo in grupos.items()})
+        resultado = [False] * len(valores)
+        for t, encontrados in respuestas.items():
+            for i, encontrado in zip(posiciones[t], encontrados):
+                resultado[i] = encontrado
+        return resultado
+
+    def __contains__(self, valor):
+        return self.buscar([valor])[0]
+
+    def eliminar(self, valores):
+        """
+        Elimina un lote de valores (los que no estén se ignoran).
+
+        Returns:
+            int: Número de valores eliminados
+        """
+        lote = sorted(set(valores))
+        if not lote or self.cortes is None:
+            return 0
+        grupos, _ = self._agrupar(lote)
+        respuestas = self._pedir({t: ("eliminar", grupo) for t, grupo in grupos.items()})
+        self._tras_modificar(respuestas)
+        return sum(eliminados for eliminados, _ in respuestas.values())
+
+    def rango(self, desde=None, hasta=None):
+        """
+        Genera en orden los valores del intervalo [desde, hasta].
+
+        Args:
+            desde: Límite inferior (None = desde el mínimo)
+            hasta: Límite superior (None = hasta el máximo)
+        """
+        if self.cortes is None or (desde is not None and hasta is not None and hasta < desde):
+            return
+        primero = 0 if desde is None else self._tramo(desde)
+        ultimo = self.procesos - 1 if hasta is None else self._tramo(hasta)
+        respuestas = self._pedir({t: ("rango", (desde, hasta)) for t in range(primero, ultimo + 1)})
+        for t in range(primero, ultimo + 1):
+            yield from respuestas[t]
+
+    # -------- consultas --------
+    def __len__(self):
+        return sum(self._tamanos)
+
+    def tamanos(self):
+        """Número de valores de cada tramo."""
+        return list(self._tamanos)
+
+    def recorrido_inorden(self):
+        return list(self.rango())
+
+    # -------- ciclo de vida --------
+    def cerrar(self):
+        """Termina los procesos trabajadores."""
+        if self._conexiones is None:
+            return
+        for conexion in self._conexiones:
+            try:
+                conexion.send(("fin", None))
+                conexion.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+            conexion.close()
+        for proceso in self._procesos:
+            proceso.join()
+        self._conexiones = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    with ArbolParticionado(range(0, 1000, 3), procesos=4) as arbol:
+        print(f"Cortes: {arbol.cortes}   tramos: {arbol.tamanos()}")
+        arbol.insertar(range(1000, 4000))  # todo cae en el último tramo
+        print(f"Tras insertar 1000..3999: tramos {arbol.tamanos()}, "
+              f"reequilibrados {arbol.reequilibrados}")
+        print(f"buscar 3, 4, 3999: {arbol.buscar([3, 4, 3999])}")
+        print(f"eliminados: {arbol.eliminar(range(0, 100))}   total: {len(arbol)}")
+        print(f"Rango [990, 1005]: {list(arbol.rango(990, 1005))}")
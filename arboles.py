@@ -3,6 +3,8 @@ Módulo para implementar un Árbol Binario de Búsqueda AVL
 Tipos de Datos Abstractos (TDA) con Programación Orientada a Objetos (POO)
 """
 
+from instrumentacion import instrumentar_arbol
+
 
 class Nodo:
     """
@@ -13,6 +15,7 @@ class Nodo:
         izquierdo: Referencia al nodo hijo izquierdo
         derecho: Referencia al nodo hijo derecho
         altura: Altura del nodo en el árbol (usado para balance AVL)
+        borrado: Lápida del modo de eliminación perezosa
     """
     
     def __init__(self, valor):
@@ -26,6 +29,7 @@ class Nodo:
         self.izquierdo = None
         self.derecho = None
         self.altura = 1
+        self.borrado = False
 
 
 class ArbolAVL:
@@ -38,11 +42,51 @@ class ArbolAVL:
     
     Atributos:
         raiz: Referencia al nodo raíz del árbol
+        perezoso: Si es True, eliminar solo marca el nodo (lápida) y el árbol
+            se compacta en O(n) cuando las lápidas superan 'umbral_lapidas'
+    
+    Para la misma interfaz con los valores en bloques ordenados contiguos
+    (lista_bloques.ListaBloques) ver crear_arbol.
     """
     
-    def __init__(self):
-        """Inicializa un árbol AVL vacío."""
+    def __init__(self, perezoso=False, umbral_lapidas=0.25, medidor=None):
+        """
+        Inicializa un árbol AVL vacío.
+        
+        Args:
+            perezoso: Activa la eliminación perezosa con lápidas
+            umbral_lapidas: Fracción de lápidas que dispara la compactación
+            medidor: instrumentacion.Medidor opcional (ver instrumentar)
+        """
         self.raiz = None
+        self.perezoso = perezoso
+        self.umbral_lapidas = umbral_lapidas
+        self._nodos = 0     # Solo modo perezoso: nodos físicos (vivos + lápidas)
+        self._lapidas = 0   # Solo modo perezoso: nodos marcados como borrados
+        self.instrumentar(medidor)
+    
+    # ==================== INSTRUMENTACIÓN ====================
+    
+    def instrumentar(self, medidor, prefijo="avl"):
+        """
+        Activa la medición de comparaciones, nodos visitados, profundidad
+        máxima y rotaciones por caso. Con medidor=None se desactiva y el
+        árbol vuelve a usar los métodos de la clase sin ningún coste.
+        
+        Args:
+            medidor: instrumentacion.Medidor o None
+            prefijo: Prefijo de los contadores en el medidor
+        """
+        instrumentar_arbol(self, medidor, prefijo, ("insertar", "buscar", "eliminar"), {
+            "_insertar_recursivo": lambda nodo, valor: 1 if valor < nodo.valor else 2,
+            "_buscar_recursivo": lambda nodo, valor: 1 if valor == nodo.valor else 2,
+            "_eliminar_recursivo": lambda nodo, valor: 1 if valor < nodo.valor else 2,
+        })
+    
+    def _anotar_rotacion(self, caso):
+        """Cuenta una rotación del caso dado si el árbol está instrumentado."""
+        if self.medidor is not None:
+            self.medidor.sumar(f"{self.prefijo_medidor}.rotaciones.{caso}")
     
     # ==================== MÉTODOS BÁSICOS ====================
     
@@ -139,6 +183,15 @@ class ArbolAVL:
         Args:
             valor: Valor a insertar
         """
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            if nodo is not None:
+                # Reinsertar un valor con lápida = quitarle la lápida
+                if nodo.borrado:
+                    nodo.borrado = False
+                    self._lapidas -= 1
+                return
+            self._nodos += 1
         self.raiz = self._insertar_recursivo(self.raiz, valor)
     
     def _insertar_recursivo(self, nodo, valor):
@@ -154,7 +207,7 @@ class ArbolAVL:
         """
         # Caso base: crear nuevo nodo
         if nodo is None:
-            return Nodo(valor)
+            return self._nuevo_nodo(valor)
         
         # Insertar en el subárbol izquierdo si valor < nodo.valor
         if valor < nodo.valor:
@@ -174,19 +227,23 @@ class ArbolAVL:
         
         # CASO 1: Desbalance izquierda-izquierda
         if balance > 1 and valor < nodo.izquierdo.valor:
+            self._anotar_rotacion("izq-izq")
             return self.rotacion_derecha(nodo)
         
         # CASO 2: Desbalance derecha-derecha
         if balance < -1 and valor > nodo.derecho.valor:
+            self._anotar_rotacion("der-der")
             return self.rotacion_izquierda(nodo)
         
         # CASO 3: Desbalance izquierda-derecha
         if balance > 1 and valor > nodo.izquierdo.valor:
+            self._anotar_rotacion("izq-der")
             nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
             return self.rotacion_derecha(nodo)
         
         # CASO 4: Desbalance derecha-izquierda
         if balance < -1 and valor < nodo.derecho.valor:
+            self._anotar_rotacion("der-izq")
             nodo.derecho = self.rotacion_derecha(nodo.derecho)
             return self.rotacion_izquierda(nodo)
         
@@ -204,6 +261,9 @@ class ArbolAVL:
         Returns:
             bool: True si el valor existe, False en caso contrario
         """
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            return nodo is not None and not nodo.borrado
         return self._buscar_recursivo(self.raiz, valor)
     
     def _buscar_recursivo(self, nodo, valor):
@@ -227,6 +287,23 @@ class ArbolAVL:
         else:
             return self._buscar_recursivo(nodo.derecho, valor)
     
+    def _buscar_nodo(self, valor):
+        """
+        Búsqueda iterativa que devuelve el nodo (con o sin lápida).
+        
+        Returns:
+            Nodo: Nodo con el valor o None si no existe
+        """
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                nodo = nodo.izquierdo
+            elif valor > nodo.valor:
+                nodo = nodo.derecho
+            else:
+                return nodo
+        return None
+    
     # ==================== ELIMINACIÓN ====================
     
     def eliminar(self, valor):
@@ -236,6 +313,14 @@ class ArbolAVL:
         Args:
             valor: Valor a eliminar
         """
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            if nodo is not None and not nodo.borrado:
+                nodo.borrado = True
+                self._lapidas += 1
+                if self._lapidas > self.umbral_lapidas * self._nodos:
+                    self.compactar()
+            return
         self.raiz = self._eliminar_recursivo(self.raiz, valor)
     
     def _eliminar_recursivo(self, nodo, valor):
@@ -273,7 +358,7 @@ class ArbolAVL:
             # CASO 3: Nodo con dos hijos
             # Encontrar el nodo mínimo en el subárbol derecho (sucesor)
             minimo = self._encontrar_minimo(nodo.derecho)
-            nodo.valor = minimo.valor
+            self._copiar_valor(nodo, minimo)
             nodo.derecho = self._eliminar_recursivo(nodo.derecho, minimo.valor)
         
         if nodo is None:
@@ -287,24 +372,36 @@ class ArbolAVL:
         
         # CASO 1: Desbalance izquierda-izquierda
         if balance > 1 and self.obtener_balance(nodo.izquierdo) >= 0:
+            self._anotar_rotacion("izq-izq")
             return self.rotacion_derecha(nodo)
         
         # CASO 2: Desbalance izquierda-derecha
         if balance > 1 and self.obtener_balance(nodo.izquierdo) < 0:
+            self._anotar_rotacion("izq-der")
             nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
             return self.rotacion_derecha(nodo)
         
         # CASO 3: Desbalance derecha-derecha
         if balance < -1 and self.obtener_balance(nodo.derecho) <= 0:
+            self._anotar_rotacion("der-der")
             return self.rotacion_izquierda(nodo)
         
         # CASO 4: Desbalance derecha-izquierda
         if balance < -1 and self.obtener_balance(nodo.derecho) > 0:
+            self._anotar_rotacion("der-izq")
             nodo.derecho = self.rotacion_derecha(nodo.derecho)
             return self.rotacion_izquierda(nodo)
         
         return nodo
     
+    def _nuevo_nodo(self, valor):
+        """Crea el nodo de un valor nuevo (punto de extensión para subclases)."""
+        return Nodo(valor)
+    
+    def _copiar_valor(self, destino, origen):
+        """Copia el valor del sucesor al eliminar un nodo con dos hijos."""
+        destino.valor = origen.valor
+    
     def _encontrar_minimo(self, nodo):
         """
         Encuentra el nodo con el valor mínimo en un subárbol.
@@ -320,8 +417,105 @@ class ArbolAVL:
             actual = actual.izquierdo
         return actual
     
+    # ==================== ELIMINACIÓN POR LOTES ====================
+    
+    def eliminar_muchos(self, valores):
+        """
+        Elimina un lote de valores en una sola pasada.
+        
+        Recorre el árbol en inorden mezclándolo con el lote ordenado y
+        reconstruye un AVL perfectamente equilibrado con los supervivientes,
+        sin rotaciones ni búsquedas de sucesor: O(n + k log k). Para unos
+        pocos valores sigue siendo más barato llamar a eliminar.
+        
+        Args:
+            valores: Iterable de valores a eliminar
+        """
+        lote = sorted(valores)
+        if not lote or self.raiz is None:
+            return
+        supervivientes = []
+        i = 0
+        for nodo in self._nodos_inorden():
+            while i < len(lote) and lote[i] < nodo.valor:
+                i += 1
+            if nodo.borrado or (i < len(lote) and not nodo.valor < lote[i]):
+                continue
+            supervivientes.append(nodo)
+        self._reconstruir_con(supervivientes)
+    
+    def compactar(self):
+        """Quita físicamente las lápidas reconstruyendo el árbol en O(n)."""
+        self._reconstruir_con([nodo for nodo in self._nodos_inorden() if not nodo.borrado])
+    
+    def _reconstruir_con(self, nodos):
+        """
+        Sustituye el árbol por uno equilibrado con los nodos dados.
+        
+        Args:
+            nodos: Lista de nodos sin lápida, ya en orden
+        """
+        self.raiz = self._construir_equilibrado(nodos, 0, len(nodos))
+        self._nodos = len(nodos)
+        self._lapidas = 0
+    
+    def _construir_equilibrado(self, nodos, inicio, fin):
+        """
+        Construye recursivamente un subárbol equilibrado reutilizando nodos.
+        
+        Returns:
+            Nodo: Raíz del subárbol construido (None si el rango está vacío)
+        """
+        if inicio >= fin:
+            return None
+        medio = (inicio + fin) // 2
+        nodo = nodos[medio]
+        nodo.izquierdo = self._construir_equilibrado(nodos, inicio, medio)
+        nodo.derecho = self._construir_equilibrado(nodos, medio + 1, fin)
+        self.actualizar_altura(nodo)
+        return nodo
+    
+    def _nodos_inorden(self):
+        """Generador iterativo de los nodos en inorden (incluye lápidas)."""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            nodo = pila.pop()
+            yield nodo
+            nodo = nodo.derecho
+    
+    def _nodos_en_rango(self, desde, hasta):
+        """Generador iterativo de los nodos con desde <= valor <= hasta (None = sin límite)."""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                # Si el nodo ya es menor que 'desde', su rama izquierda sobra
+                nodo = nodo.izquierdo if desde is None or desde < nodo.valor else None
+            nodo = pila.pop()
+            if hasta is not None and nodo.valor > hasta:
+                return
+            if (desde is None or nodo.valor >= desde) and not nodo.borrado:
+                yield nodo
+            nodo = nodo.derecho
+    
     # ==================== RECORRIDOS ====================
     
+    def rango(self, desde=None, hasta=None):
+        """
+        Genera en orden los valores del intervalo [desde, hasta].
+        
+        Args:
+            desde: Límite inferior (None = desde el mínimo)
+            hasta: Límite superior (None = hasta el máximo)
+        """
+        for nodo in self._nodos_en_rango(desde, hasta):
+            yield nodo.valor
+    
     def recorrido_inorden(self):
         """
         Realiza un recorrido inorden (izquierda-raíz-derecha).
@@ -337,7 +531,8 @@ class ArbolAVL:
         """Función auxiliar para recorrido inorden."""
         if nodo is not None:
             self._inorden_recursivo(nodo.izquierdo, resultado)
-            resultado.append(nodo.valor)
+            if not nodo.borrado:
+                resultado.append(nodo.valor)
             self._inorden_recursivo(nodo.derecho, resultado)
     
     def recorrido_preorden(self):
@@ -354,7 +549,8 @@ class ArbolAVL:
     def _preorden_recursivo(self, nodo, resultado):
         """Función auxiliar para recorrido preorden."""
         if nodo is not None:
-            resultado.append(nodo.valor)
+            if not nodo.borrado:
+                resultado.append(nodo.valor)
             self._preorden_recursivo(nodo.izquierdo, resultado)
             self._preorden_recursivo(nodo.derecho, resultado)
     
@@ -374,7 +570,8 @@ class ArbolAVL:
         if nodo is not None:
             self._postorden_recursivo(nodo.izquierdo, resultado)
             self._postorden_recursivo(nodo.derecho, resultado)
-            resultado.append(nodo.valor)
+            if not nodo.borrado:
+                resultado.append(nodo.valor)
     
     # ==================== CONSULTAS ====================
     
@@ -385,6 +582,8 @@ class ArbolAVL:
         Returns:
             bool: True si el árbol está vacío, False en caso contrario
         """
+        if self._lapidas:
+            return self._nodos == self._lapidas
         return self.raiz is None
     
     def obtener_altura_arbol(self):
@@ -401,9 +600,9 @@ class ArbolAVL:
         Cuenta el número total de nodos en el árbol.
         
         Returns:
-            int: Número de nodos
+            int: Número de nodos (sin contar lápidas)
         """
-        return self._contar_recursivo(self.raiz)
+        return self._contar_recursivo(self.raiz) - self._lapidas
     
     def _contar_recursivo(self, nodo):
         """Función auxiliar para contar nodos."""
@@ -426,9 +625,9 @@ class ArbolAVL:
         if nodo is None:
             return 0
         
-        # Si el nodo no tiene hijos, es una hoja
+        # Si el nodo no tiene hijos, es una hoja (las lápidas no cuentan)
         if nodo.izquierdo is None and nodo.derecho is None:
-            return 1
+            return 0 if nodo.borrado else 1
         
         return (self._contar_hojas_recursivo(nodo.izquierdo) +
                 self._contar_hojas_recursivo(nodo.derecho))
@@ -442,6 +641,8 @@ class ArbolAVL:
         """
         if self.raiz is None:
             return None
+        if self._lapidas:
+            return next((n.valor for n in self._nodos_inorden() if not n.borrado), None)
         return self._encontrar_minimo(self.raiz).valor
     
     def obtener_maximo(self):
@@ -453,6 +654,19 @@ class ArbolAVL:
         """
         if self.raiz is None:
             return None
+        if self._lapidas:
+            # Inorden al revés (derecha primero): se para en el primer nodo vivo
+            pila = []
+            nodo = self.raiz
+            while pila or nodo is not None:
+                while nodo is not None:
+                    pila.append(nodo)
+                    nodo = nodo.derecho
+                nodo = pila.pop()
+                if not nodo.borrado:
+                    return nodo.valor
+                nodo = nodo.izquierdo
+            return None
         nodo = self.raiz
         while nodo.derecho is not None:
             nodo = nodo.derecho
@@ -489,6 +703,314 @@ class ArbolAVL:
                 self.mostrar_arbol(nodo.derecho, prefijo, False)
 
 
+def crear_arbol(representacion="nodos", tamano_bloque=1000, **opciones):
+    """
+    Crea un conjunto ordenado con la interfaz de ArbolAVL.
+    
+    Args:
+        representacion: "nodos" (ArbolAVL) o "bloques" (lista_bloques.ListaBloques:
+            bloques ordenados contiguos buscados con bisect, más rápido en
+            conjuntos de mucha lectura)
+        tamano_bloque: Tamaño de bloque de la representación en bloques
+        opciones: Argumentos de ArbolAVL (perezoso, umbral_lapidas, medidor)
+    
+    Returns:
+        ArbolAVL o ListaBloques
+    
+    Raises:
+        ValueError: Si la representación no existe, o si se piden lápidas
+            (perezoso=True) o medidor en bloques. umbral_lapidas solo afecta
+            a las lápidas, así que en bloques se ignora.
+    """
+    if representacion == "nodos":
+        return ArbolAVL(**opciones)
+    if representacion == "bloques":
+        desconocidas = sorted(set(opciones) - {"perezoso", "umbral_lapidas", "medidor"})
+        if desconocidas:
+            raise TypeError(f"crear_arbol() no admite {', '.join(desconocidas)}")
+        pedidas = [k for k, pedida in (("medidor", opciones.get("medidor") is not None),
+                                       ("perezoso", bool(opciones.get("perezoso"))))
+                   if pedida]
+        if pedidas:
+            raise ValueError(f"La representación en bloques no admite {', '.join(pedidas)}")
+        from lista_bloques import ListaBloques
+        return ListaBloques(tamano_bloque=tamano_bloque)
+    raise ValueError(f"Representación desconocida: {representacion!r}")
+
+
+class MapaAVL(ArbolAVL):
+    """
+    Mapa ordenado clave -> valor sobre el árbol AVL.
+    
+    El árbol ordena las claves y cada nodo guarda además su valor en
+    'nodo.dato'. Con indice_hash=True se mantiene un diccionario
+    clave -> nodo para que las consultas puntuales sean O(1); el recorrido
+    ordenado, mínimo/máximo y los rangos siguen saliendo del AVL.
+    
+    Atributos:
+        raiz: Referencia al nodo raíz del árbol
+        indice: Diccionario clave -> nodo (None si no se usa)
+    """
+    
+    def __init__(self, datos=None, indice_hash=True, medidor=None):
+        """
+        Inicializa el mapa.
+        
+        Args:
+            datos: Pares (clave, valor) o diccionario inicial (opcional)
+            indice_hash: Mantener el índice hash para búsquedas O(1)
+            medidor: instrumentacion.Medidor opcional
+        """
+        super().__init__(medidor=medidor)
+        self.indice = {} if indice_hash else None
+        self._tamano = 0
+        self._ultimo_nodo = None
+        if datos is not None:
+            pares = datos.items() if hasattr(datos, "items") else datos
+            for clave, valor in pares:
+                self[clave] = valor
+    
+    # -------- puntos de extensión del AVL --------
+    
+    def _nuevo_nodo(self, valor):
+        nodo = Nodo(valor)
+        nodo.dato = None
+        self._ultimo_nodo = nodo
+        return nodo
+    
+    def _copiar_valor(self, destino, origen):
+        # El nodo 'destino' pasa a representar la clave del sucesor
+        destino.valor = origen.valor
+        destino.dato = origen.dato
+        if self.indice is not None:
+            self.indice[destino.valor] = destino
+    
+    def _nodo(self, clave):
+        """
+        Returns:
+            Nodo: Nodo de la clave o None si no existe
+        """
+        if self.indice is not None:
+            return self.indice.get(clave)
+        return self._buscar_nodo(clave)
+    
+    # -------- interfaz de diccionario --------
+    
+    # __setitem__ y __delitem__ pasan por insertar/eliminar: son los
+    # métodos que envuelve instrumentar, y los dunder no se pueden
+    # envolver en la instancia
+    def __setitem__(self, clave, valor):
+        self.insertar(clave, valor)
+    
+    def __getitem__(self, clave):
+        nodo = self._nodo(clave)
+        if nodo is None:
+            raise KeyError(clave)
+        return nodo.dato
+    
+    def __delitem__(self, clave):
+        if self._nodo(clave) is None:
+            raise KeyError(clave)
+        self.eliminar(clave)
+    
+    def __contains__(self, clave):
+        return self._nodo(clave) is not None
+    
+    def __len__(self):
+        return self._tamano
+    
+    def __iter__(self):
+        for nodo in self._nodos_inorden():
+            yield nodo.valor
+    
+    def get(self, clave, defecto=None):
+        nodo = self._nodo(clave)
+        return defecto if nodo is None else nodo.dato
+    
+    def keys(self):
+        return list(self)
+    
+    def values(self):
+        return [nodo.dato for nodo in self._nodos_inorden()]
+    
+    def items(self):
+        return [(nodo.valor, nodo.dato) for nodo in self._nodos_inorden()]
+    
+    # -------- operaciones del árbol con semántica de mapa --------
+    
+    def insertar(self, clave, valor=None):
+        """Equivale a mapa[clave] = valor."""
+        nodo = self._nodo(clave)
+        if nodo is None:
+            self._ultimo_nodo = None
+            ArbolAVL.insertar(self, clave)
+            nodo = self._ultimo_nodo
+            self._tamano += 1
+            if self.indice is not None:
+                self.indice[clave] = nodo
+        nodo.dato = valor
+    
+    def buscar(self, clave):
+        """
+        Returns:
+            bool: True si la clave existe (O(1) con índice hash)
+        """
+        return clave in self
+    
+    def eliminar(self, clave):
+        """Elimina la clave si existe (sin error si no está)."""
+        if self._nodo(clave) is None:
+            return
+        ArbolAVL.eliminar(self, clave)
+        self._tamano -= 1
+        if self.indice is not None:
+            del self.indice[clave]
+    
+    def eliminar_muchos(self, claves):
+        claves = [c for c in claves if c in self]
+        super().eliminar_muchos(claves)
+        for clave in set(claves):
+            self._tamano -= 1
+            if self.indice is not None:
+                del self.indice[clave]
+    
+    def item_minimo(self):
+        """
+        Returns:
+            tuple: (clave, valor) de la menor clave, o None si está vacío
+        """
+        if self.raiz is None:
+            return None
+        nodo = self._encontrar_minimo(self.raiz)
+        return nodo.valor, nodo.dato
+    
+    def item_maximo(self):
+        """
+        Returns:
+            tuple: (clave, valor) de la mayor clave, o None si está vacío
+        """
+        if self.raiz is None:
+            return None
+        nodo = self.raiz
+        while nodo.derecho is not None:
+            nodo = nodo.derecho
+        return nodo.valor, nodo.dato
+    
+    def rango(self, desde=None, hasta=None):
+        """
+        Genera en orden los pares (clave, valor) con desde <= clave <= hasta.
+        """
+        for nodo in self._nodos_en_rango(desde, hasta):
+            yield nodo.valor, nodo.dato
+
+
+class NodoIntervalo(Nodo):
+    """
+    Nodo del árbol de intervalos.
+
+    Atributos:
+        valor: Intervalo (inicio, fin), que hace de clave del AVL
+        maximo: Mayor 'fin' de todo el subárbol que cuelga del nodo
+    """
+
+    def __init__(self, valor):
+        super().__init__(valor)
+        self.maximo = valor[1]
+
+
+class ArbolIntervalos(ArbolAVL):
+    """
+    Árbol de intervalos cerrados [inicio, fin] sobre el árbol AVL.
+
+    Los nodos se ordenan por (inicio, fin) y cada uno guarda el mayor 'fin'
+    de su subárbol. Ese máximo se recalcula en actualizar_altura, que es
+    lo que llaman las rotaciones (primero el nodo que baja y luego el que
+    sube) y todo el camino de vuelta de insertar y eliminar, así que se
+    mantiene sin coste asintótico extra. Con el máximo se podan las ramas
+    que no pueden solapar: cada resultado cuesta como mucho un descenso,
+    así que las consultas son O(min(n, (k + 1) log n)) para k resultados
+    (no O(log n + k): para eso haría falta un árbol de intervalos
+    centrado o de segmentos).
+
+    En modo perezoso el máximo puede incluir intervalos con lápida: sigue
+    siendo una cota válida y las consultas se los saltan.
+    """
+
+    # -------- puntos de extensión del AVL --------
+
+    def _nuevo_nodo(self, valor):
+        return NodoIntervalo(valor)
+
+    def actualizar_altura(self, nodo):
+        """
+        Actualiza la altura y el máximo del subárbol de un nodo.
+
+        Args:
+            nodo: Nodo cuyos hijos ya están actualizados
+        """
+        super().actualizar_altura(nodo)
+        if nodo is not None:
+            maximo = nodo.valor[1]
+            if nodo.izquierdo is not None and nodo.izquierdo.maximo > maximo:
+                maximo = nodo.izquierdo.maximo
+            if nodo.derecho is not None and nodo.derecho.maximo > maximo:
+                maximo = nodo.derecho.maximo
+            nodo.maximo = maximo
+
+    # -------- operaciones con intervalos --------
+
+    @staticmethod
+    def _intervalo(inicio, fin):
+        if fin < inicio:
+            raise ValueError(f"Intervalo vacío: [{inicio}, {fin}]")
+        return (inicio, fin)
+
+    def insertar(self, inicio, fin):
+        """Inserta el intervalo [inicio, fin] (los repetidos se ignoran)."""
+        super().insertar(self._intervalo(inicio, fin))
+
+    def buscar(self, inicio, fin):
+        """Indica si el intervalo exacto [inicio, fin] está en el árbol."""
+        return super().buscar((inicio, fin))
+
+    def eliminar(self, inicio, fin):
+        """Elimina el intervalo exacto [inicio, fin] si existe."""
+        super().eliminar((inicio, fin))
+
+    def solapados(self, inicio, fin):
+        """
+        Genera en orden los intervalos que solapan con [inicio, fin].
+
+        Recorrido inorden iterativo que no baja a subárboles cuyo máximo
+        es menor que 'inicio' y se detiene en el primer intervalo que
+        empieza después de 'fin'.
+
+        Args:
+            inicio: Extremo inferior de la consulta
+            fin: Extremo superior de la consulta
+        """
+        self._intervalo(inicio, fin)
+        pila = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None and nodo.maximo >= inicio:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            if not pila:
+                return
+            nodo = pila.pop()
+            a, b = nodo.valor
+            if a > fin:
+                return
+            if b >= inicio and not nodo.borrado:
+                yield nodo.valor
+            nodo = nodo.derecho
+
+    def que_contienen(self, punto):
+        """Genera en orden los intervalos que contienen 'punto' (consulta de apuñalamiento)."""
+        return self.solapados(punto, punto)
+
+
 # ==================== EJEMPLO DE USO ====================
 
 if __name__ == "__main__":
@@ -536,3 +1058,18 @@ if __name__ == "__main__":
     print(f"Número total de nodos: {arbol.contar_nodos()}")
     print(f"Número de hojas: {arbol.contar_hojas()}")
     print(f"Recorrido inorden: {arbol.recorrido_inorden()}")
+    
+    print("\n=== MAPA ORDENADO (MapaAVL) ===")
+    mapa = MapaAVL({"madrid": 3, "paris": 2, "berlin": 4})
+    mapa["lisboa"] = 1
+    del mapa["paris"]
+    print(f"mapa['berlin'] = {mapa['berlin']}")
+    print(f"Claves en orden: {list(mapa)}")
+    print(f"Rango [b, m]: {list(mapa.rango('b', 'm'))}")
+    
+    print("\n=== ÁRBOL DE INTERVALOS (ArbolIntervalos) ===")
+    ventanas = ArbolIntervalos()
+    for inicio, fin in [(9, 12), (13, 15), (10, 11), (14, 18), (1, 3)]:
+        ventanas.insertar(inicio, fin)
+    print(f"Solapan con [11, 13]: {list(ventanas.solapados(11, 13))}")
+    print(f"Contienen el 14: {list(ventanas.que_contienen(14))}")
@@ -0,0 +1,338 @@
+"""
+Banco de pruebas diferencial de los motores de caminos mínimos.
+
+Cada motor resuelve las mismas consultas (origen, destino) sobre el mismo
+grafo sintético (generadores_grafos). El banco:
+
+1. Comprueba que todos dan la misma distancia y que cada camino es válido
+   (empieza y acaba donde debe, usa aristas existentes y su peso suma la
+   distancia).
+2. Mide tiempo de preparación y de consultas, memoria pico (tracemalloc)
+   y, con un Medidor, las operaciones de cola de los motores que lo admiten.
+3. Vuelca todo a JSON y lo compara con una ejecución de referencia para
+   detectar regresiones.
+
+Uso:
+    python banco_caminos.py --generador rejilla --n 10000 --json actual.json
+    python banco_caminos.py --n 10000 --referencia anterior.json
+
+Un motor nuevo solo necesita una clase registrada con @motor.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from array import array
+
+from generadores_grafos import GENERADORES, construir
+from instrumentacion import Medidor
+
+INF = float('inf')
+MOTORES = {}
+
+
+def motor(clase):
+    """Registra un motor por su atributo 'nombre'."""
+    MOTORES[clase.nombre] = clase
+    return clase
+
+
+class DiferenciaEntreMotores(AssertionError):
+    """Dos motores discrepan o uno devuelve un camino inválido."""
+
+
+# ===========================================================
+# MOTORES
+# ===========================================================
+class Motor(ABC):
+    """
+    Interfaz: preparar(n, aristas) construye la estructura y
+    consultar(origen, destino, medidor) devuelve (camino, distancia).
+    """
+    nombre = None
+    max_vertices = None      # por encima se omite (p. ej. motores O(V²))
+    admite_medidor = False
+
+    @abstractmethod
+    def preparar(self, n, aristas):
+        ...
+
+    @abstractmethod
+    def consultar(self, origen, destino, medidor=None):
+        ...
+
+    def cerrar(self):
+        pass
+
+
+@motor
+class MotorAVL(Motor):
+    nombre = "dijkstra_con_avl"
+    admite_medidor = True
+
+    def preparar(self, n, aristas):
+        from dijkstra_mochila import Grafo
+        self.grafo = construir(n, aristas, Grafo)
+
+    def consultar(self, origen, destino, medidor=None):
+        from dijkstra_mochila import dijkstra_con_avl, reconstruir_camino
+        dijkstra_con_avl(self.grafo, origen, medidor, destino_nombre=destino)
+        distancia = self.grafo.vertices[destino].distancia
+        if distancia == INF:
+            return [], INF
+        return reconstruir_camino(self.grafo, origen, destino), distancia
+
+
+@motor
+class MotorAVLConectividad(MotorAVL):
+    nombre = "dijkstra_con_avl+conectividad"
+
+    def preparar(self, n, aristas):
+        from conectividad import Conectividad
+        super().preparar(n, aristas)
+        self.conectividad = Conectividad(self.grafo)
+
+    def consultar(self, origen, destino, medidor=None):
+        from dijkstra_mochila import dijkstra_con_avl, reconstruir_camino
+        dijkstra_con_avl(self.grafo, origen, medidor, destino_nombre=destino,
+                         conectividad=self.conectividad)
+        distancia = self.grafo.vertices[destino].distancia
+        if distancia == INF:
+            return [], INF
+        return reconstruir_camino(self.grafo, origen, destino), distancia
+
+
+@motor
+class MotorSinDict(Motor):
+    nombre = "dijkstra_sin_dict"
+    max_vertices = 20_000    # selección lineal: O(V²) por consulta
+    admite_medidor = True
+
+    def preparar(self, n, aristas):
+        from ejercicio3 import Grafo
+        self.grafo = construir(n, aristas, Grafo)
+
+    def consultar(self, origen, destino, medidor=None):
+        from ejercicio3 import dijkstra_sin_dict
+        return dijkstra_sin_dict(self.grafo, origen, destino, medidor)
+
+
+@motor
+class MotorCompartido(Motor):
+    nombre = "grafo_compartido"
+
+    def preparar(self, n, aristas):
+        from dijkstra_mochila import Grafo
+        from grafo_compartido import GrafoCompartido
+        self.grafo = GrafoCompartido.exportar(construir(n, aristas, Grafo))
+
+    def consultar(self, origen, destino, medidor=None):
+        return self.grafo.camino_minimo(origen, destino)
+
+    def cerrar(self):
+        if getattr(self, "grafo", None) is not None:  # preparar pudo fallar antes
+            self.grafo.cerrar()
+
+
+# ===========================================================
+# VALIDACIÓN
+# ===========================================================
+class Aristas:
+    """Aristas del grafo en tres arrays (se recorren una vez por motor)."""
+
+    def __init__(self, iterable):
+        self.origenes, self.destinos, self.pesos = array('q'), array('q'), array('q')
+        for u, w, p in iterable:
+            self.origenes.append(u)
+            self.destinos.append(w)
+            self.pesos.append(p)
+
+    def __iter__(self):
+        return zip(self.origenes, self.destinos, self.pesos)
+
+    def __len__(self):
+        return len(self.pesos)
+
+    def pesos_minimos(self, vertices):
+        """{(u, w): menor peso} solo para las aristas que salen de 'vertices'."""
+        minimos = {}
+        for u, w, p in self:
+            if u in vertices and p < minimos.get((u, w), INF):
+                minimos[(u, w)] = p
+        return minimos
+
+
+def validar(consultas, resultados, aristas):
+    """
+    Args:
+        consultas: Lista de (origen, destino)
+        resultados: {motor: [(camino, distancia), ...]}
+        aristas: Aristas del grafo
+
+    Raises:
+        DiferenciaEntreMotores: Con la primera discrepancia encontrada
+    """
+    nombres = list(resultados)
+    en_caminos = {v for lista in resultados.values() for camino, _ in lista for v in camino}
+    minimos = aristas.pesos_minimos(en_caminos)
+    for i, (origen, destino) in enumerate(consultas):
+        referencia = resultados[nombres[0]][i][1]
+        for nombre in nombres:
+            camino, distancia = resultados[nombre][i]
+            if distancia != referencia:
+                raise DiferenciaEntreMotores(
+                    f"{origen}->{destino}: {nombres[0]} da {referencia} y {nombre} da {distancia}")
+            if distancia == INF:
+                if camino:
+                    raise DiferenciaEntreMotores(f"{nombre}: camino {origen}->{destino} sin distancia")
+                continue
+            if not camino or camino[0] != origen or camino[-1] != destino:
+                raise DiferenciaEntreMotores(f"{nombre}: el camino {origen}->{destino} no une sus extremos")
+            total = 0
+            for u, w in zip(camino, camino[1:]):
+                if (u, w) not in minimos:
+                    raise DiferenciaEntreMotores(f"{nombre}: la arista {u}->{w} no existe")
+                total += minimos[(u, w)]
+            if total != distancia:
+                raise DiferenciaEntreMotores(
+                    f"{nombre}: el camino {origen}->{destino} pesa {total}, no {distancia}")
+
+
+# ===========================================================
+# EJECUCIÓN
+# ===========================================================
+def _pico(funcion):
+    """Ejecuta la función bajo tracemalloc y devuelve (resultado, bytes pico)."""
+    tracemalloc.start()
+    try:
+        resultado = funcion()
+        return resultado, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def ejecutar(generador="rejilla", n=10_000, consultas=20, semilla=0, motores=None,
+             contar_operaciones=True):
+    """
+    Ejecuta los motores sobre un grafo generado y devuelve el informe (dict
+    serializable a JSON). Lanza DiferenciaEntreMotores si discrepan.
+    """
+    num_vertices, iterable = GENERADORES[generador](n, semilla=semilla)
+    aristas = Aristas(iterable)
+    rnd = random.Random(semilla)
+    pares = [(rnd.randrange(num_vertices), rnd.randrange(num_vertices)) for _ in range(consultas)]
+
+    informe = {
+        "generador": generador,
+        "semilla": semilla,
+        "vertices": num_vertices,
+        "aristas": len(aristas),
+        "consultas": len(pares),
+        "motores": {},
+    }
+    resultados = {}
+    for nombre in motores or MOTORES:
+        instancia = MOTORES[nombre]()
+        if instancia.max_vertices is not None and num_vertices > instancia.max_vertices:
+            informe["motores"][nombre] = {"omitido": f"más de {instancia.max_vertices} vértices"}
+            continue
+        try:
+            t0 = time.perf_counter()
+            _, pico_preparacion = _pico(lambda: instancia.preparar(num_vertices, aristas))
+            t_preparacion = time.perf_counter() - t0
+            _, pico_consulta = _pico(lambda: instancia.consultar(*pares[0])) if pares else (None, 0)
+            t0 = time.perf_counter()
+            resultados[nombre] = [instancia.consultar(o, d) for o, d in pares]
+            t_consultas = time.perf_counter() - t0
+            operaciones = None
+            if contar_operaciones and instancia.admite_medidor:
+                # Pasada aparte para que el medidor no cuente en los tiempos
+                medidor = Medidor()
+                for o, d in pares:
+                    instancia.consultar(o, d, medidor)
+                operaciones = medidor.instantanea()
+        finally:
+            instancia.cerrar()
+        informe["motores"][nombre] = {
+            "tiempo_preparacion": t_preparacion,
+            "tiempo_consultas": t_consultas,
+            "memoria_pico_preparacion": pico_preparacion,
+            "memoria_pico_consulta": pico_consulta,
+            "operaciones": operaciones,
+        }
+    validar(pares, resultados, aristas)
+    return informe
+
+
+def regresiones(actual, referencia, tolerancia=0.25):
+    """
+    Compara dos informes (listas o dicts de ejecutar()) y devuelve los
+    avisos de tiempos o memoria que empeoran más de 'tolerancia' (fracción).
+    """
+    def por_clave(informes):
+        informes = informes if isinstance(informes, list) else [informes]
+        return {(i["generador"], i["vertices"]): i for i in informes}
+
+    anteriores = por_clave(referencia)
+    avisos = []
+    for clave, informe in por_clave(actual).items():
+        anterior = anteriores.get(clave)
+        if anterior is None:
+            continue
+        for nombre, medidas in informe["motores"].items():
+            previas = anterior["motores"].get(nombre, {})
+            for metrica in ("tiempo_consultas", "tiempo_preparacion",
+                            "memoria_pico_preparacion", "memoria_pico_consulta"):
+                antes, ahora = previas.get(metrica), medidas.get(metrica)
+                if antes and ahora is not None and ahora > antes * (1 + tolerancia):
+                    avisos.append(f"{clave[0]} V={clave[1]} {nombre}.{metrica}: "
+                                  f"{antes:.4g} -> {ahora:.4g} (+{ahora / antes - 1:.0%})")
+    return avisos
+
+
+# ==================== LÍNEA DE COMANDOS ====================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generador", choices=list(GENERADORES), action="append",
+                        help="generador a usar (repetible; por defecto todos)")
+    parser.add_argument("--n", type=int, default=10_000, help="vértices aproximados")
+    parser.add_argument("--consultas", type=int, default=20)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--motor", choices=list(MOTORES), action="append",
+                        help="motor a ejecutar (repetible; por defecto todos)")
+    parser.add_argument("--sin-operaciones", action="store_true",
+                        help="no hace la pasada con Medidor")
+    parser.add_argument("--json", help="fichero donde guardar el informe")
+    parser.add_argument("--referencia", help="informe anterior con el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args()
+
+    informes = []
+    for generador in args.generador or GENERADORES:
+        informe = ejecutar(generador, args.n, args.consultas, args.semilla, args.motor,
+                           not args.sin_operaciones)
+        informes.append(informe)
+        print(f"{generador}: V={informe['vertices']} E={informe['aristas']}")
+        for nombre, medidas in informe["motores"].items():
+            if "omitido" in medidas:
+                print(f"    {nombre:30} omitido ({medidas['omitido']})")
+            else:
+                print(f"    {nombre:30} preparación {medidas['tiempo_preparacion']:7.3f} s   "
+                      f"consultas {medidas['tiempo_consultas']:7.3f} s   "
+                      f"pico {medidas['memoria_pico_preparacion'] >> 20} MiB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump(informes, archivo, indent=2, sort_keys=True)
+    if args.referencia:
+        with open(args.referencia, encoding="utf-8") as archivo:
+            avisos = regresiones(informes, json.load(archivo), args.tolerancia)
+        for aviso in avisos:
+            print(f"REGRESIÓN {aviso}")
+        sys.exit(1 if avisos else 0)
@@ -0,0 +1,984 @@
+"""
+Benchmarks de las estructuras del repositorio.
+
+Uso:
+    python benchmarks.py                 # lista los benchmarks disponibles
+    python benchmarks.py grafo_internado # ejecuta uno concreto
+    python benchmarks.py grafo_internado --n 1000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+
+# ===========================================================
+# UTILIDADES
+# ===========================================================
+def cronometrar(funcion, *args, **kwargs):
+    """Ejecuta la función y devuelve (resultado, segundos)."""
+    t0 = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    return resultado, time.perf_counter() - t0
+
+
+def memoria_de(constructor):
+    """Devuelve (objeto, bytes reservados) al construirlo bajo tracemalloc."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objeto = constructor()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objeto, despues - antes
+
+
+BENCHMARKS = {}
+
+
+def benchmark(funcion):
+    """Registra un benchmark por su nombre (sin el prefijo 'bench_')."""
+    BENCHMARKS[funcion.__name__[len("bench_"):]] = funcion
+    return funcion
+
+
+# ===========================================================
+# ejercicio3: adyacencia internada vs. objetos NodoArista
+# ===========================================================
+@benchmark
+def bench_grafo_internado(n=1_000_000):
+    """Memoria por arista y velocidad de recorrido con n aristas."""
+    from ejercicio3 import Grafo, NodoArista
+
+    num_vertices = max(1, n // 10)
+    rnd = random.Random(1)
+    aristas = [(rnd.randrange(num_vertices), rnd.randrange(num_vertices), rnd.randrange(1, 100))
+               for _ in range(n)]
+    ids = [f"v{i}" for i in range(num_vertices)]
+
+    # Antes: un objeto NodoArista (con el ID en texto) por arista
+    def construir_antes():
+        conexiones = [[] for _ in range(num_vertices)]
+        for o, d, p in aristas:
+            conexiones[o].append(NodoArista(ids[d], p))
+        return conexiones
+
+    # Después: arrays empaquetados de (índice destino, peso)
+    def construir_despues():
+        g = Grafo()
+        for i in ids:
+            g.agregar_vertice(i)
+        for o, d, p in aristas:
+            g.agregar_arista(ids[o], ids[d], p)
+        return g
+
+    antes, mem_antes = memoria_de(construir_antes)
+    despues, mem_despues = memoria_de(construir_despues)
+
+    def recorrer_antes():
+        total = 0
+        mapeo = despues._mapeo_id
+        for lista in antes:
+            for arista in lista:
+                total += arista.peso + mapeo[arista.destino_id]
+        return total
+
+    def recorrer_despues():
+        total = 0
+        for v in despues.lista_vertices:
+            for d, p in zip(v.destinos, v.pesos):
+                total += p + d
+        return total
+
+    r1, t_antes = cronometrar(recorrer_antes)
+    r2, t_despues = cronometrar(recorrer_despues)
+    assert r1 == r2
+
+    print(f"aristas: {n}, vértices: {num_vertices}")
+    print(f"memoria/arista  antes: {mem_antes / n:7.1f} B   después: {mem_despues / n:7.1f} B")
+    print(f"recorrido       antes: {t_antes:7.3f} s   después: {t_despues:7.3f} s")
+
+
+# ===========================================================
+# ejercicio2: carga del montículo
+# ===========================================================
+@benchmark
+def bench_monticulo_carga(n=1_000_000):
+    """Monticulizar en O(n) frente a n llamadas a agregar."""
+    from ejercicio2 import Monticulo
+
+    rnd = random.Random(2)
+    aleatorios = [rnd.random() for _ in range(n)]
+    descendentes = sorted(aleatorios, reverse=True)  # peor caso para flotar
+
+    for etiqueta, datos in (("aleatorio", aleatorios), ("descendente", descendentes)):
+        def uno_a_uno():
+            m = Monticulo()
+            for x in datos:
+                m.agregar(x)
+            return m
+
+        m1, t_uno = cronometrar(uno_a_uno)
+        m2, t_bloque = cronometrar(Monticulo, True, datos)
+        m3 = Monticulo()
+        _, t_muchos = cronometrar(m3.agregar_muchos, datos)
+        assert m1.quitar() == m2.quitar() == m3.quitar() == min(datos)
+
+        print(f"n: {n} ({etiqueta})")
+        print(f"  agregar uno a uno:  {t_uno:7.3f} s")
+        print(f"  Monticulo(datos=):  {t_bloque:7.3f} s")
+        print(f"  agregar_muchos:     {t_muchos:7.3f} s")
+
+
+@benchmark
+def bench_monticulo_aridad(n=200_000):
+    """Aridad 2/4/8 en mezcla agregar/quitar y en un Dijkstra perezoso."""
+    from ejercicio2 import Monticulo
+    from ejercicio3 import Grafo
+
+    rnd = random.Random(3)
+    operaciones = [rnd.random() for _ in range(n)]
+
+    def mezcla(aridad):
+        m = Monticulo(aridad=aridad, datos=operaciones[: n // 10])
+        for x in operaciones:
+            m.agregar(x)
+            if x < 0.45:
+                m.quitar()
+        return m.tamano
+
+    num_vertices = max(2, n // 8)
+    g = Grafo()
+    for i in range(num_vertices):
+        g.agregar_vertice(i)
+    for _ in range(n):
+        g.agregar_arista(rnd.randrange(num_vertices), rnd.randrange(num_vertices), rnd.randrange(1, 100))
+
+    def dijkstra(aridad):
+        distancia = [float('inf')] * num_vertices
+        distancia[0] = 0
+        cola = Monticulo(aridad=aridad, estable=True)
+        cola.agregar(0, 0)
+        vertices = g.lista_vertices
+        while cola.tamano:
+            prioridad = cola.ver_prioridad()
+            u = cola.quitar()
+            if prioridad > distancia[u]:
+                continue  # entrada obsoleta
+            v = vertices[u]
+            for w, p in zip(v.destinos, v.pesos):
+                nueva = prioridad + p
+                if nueva < distancia[w]:
+                    distancia[w] = nueva
+                    cola.agregar(w, nueva)
+        return distancia
+
+    referencia = None
+    for aridad in (2, 4, 8):
+        _, t_mezcla = cronometrar(mezcla, aridad)
+        distancias, t_dijkstra = cronometrar(dijkstra, aridad)
+        referencia = referencia or distancias
+        assert distancias == referencia
+        print(f"aridad {aridad}: mezcla {t_mezcla:7.3f} s   dijkstra {t_dijkstra:7.3f} s")
+
+
+@benchmark
+def bench_monticulo_direccionable(n=200_000):
+    """Dijkstra con cambiar_prioridad frente a entradas obsoletas."""
+    from ejercicio2 import Monticulo, MonticuloDireccionable
+    from ejercicio3 import Grafo
+
+    rnd = random.Random(4)
+    num_vertices = max(2, n // 8)
+    g = Grafo()
+    for i in range(num_vertices):
+        g.agregar_vertice(i)
+    for _ in range(n):
+        g.agregar_arista(rnd.randrange(num_vertices), rnd.randrange(num_vertices), rnd.randrange(1, 100))
+    vertices = g.lista_vertices
+
+    def perezoso():
+        distancia = [float('inf')] * num_vertices
+        distancia[0] = 0
+        cola = Monticulo(aridad=4, estable=True)
+        cola.agregar(0, 0)
+        extracciones = 0
+        while cola.tamano:
+            prioridad = cola.ver_prioridad()
+            u = cola.quitar()
+            extracciones += 1
+            if prioridad > distancia[u]:
+                continue
+            for w, p in zip(vertices[u].destinos, vertices[u].pesos):
+                if prioridad + p < distancia[w]:
+                    distancia[w] = prioridad + p
+                    cola.agregar(w, prioridad + p)
+        return distancia, extracciones
+
+    def indexado():
+        distancia = [float('inf')] * num_vertices
+        distancia[0] = 0
+        asas = [None] * num_vertices
+        cola = MonticuloDireccionable(aridad=4)
+        asas[0] = cola.agregar(0, 0)
+        extracciones = 0
+        while cola.tamano:
+            u = cola.quitar()
+            extracciones += 1
+            for w, p in zip(vertices[u].destinos, vertices[u].pesos):
+                nueva = distancia[u] + p
+                if nueva < distancia[w]:
+                    distancia[w] = nueva
+                    if asas[w] is not None and asas[w].activa:
+                        cola.cambiar_prioridad(asas[w], nueva)
+                    else:
+                        asas[w] = cola.agregar(w, nueva)
+        return distancia, extracciones
+
+    (d1, e1), t1 = cronometrar(perezoso)
+    (d2, e2), t2 = cronometrar(indexado)
+    assert d1 == d2
+    print(f"perezoso:           {t1:7.3f} s  ({e1} extracciones)")
+    print(f"cambiar_prioridad:  {t2:7.3f} s  ({e2} extracciones)")
+
+
+@benchmark
+def bench_seleccionar_k(n=2_000_000):
+    """Top-k en flujo frente a materializar y ordenar."""
+    from ejercicio2 import Monticulo
+
+    k = 100
+
+    def flujo():
+        rnd = random.Random(5)
+        return (rnd.random() for _ in range(n))
+
+    def pico_memoria(funcion):
+        tracemalloc.start()
+        resultado = funcion()
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return resultado, pico
+
+    (r1, m1), t1 = cronometrar(pico_memoria, lambda: sorted(flujo(), reverse=True)[:k])
+    (r2, m2), t2 = cronometrar(pico_memoria, lambda: Monticulo.seleccionar_k(flujo(), k))
+    assert r1 == r2
+    print(f"n: {n}, k: {k}")
+    print(f"ordenar todo:    {t1:7.3f} s   pico {m1 / 2**20:8.2f} MiB")
+    print(f"seleccionar_k:   {t2:7.3f} s   pico {m2 / 2**20:8.2f} MiB")
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) de una lista ya ordenada."""
+    if not valores:
+        return float('nan')
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+@benchmark
+def bench_colas_concurrentes(n=200_000):
+    """Rendimiento y latencia con muchos productores y consumidores."""
+    import asyncio
+    import threading
+    from colas_concurrentes import ColaPrioridadAsync, ColaPrioridadHilos
+
+    productores, consumidores, lote = 32, 16, 64
+    por_productor = n // productores
+    total = por_productor * productores
+
+    async def escenario_async(por_lotes):
+        cola = ColaPrioridadAsync(capacidad=1024)
+        latencias = []
+        fin = asyncio.Event()
+
+        async def productor(semilla):
+            rnd = random.Random(semilla)
+            if por_lotes:
+                for inicio in range(0, por_productor, lote):
+                    ahora = time.perf_counter()
+                    await cola.agregar_muchos(ahora for _ in range(min(lote, por_productor - inicio)))
+            else:
+                for _ in range(por_productor):
+                    await cola.agregar(time.perf_counter(), rnd.random())
+
+        async def consumidor():
+            while not fin.is_set():
+                datos = await cola.quitar_muchos(lote) if por_lotes else [await cola.quitar()]
+                ahora = time.perf_counter()
+                latencias.extend(ahora - t for t in datos)
+                if len(latencias) >= total:
+                    fin.set()
+
+        tareas = [asyncio.create_task(consumidor()) for _ in range(consumidores)]
+        await asyncio.gather(*(productor(i) for i in range(productores)))
+        await fin.wait()
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        return latencias
+
+    def escenario_hilos():
+        cola = ColaPrioridadHilos(capacidad=1024)
+        latencias = []
+        cerrojo = threading.Lock()
+
+        def productor():
+            for inicio in range(0, por_productor, lote):
+                ahora = time.perf_counter()
+                cola.agregar_muchos(ahora for _ in range(min(lote, por_productor - inicio)))
+
+        def consumidor(cuota):
+            recibidos = 0
+            while recibidos < cuota:
+                datos = cola.quitar_muchos(min(lote, cuota - recibidos))
+                ahora = time.perf_counter()
+                recibidos += len(datos)
+                with cerrojo:
+                    latencias.extend(ahora - t for t in datos)
+
+        cuotas = [total // consumidores + (1 if i < total % consumidores else 0) for i in range(consumidores)]
+        hilos = [threading.Thread(target=productor) for _ in range(productores)]
+        hilos += [threading.Thread(target=consumidor, args=(c,)) for c in cuotas]
+        for h in hilos:
+            h.start()
+        for h in hilos:
+            h.join()
+        return latencias
+
+    escenarios = [
+        ("asyncio uno a uno", lambda: asyncio.run(escenario_async(False))),
+        ("asyncio por lotes", lambda: asyncio.run(escenario_async(True))),
+        ("hilos por lotes", escenario_hilos),
+    ]
+    print(f"{productores} productores, {consumidores} consumidores, {total} elementos")
+    for nombre, escenario in escenarios:
+        latencias, t = cronometrar(escenario)
+        latencias.sort()
+        print(f"{nombre:18} {total / t:10.0f} elem/s   p50 {percentil(latencias, 50) * 1e3:8.2f} ms"
+              f"   p99 {percentil(latencias, 99) * 1e3:8.2f} ms")
+
+
+
+# ===========================================================
+# ordenacion_externa: ordenación de ficheros mayores que la memoria
+# ===========================================================
+@benchmark
+def bench_ordenacion_externa(n=5_000_000):
+    """Ordena un fichero sintético de n registros de 8 bytes (10 GB ~ 1.34e9)."""
+    import os
+    import tempfile
+    from ordenacion_externa import FormatoRegistro, ordenar_archivo
+
+    formato = FormatoRegistro("<d")
+    memoria = max(1, n // 50)
+    with tempfile.TemporaryDirectory(prefix="bench_orden_") as temporal:
+        entrada = os.path.join(temporal, "entrada.bin")
+        salida = os.path.join(temporal, "salida.bin")
+        rnd = random.Random(6)
+        with open(entrada, "wb") as archivo:
+            for _ in range(0, n, 1 << 16):
+                formato.escribir(archivo, [rnd.random() for _ in range(min(1 << 16, n))])
+            archivo.truncate(n * formato.tamano)
+
+        _, t = cronometrar(ordenar_archivo, entrada, salida, "<d",
+                           memoria=memoria, max_vias=16, directorio=temporal)
+
+        anterior = float('-inf')
+        for registro in formato.leer(salida, 1 << 22):
+            assert registro >= anterior
+            anterior = registro
+        megas = n * formato.tamano / 2**20
+        print(f"registros: {n} ({megas:.1f} MiB), memoria: {memoria} registros, fan-in: 16")
+        print(f"tiempo: {t:7.2f} s   {megas / t:7.2f} MiB/s")
+
+
+# ===========================================================
+# ejercicio1: modos de equilibrio del ABB
+# ===========================================================
+def claves_zipf(rnd, universo, cantidad, s=1.1):
+    """'cantidad' claves de 0..universo-1 con popularidad Zipf (1/rango^s)."""
+    pesos = [1 / (i + 1) ** s for i in range(universo)]
+    orden = list(range(universo))
+    rnd.shuffle(orden)  # las claves populares no son las primeras
+    return [orden[i] for i in rnd.choices(range(universo), weights=pesos, k=cantidad)]
+
+
+@benchmark
+def bench_abb_equilibrio(n=50_000):
+    """ArbolABB por modo con claves ordenadas, aleatorias y accesos Zipf."""
+    from ejercicio1 import ArbolABB
+
+    rnd = random.Random(7)
+    ordenadas = list(range(n))
+    aleatorias = ordenadas[:]
+    rnd.shuffle(aleatorias)
+    zipf = claves_zipf(rnd, n, 4 * n)
+
+    def cargar_y_buscar(modo, claves, consultas):
+        arbol = ArbolABB(modo, semilla=1)
+        for c in claves:
+            arbol.insertar(c)
+        encontrados = sum(arbol.buscar(c) for c in consultas)
+        for c in claves[::2]:
+            arbol.eliminar(c)
+        return encontrados
+
+    cargas = [
+        ("ordenadas", ordenadas, ordenadas),
+        ("aleatorias", aleatorias, aleatorias),
+        ("zipf", aleatorias, zipf),
+    ]
+    print(f"n: {n}")
+    print(f"{'modo':8}" + "".join(f"{nombre:>14}" for nombre, _, _ in cargas))
+    for modo in (None, "chivo", "treap", "splay"):
+        fila = f"{str(modo):8}"
+        for _, claves, consultas in cargas:
+            try:
+                _, t = cronometrar(cargar_y_buscar, modo, claves, consultas)
+                fila += f"{t:12.3f} s"
+            except RecursionError:
+                fila += f"{'recursión':>14}"
+        print(fila)
+
+
+# ===========================================================
+# ejercicio1 / arboles: eliminación por lotes y perezosa
+# ===========================================================
+@benchmark
+def bench_eliminacion_lotes(n=200_000):
+    """eliminar uno a uno vs. eliminar_muchos vs. modo perezoso (borra n/2)."""
+    from arboles import ArbolAVL
+    from ejercicio1 import ArbolABB
+
+    rnd = random.Random(8)
+    claves = list(range(n))
+    rnd.shuffle(claves)
+    a_borrar = claves[: n // 2]
+
+    constructores = [
+        ("ArbolAVL", lambda perezoso: ArbolAVL(perezoso=perezoso)),
+        ("ArbolABB chivo", lambda perezoso: ArbolABB("chivo", perezoso=perezoso)),
+    ]
+    for nombre, crear in constructores:
+        def preparar(perezoso=False):
+            arbol = crear(perezoso)
+            for c in claves:
+                arbol.insertar(c)
+            return arbol
+
+        arbol = preparar()
+        _, t_uno = cronometrar(lambda: [arbol.eliminar(c) for c in a_borrar])
+        arbol = preparar()
+        _, t_lote = cronometrar(arbol.eliminar_muchos, a_borrar)
+        arbol = preparar(perezoso=True)
+        _, t_perezoso = cronometrar(lambda: [arbol.eliminar(c) for c in a_borrar])
+        print(f"{nombre:15} uno a uno {t_uno:7.3f} s   eliminar_muchos {t_lote:7.3f} s"
+              f"   perezoso {t_perezoso:7.3f} s")
+
+
+# ===========================================================
+# arbol_b_disco: árbol B+ paginado frente al AVL en memoria
+# ===========================================================
+@benchmark
+def bench_arbol_b_disco(n=200_000):
+    """ArbolBDisco (caché menor que los datos) frente a ArbolAVL."""
+    import os
+    import tempfile
+    from arboles import ArbolAVL
+    from arbol_b_disco import ArbolBDisco
+
+    rnd = random.Random(9)
+    claves = rnd.sample(range(10 * n), n)
+    consultas = [rnd.randrange(10 * n) for _ in range(n)]
+    rangos = [(c, c + 1000) for c in consultas[:1000]]
+
+    def medir(arbol, rango):
+        _, t_ins = cronometrar(lambda: [arbol.insertar(c) for c in claves])
+        _, t_bus = cronometrar(lambda: [arbol.buscar(c) for c in consultas])
+        _, t_ran = cronometrar(lambda: [sum(1 for _ in rango(arbol, a, b)) for a, b in rangos])
+        _, t_eli = cronometrar(lambda: [arbol.eliminar(c) for c in claves[::2]])
+        return t_ins, t_bus, t_ran, t_eli
+
+    def rango_avl(arbol, a, b):
+        # ArbolAVL no tiene rangos: inorden acotado sobre sus nodos
+        nodo = arbol.raiz
+        pila = []
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo if a < nodo.valor else None
+            nodo = pila.pop()
+            if nodo.valor > b:
+                return
+            if nodo.valor >= a:
+                yield nodo.valor
+            nodo = nodo.derecho
+
+    print(f"n: {n}   (insertar / buscar / 1000 rangos / eliminar n/2, en segundos)")
+    print("ArbolAVL:            " + "  ".join(f"{t:7.3f}" for t in medir(ArbolAVL(), rango_avl)))
+    with tempfile.TemporaryDirectory() as temporal:
+        for paginas in (64, 4096):
+            with ArbolBDisco(os.path.join(temporal, f"b{paginas}"), capacidad_cache=paginas) as arbol:
+                tiempos = medir(arbol, lambda arbol, a, b: arbol.rango(a, b))
+                print(f"ArbolBDisco ({paginas:4} pág): " + "  ".join(f"{t:7.3f}" for t in tiempos))
+
+
+# ===========================================================
+# instrumentacion: coste con y sin medidor
+# ===========================================================
+@benchmark
+def bench_instrumentacion(n=100_000):
+    """Coste de ArbolAVL y dijkstra_con_avl con y sin Medidor."""
+    from arboles import ArbolAVL
+    from dijkstra_mochila import Grafo, dijkstra_con_avl
+    from instrumentacion import Medidor
+
+    rnd = random.Random(10)
+    claves = rnd.sample(range(10 * n), n)
+    g = Grafo()
+    for _ in range(n):
+        g.agregar_arista(rnd.randrange(n // 8), rnd.randrange(n // 8), rnd.randrange(1, 100))
+    origen = next(iter(g.vertices))
+
+    def arbol(medidor):
+        a = ArbolAVL(medidor=medidor)
+        for c in claves:
+            a.insertar(c)
+        for c in claves:
+            a.buscar(c)
+
+    medidor = Medidor()
+    for nombre, funcion in (("ArbolAVL insertar+buscar", arbol),
+                            ("dijkstra_con_avl", lambda m: dijkstra_con_avl(g, origen, m))):
+        _, t_sin = cronometrar(funcion, None)
+        _, t_con = cronometrar(funcion, medidor)
+        print(f"{nombre:26} sin medidor {t_sin:7.3f} s   con medidor {t_con:7.3f} s")
+    print(medidor.a_json())
+
+
+# ===========================================================
+# arboles.MapaAVL: búsquedas puntuales con y sin índice hash
+# ===========================================================
+@benchmark
+def bench_mapa_avl(n=200_000):
+    """MapaAVL con/sin índice hash frente a ArbolAVL + dict en paralelo."""
+    from arboles import ArbolAVL, MapaAVL
+
+    rnd = random.Random(11)
+    claves = rnd.sample(range(10 * n), n)
+    consultas = [rnd.choice(claves) for _ in range(n)]
+
+    def paralelo():
+        arbol, registros = ArbolAVL(), {}
+        for c in claves:
+            arbol.insertar(c)
+            registros[c] = c
+        return arbol, registros
+
+    (arbol, registros), t_par = cronometrar(paralelo)
+    _, t_par_bus = cronometrar(lambda: [arbol.buscar(c) and registros[c] for c in consultas])
+    print(f"ArbolAVL + dict:     carga {t_par:7.3f} s   buscar+leer {t_par_bus:7.3f} s")
+    for indice in (False, True):
+        mapa, t_carga = cronometrar(MapaAVL, ((c, c) for c in claves), indice)
+        _, t_bus = cronometrar(lambda: [mapa[c] for c in consultas])
+        print(f"MapaAVL (hash={indice!s:5}): carga {t_carga:7.3f} s   buscar+leer {t_bus:7.3f} s")
+
+# ===========================================================
+# arbol_expansion: Prim frente a Kruskal según la densidad
+# ===========================================================
+@benchmark
+def bench_arbol_expansion(n=1_000_000):
+    """Prim y Kruskal (y la elección automática) en grafos dispersos y densos de n aristas."""
+    from arbol_expansion import VistaSimetrica, arbol_expansion_minima, kruskal, prim
+    from dijkstra_mochila import Grafo
+
+    rnd = random.Random(12)
+    # Disperso: grado medio ~10. Denso: ~50% de todas las aristas posibles.
+    for tipo, vertices in (("disperso", max(2, n // 5)), ("denso", max(2, int((4 * n) ** 0.5)))):
+        g = Grafo()
+        for v in range(vertices):
+            g.agregar_vertice(v)
+        for _ in range(n):
+            g.agregar_arista(rnd.randrange(vertices), rnd.randrange(vertices), rnd.random())
+        vista, t_vista = cronometrar(VistaSimetrica, g)
+        print(f"{tipo:8}  V={vertices}  E={vista.num_aristas}  densidad {vista.densidad():.4f}  "
+              f"vista {t_vista:6.3f} s")
+        totales = set()
+        for nombre, funcion in (("prim", prim), ("kruskal", kruskal),
+                                ("automático", arbol_expansion_minima)):
+            (_, total), t = cronometrar(funcion, vista)
+            totales.add(round(total, 6))
+            print(f"    {nombre:11} {t:7.3f} s")
+        assert len(totales) == 1, "Prim y Kruskal no coinciden"
+
+
+# ===========================================================
+# conectividad: etiquetas precalculadas y poda de Dijkstra
+# ===========================================================
+@benchmark
+def bench_conectividad(n=200_000):
+    """Construcción de Conectividad, consultas de alcance y Dijkstra con/sin poda."""
+    from conectividad import Conectividad
+    from dijkstra_mochila import Grafo, dijkstra_con_avl
+
+    rnd = random.Random(13)
+    # 64 regiones sin aristas entre sí; dentro de cada una, aristas casi
+    # siempre "hacia delante" (DAG profundo) y algunas hacia atrás cercanas
+    # que forman ciclos cortos
+    region = max(1, n // 64)
+    g = Grafo()
+    for v in range(n):
+        g.agregar_vertice(v)
+    for u in range(n):
+        fin = min(n, (u // region + 1) * region) - 1
+        inicio = (u // region) * region
+        for _ in range(2):
+            g.agregar_arista(u, min(fin, u + rnd.randint(1, 50)), rnd.randint(1, 100))
+        if rnd.random() < 0.2:
+            g.agregar_arista(u, max(inicio, u - rnd.randint(1, 5)), rnd.randint(1, 100))
+
+    con, t_con = cronometrar(Conectividad, g)
+    print(f"V={n}  componentes {con.num_componentes}  construcción {t_con:.3f} s")
+
+    pares = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(100_000)]
+    descartes = sum(1 for a, b in pares
+                    if con.componente_de(a) != con.componente_de(b)
+                    and con.descartado(con.componente_de(a), con.componente_de(b)))
+    _, t_q = cronometrar(lambda: [con.puede_alcanzar(a, b) for a, b in pares])
+    print(f"{len(pares)} consultas: {t_q:.3f} s   resueltas en O(1) por etiquetas: {descartes}")
+
+    muestras = [(rnd.randrange(n // 2), rnd.randrange(n)) for _ in range(20)]
+    _, t_sin = cronometrar(lambda: [dijkstra_con_avl(g, a, destino_nombre=b) for a, b in muestras])
+    _, t_con = cronometrar(lambda: [dijkstra_con_avl(g, a, destino_nombre=b, conectividad=con)
+                                    for a, b in muestras])
+    print(f"{len(muestras)} Dijkstra origen->destino: sin poda {t_sin:.3f} s   con poda {t_con:.3f} s")
+
+
+# ===========================================================
+# grafo_compartido: N procesos sobre un único grafo compartido
+# ===========================================================
+def _rss_proceso():
+    """(privada, compartida) en bytes según /proc/self/status (solo Linux)."""
+    campos = {}
+    with open("/proc/self/status") as archivo:
+        for linea in archivo:
+            if linea.startswith(("RssAnon:", "RssShmem:")):
+                nombre, valor = linea.split(":")
+                campos[nombre] = int(valor.split()[0]) * 1024
+    return campos.get("RssAnon", 0), campos.get("RssShmem", 0)
+
+
+def _trabajador_compartido(identificador, consultas, resultados):
+    from grafo_compartido import GrafoCompartido
+
+    t0 = time.perf_counter()
+    grafo = GrafoCompartido.adjuntar(**identificador)
+    t_arranque = time.perf_counter() - t0
+    for origen, destino in consultas:
+        grafo.camino_minimo(origen, destino)
+    resultados.put((t_arranque, *_rss_proceso()))
+    grafo.cerrar()
+
+
+def _trabajador_copia(aristas, consultas, resultados):
+    from dijkstra_mochila import Grafo, dijkstra_con_avl
+
+    t0 = time.perf_counter()
+    grafo = Grafo()
+    for origen, destino, peso in aristas:
+        grafo.agregar_arista(origen, destino, peso)
+    t_arranque = time.perf_counter() - t0
+    for origen, destino in consultas:
+        dijkstra_con_avl(grafo, origen, destino_nombre=destino)
+    resultados.put((t_arranque, *_rss_proceso()))
+
+
+@benchmark
+def bench_grafo_compartido(n=500_000):
+    """Arranque y memoria por proceso: grafo en memoria compartida frente a una copia por proceso."""
+    import multiprocessing
+    from dijkstra_mochila import Grafo
+    from grafo_compartido import GrafoCompartido
+
+    rnd = random.Random(14)
+    vertices = max(2, n // 5)
+    aristas = [(rnd.randrange(vertices), rnd.randrange(vertices), rnd.randint(1, 100))
+               for _ in range(n)]
+    g = Grafo()
+    for origen, destino, peso in aristas:
+        g.agregar_arista(origen, destino, peso)
+    consultas = [(rnd.randrange(vertices), rnd.randrange(vertices)) for _ in range(3)]
+
+    # 'spawn': cada trabajador parte de un intérprete limpio (con 'fork'
+    # heredaría, y acabaría copiando, la memoria de este proceso)
+    contexto = multiprocessing.get_context("spawn")
+    compartido, t_exportar = cronometrar(GrafoCompartido.exportar, g)
+    print(f"V={vertices}  E={n}  exportar {t_exportar:.3f} s  bloque {compartido.num_aristas * 16 >> 20} MiB")
+    print("procesos  modo        arranque medio  privada total  compartida (mismas páginas)")
+    for procesos in (1, 2, 4):
+        for modo, destino, datos in (("compartido", _trabajador_compartido, compartido.identificador()),
+                                     ("copia", _trabajador_copia, aristas)):
+            resultados = contexto.Queue()
+            trabajadores = [contexto.Process(target=destino, args=(datos, consultas, resultados))
+                            for _ in range(procesos)]
+            for p in trabajadores:
+                p.start()
+            medidas = [resultados.get() for _ in trabajadores]
+            for p in trabajadores:
+                p.join()
+            arranque = sum(m[0] for m in medidas) / procesos
+            privada = sum(m[1] for m in medidas) >> 20
+            compartida = sum(m[2] for m in medidas) >> 20
+            print(f"{procesos:8}  {modo:10}  {arranque * 1000:11.1f} ms  {privada:9} MiB  {compartida:12} MiB")
+    compartido.cerrar()
+
+
+# ===========================================================
+# caminos_todos_pares: Floyd-Warshall y Johnson frente a V x dijkstra_con_avl
+# ===========================================================
+@benchmark
+def bench_todos_los_pares(n=200):
+    """Distancias entre todos los pares en un grafo denso y en uno disperso de n vértices."""
+    from caminos_todos_pares import (MatrizAdyacencia, distancias_todos_pares, elegir_metodo,
+                                     floyd_warshall, johnson, np)
+    from dijkstra_mochila import Grafo, dijkstra_con_avl
+
+    rnd = random.Random(15)
+    for tipo, densidad in (("denso", 0.9), ("disperso", 4 / n)):
+        g = Grafo()
+        for v in range(n):
+            g.agregar_vertice(v)
+        m = int(densidad * n * (n - 1))
+        for _ in range(m):
+            g.agregar_arista(rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 100))
+        print(f"{tipo:8}  V={n}  E={m}  automático: {elegir_metodo(n, m)}")
+
+        _, t = cronometrar(lambda: [dijkstra_con_avl(g, v) for v in range(n)])
+        print(f"    V x dijkstra_con_avl     {t:7.3f} s")
+        variantes = [("Floyd-Warshall (Python)", lambda: floyd_warshall(MatrizAdyacencia.desde_grafo(g, False)))]
+        if np is not None:
+            variantes.append(("Floyd-Warshall (NumPy)", lambda: floyd_warshall(MatrizAdyacencia.desde_grafo(g, True))))
+        variantes += [("Johnson", lambda: johnson(g)), ("automático", lambda: distancias_todos_pares(g))]
+        for nombre, funcion in variantes:
+            _, t = cronometrar(funcion)
+            print(f"    {nombre:24} {t:7.3f} s")
+
+
+# ===========================================================
+# banco_caminos: todos los motores de Dijkstra sobre grafos sintéticos
+# ===========================================================
+@benchmark
+def bench_caminos(n=10_000):
+    """Banco diferencial de caminos mínimos sobre los cuatro generadores (ver banco_caminos.py)."""
+    from banco_caminos import ejecutar
+    from generadores_grafos import GENERADORES
+
+    for generador in GENERADORES:
+        informe = ejecutar(generador, n, consultas=10)
+        print(f"{generador}: V={informe['vertices']} E={informe['aristas']}  (distancias y caminos coinciden)")
+        for nombre, medidas in informe["motores"].items():
+            if "omitido" in medidas:
+                print(f"    {nombre:30} omitido")
+                continue
+            operaciones = (medidas["operaciones"] or {}).get("contadores", {})
+            cola = (operaciones.get("cola.insertar.operaciones", 0)
+                    + operaciones.get("cola.extraer_min.operaciones", 0))
+            print(f"    {nombre:30} consultas {medidas['tiempo_consultas']:7.3f} s   "
+                  f"pico {medidas['memoria_pico_preparacion'] >> 20:4} MiB   ops. de cola {cola or '-'}")
+
+
+# ===========================================================
+# arboles.ArbolIntervalos: solapamientos frente al recorrido lineal
+# ===========================================================
+@benchmark
+def bench_intervalos(n=200_000):
+    """ArbolIntervalos.solapados/que_contienen frente a filtrar recorrido_inorden."""
+    from arboles import ArbolIntervalos
+
+    rnd = random.Random(16)
+    arbol = ArbolIntervalos()
+    for _ in range(n):
+        inicio = rnd.randrange(100 * n)
+        arbol.insertar(inicio, inicio + rnd.randint(0, 1000))
+    ventanas = [(a, a + rnd.randint(0, 500)) for a in (rnd.randrange(100 * n) for _ in range(1000))]
+
+    def lineal():
+        intervalos = arbol.recorrido_inorden()
+        return sum(1 for a, b in ventanas for s, e in intervalos if s <= b and e >= a)
+
+    total, t_lineal = cronometrar(lineal)
+    total_arbol, t_arbol = cronometrar(lambda: sum(1 for a, b in ventanas for _ in arbol.solapados(a, b)))
+    assert total == total_arbol
+    _, t_punto = cronometrar(lambda: sum(1 for a, _ in ventanas for _ in arbol.que_contienen(a)))
+    print(f"n: {n}   {len(ventanas)} consultas   {total} solapamientos")
+    print(f"recorrido_inorden + filtro: {t_lineal:8.3f} s")
+    print(f"solapados:                  {t_arbol:8.3f} s")
+    print(f"que_contienen:              {t_punto:8.3f} s")
+
+
+# ===========================================================
+# lista_bloques: representación en bloques frente a nodos AVL
+# ===========================================================
+@benchmark
+def bench_lista_bloques(n=1_000_000):
+    """crear_arbol("bloques") frente al AVL de nodos: carga, búsquedas, rangos y borrados."""
+    from arboles import crear_arbol
+
+    rnd = random.Random(17)
+    claves = rnd.sample(range(10 * n), n)
+    consultas = [rnd.randrange(10 * n) for _ in range(n)]
+    rangos = [(c, c + 1000) for c in consultas[:1000]]
+
+    print(f"n: {n}   (segundos; memoria de la estructura en MiB)")
+    print(f"{'':20} {'insertar':>9} {'buscar':>9} {'1000 rangos':>12} {'eliminar n/2':>13} {'memoria':>8}")
+    for representacion in ("nodos", "bloques"):
+        def cargar():
+            arbol = crear_arbol(representacion)
+            for c in claves:
+                arbol.insertar(c)
+            return arbol
+
+        arbol, t_ins = cronometrar(cargar)
+        _, memoria = memoria_de(cargar)
+        _, t_bus = cronometrar(lambda: [arbol.buscar(c) for c in consultas])
+        _, t_ran = cronometrar(lambda: [sum(1 for _ in arbol.rango(a, b)) for a, b in rangos])
+        _, t_eli = cronometrar(lambda: [arbol.eliminar(c) for c in claves[::2]])
+        print(f"{representacion:20} {t_ins:9.3f} {t_bus:9.3f} {t_ran:12.3f} {t_eli:13.3f} {memoria >> 20:8}")
+
+
+# ===========================================================
+# servidor_caminos: fusión y microlotes frente a una búsqueda bloqueante por petición
+# ===========================================================
+@benchmark
+def bench_servidor_caminos(n=2_500):
+    """Latencia y QPS del servidor asyncio con clientes concurrentes sobre una rejilla de n vértices."""
+    import asyncio
+    from dijkstra_mochila import Grafo, dijkstra_con_avl, reconstruir_camino
+    from generadores_grafos import construir, rejilla
+    from servidor_caminos import ServidorCaminos, generar_carga
+
+    vertices, aristas = rejilla(n, semilla=16)
+    g = construir(vertices, aristas, Grafo)
+    rnd = random.Random(16)
+    # Tráfico realista: pocos orígenes calientes y pares que se repiten
+    origenes = [rnd.randrange(vertices) for _ in range(50)]
+    pares = [(rnd.choice(origenes), rnd.randrange(vertices)) for _ in range(300)]
+    pares += [rnd.choice(pares) for _ in range(100)]
+    rnd.shuffle(pares)
+
+    async def bloqueante(origen, destino):
+        # Lo que hacía el servicio HTTP: una búsqueda en el propio bucle por petición
+        dijkstra_con_avl(g, origen, destino_nombre=destino)
+        return reconstruir_camino(g, origen, destino), g.vertices[destino].distancia
+
+    async def con_servidor(procesos):
+        async with ServidorCaminos(g, procesos=procesos) as servidor:
+            informe = await generar_carga(servidor.camino, pares)
+            return informe, servidor.estadisticas
+
+    print(f"V={vertices}  peticiones={len(pares)}  clientes=64")
+    print("modo                        QPS     p50 ms    p99 ms  bucle ms  búsquedas")
+    escenarios = [("bloqueante en el bucle", lambda: generar_carga(bloqueante, pares)),
+                  ("servidor, 1 hilo", lambda: con_servidor(0))]
+    escenarios += [(f"servidor, {p} procesos", lambda p=p: con_servidor(p)) for p in (1, 2, 4)]
+    for nombre, escenario in escenarios:
+        resultado = asyncio.run(escenario())
+        informe, estadisticas = resultado if isinstance(resultado, tuple) else (resultado, None)
+        busquedas = estadisticas["busquedas"] if estadisticas else len(pares)
+        print(f"{nombre:24} {informe['qps']:7.1f}  {informe['p50'] * 1000:8.1f}  "
+              f"{informe['p99'] * 1000:8.1f}  {informe['retraso_bucle'] * 1000:8.1f}  {busquedas:9}")
+
+
+# ===========================================================
+# grafos_arboles: tiempo de importación del paquete y de cada módulo
+# ===========================================================
+PRESUPUESTO_IMPORTACION_MS = 5.0  # para 'import grafos_arboles' (lo vigila test_importacion.py)
+
+
+def tiempo_importacion(modulo, repeticiones):
+    """Mejor tiempo acumulado (ms) de 'import modulo' en intérpretes nuevos, según -X importtime."""
+    import os
+    import subprocess
+    import sys
+
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        for linea in salida.stderr.splitlines():
+            campos = linea.split("|")
+            if len(campos) == 3 and campos[2].strip() == modulo:
+                mejor = min(mejor, int(campos[1]) / 1000)
+    return mejor
+
+
+@benchmark
+def bench_importacion(n=5):
+    """Coste de importar el paquete y cada módulo, mejor de n intérpretes."""
+    import grafos_arboles
+
+    print(f"import grafos_arboles  {tiempo_importacion('grafos_arboles', n):7.2f} ms  "
+          f"(presupuesto {PRESUPUESTO_IMPORTACION_MS} ms)")
+    for modulo in grafos_arboles.MODULOS:
+        print(f"    {modulo:22} {tiempo_importacion(modulo, n):7.2f} ms")
+
+
+# ===========================================================
+# arbol_particionado: escalado con el número de procesos
+# ===========================================================
+@benchmark
+def bench_arbol_particionado(n=200_000):
+    """Valores por segundo al insertar/buscar/eliminar n valores en lotes, según el número de procesos."""
+    import os
+    from arbol_particionado import ArbolParticionado
+    from arboles import ArbolAVL
+
+    rnd = random.Random(17)
+    valores = rnd.sample(range(n * 10), n)
+    consultas = [rnd.randrange(n * 10) for _ in range(n)]
+    borrar = valores[::2]
+    lote = 10_000
+
+    def por_lotes(funcion, datos):
+        for i in range(0, len(datos), lote):
+            funcion(datos[i:i + lote])
+
+    print(f"n={n}  lotes de {lote}  núcleos: {os.cpu_count()}")
+    print("procesos        insertar/s     buscar/s   eliminar/s   rango completo")
+    arbol = ArbolAVL()
+    _, t_ins = cronometrar(lambda: [arbol.insertar(v) for v in valores])
+    _, t_bus = cronometrar(lambda: [arbol.buscar(v) for v in consultas])
+    _, t_eli = cronometrar(arbol.eliminar_muchos, borrar)
+    _, t_ran = cronometrar(lambda: list(arbol.rango()))
+    print(f"{'ArbolAVL':12} {n / t_ins:13,.0f} {n / t_bus:12,.0f} {len(borrar) / t_eli:12,.0f} {t_ran:12.3f} s")
+    for procesos in sorted({1, 2, 4, os.cpu_count() or 1}):
+        with ArbolParticionado(procesos=procesos, semilla=17) as particionado:
+            _, t_ins = cronometrar(por_lotes, particionado.insertar, valores)
+            _, t_bus = cronometrar(por_lotes, particionado.buscar, consultas)
+            _, t_eli = cronometrar(por_lotes, particionado.eliminar, borrar)
+            _, t_ran = cronometrar(lambda: list(particionado.rango()))
+            print(f"{procesos:<12} {n / t_ins:13,.0f} {n / t_bus:12,.0f} {len(borrar) / t_eli:12,.0f} "
+                  f"{t_ran:12.3f} s   tramos {min(particionado.tamanos())}..{max(particionado.tamanos())}")
+
+
+# ===========================================================
+# MAIN
+# ===========================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("nombre", nargs="?", help="benchmark a ejecutar")
+    parser.add_argument("--n", type=int, default=None, help="tamaño del problema")
+    args = parser.parse_args()
+
+    if args.nombre is None:
+        print("Benchmarks disponibles:")
+        for nombre, funcion in BENCHMARKS.items():
+            print(f"  {nombre:24} {funcion.__doc__}")
+    else:
+        funcion = BENCHMARKS[args.nombre]
+        if args.n is None:
+            funcion()
+        else:
+            funcion(args.n)
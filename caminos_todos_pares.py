@@ -0,0 +1,289 @@
+"""
+Distancias entre todos los pares de vértices.
+
+- MatrizAdyacencia: backend denso (V x V pesos) para grafos pequeños y casi
+  completos, sin un objeto Arista por arista. Con NumPy es un ndarray; sin
+  ella, una lista de filas array('d').
+- floyd_warshall: por bloques de filas con NumPy (cada franja de filas se
+  queda en caché mientras recorre los 'k' de un bloque); en Python puro,
+  fila a fila con comprensiones de listas.
+- johnson: para grafos dispersos. Reponderación con Bellman-Ford (solo si
+  hay pesos negativos) y un Dijkstra por vértice.
+- distancias_todos_pares: elige según la densidad.
+"""
+
+import math
+from array import array
+
+from ejercicio2 import Monticulo
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin ella se usa la versión en Python puro
+    np = None
+
+INF = float('inf')
+
+
+# ===========================================================
+# BACKEND DENSO
+# ===========================================================
+class MatrizAdyacencia:
+    """
+    Atributos:
+        nombres, indice: Traducción entre nombre de vértice e índice
+        pesos: pesos[i][j] = peso de la arista i -> j (inf si no hay, 0 en la diagonal)
+        usa_numpy: True si 'pesos' es un ndarray
+    """
+
+    def __init__(self, nombres, usar_numpy=None):
+        self.nombres = list(nombres)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+        n = len(self.nombres)
+        self.usa_numpy = (np is not None) if usar_numpy is None else usar_numpy
+        if self.usa_numpy:
+            if np is None:
+                raise ImportError("usar_numpy=True requiere NumPy")
+            self.pesos = np.full((n, n), INF)
+            np.fill_diagonal(self.pesos, 0.0)
+        else:
+            self.pesos = [array('d', [INF]) * n for _ in range(n)]
+            for i in range(n):
+                self.pesos[i][i] = 0.0
+
+    @classmethod
+    def desde_grafo(cls, grafo, usar_numpy=None):
+        """Construye la matriz de un dijkstra_mochila.Grafo (aristas paralelas: la menor)."""
+        matriz = cls(grafo.vertices, usar_numpy)
+        indice = matriz.indice
+        origenes, destinos, pesos = [], [], []
+        for vertice in grafo.vertices.values():
+            u = indice[vertice.nombre]
+            for arista in vertice.aristas:
+                origenes.append(u)
+                destinos.append(indice[arista.destino.nombre])
+                pesos.append(arista.peso)
+        matriz._agregar_indices(origenes, destinos, pesos)
+        return matriz
+
+    def _agregar_indices(self, origenes, destinos, pesos):
+        if self.usa_numpy:
+            np.minimum.at(self.pesos, (np.asarray(origenes, dtype=np.intp),
+                                       np.asarray(destinos, dtype=np.intp)),
+                          np.asarray(pesos, dtype=float))
+        else:
+            filas = self.pesos
+            for u, v, p in zip(origenes, destinos, pesos):
+                if p < filas[u][v]:
+                    filas[u][v] = p
+
+    def agregar_arista(self, origen_nombre, destino_nombre, peso):
+        """Añade (o abarata) la arista origen -> destino; los vértices ya deben existir."""
+        self._agregar_indices([self.indice[origen_nombre]], [self.indice[destino_nombre]], [peso])
+
+    def peso(self, origen_nombre, destino_nombre):
+        return float(self.pesos[self.indice[origen_nombre]][self.indice[destino_nombre]])
+
+    @property
+    def num_vertices(self):
+        return len(self.nombres)
+
+
+class DistanciasTodosPares:
+    """Resultado: filas[i][j] es la distancia mínima del vértice i al j."""
+
+    def __init__(self, nombres, filas):
+        self.nombres = nombres
+        self.filas = filas
+        self.indice = {nombre: i for i, nombre in enumerate(nombres)}
+
+    def distancia(self, origen_nombre, destino_nombre):
+        return float(self.filas[self.indice[origen_nombre]][self.indice[destino_nombre]])
+
+
+# ===========================================================
+# FLOYD-WARSHALL
+# ===========================================================
+def _floyd_warshall_numpy(d, bloque):
+    """
+    Para cada bloque de 'k': primero la franja de filas del propio bloque
+    (solo depende de sí misma) y después cada franja de 'bloque' filas
+    aplica todos los 'k' del bloque seguidos, con un temporal reutilizado.
+    """
+    n = d.shape[0]
+    temporal = np.empty((bloque, n))
+    for kb in range(0, n, bloque):
+        ke = min(kb + bloque, n)
+        franjas = [(kb, ke)] + [(i, min(i + bloque, n)) for i in range(0, n, bloque) if i != kb]
+        for ib, ie in franjas:
+            franja = d[ib:ie]
+            t = temporal[:ie - ib]
+            for k in range(kb, ke):
+                np.add(franja[:, k, None], d[k], out=t)
+                np.minimum(franja, t, out=franja)
+
+
+def _floyd_warshall_python(filas):
+    # Con listas y una comprensión el mínimo elemento a elemento sale unas
+    # 3 veces más rápido que con map(min, ...) sobre arrays
+    n = len(filas)
+    for k in range(n):
+        fila_k = filas[k]
+        for i in range(n):
+            fila_i = filas[i]
+            dik = fila_i[k]
+            if dik == INF:
+                continue
+            filas[i] = [a if a < b else b for a, b in zip(fila_i, map(dik.__add__, fila_k))]
+
+
+def floyd_warshall(matriz, bloque=32):
+    """
+    Args:
+        matriz: MatrizAdyacencia (no se modifica)
+        bloque: Filas por franja en la versión NumPy
+
+    Returns:
+        DistanciasTodosPares
+
+    Raises:
+        ValueError: Si hay un ciclo de peso negativo
+    """
+    if matriz.usa_numpy:
+        d = matriz.pesos.copy()
+        _floyd_warshall_numpy(d, max(1, bloque))
+        negativo = bool((np.diagonal(d) < 0).any())
+    else:
+        filas = [list(fila) for fila in matriz.pesos]
+        _floyd_warshall_python(filas)
+        d = [array('d', fila) for fila in filas]
+        negativo = any(d[i][i] < 0 for i in range(len(d)))
+    if negativo:
+        raise ValueError("El grafo tiene un ciclo de peso negativo")
+    return DistanciasTodosPares(matriz.nombres, d)
+
+
+# ===========================================================
+# JOHNSON
+# ===========================================================
+def _aristas_por_indice(grafo):
+    nombres = list(grafo.vertices)
+    indice = {nombre: i for i, nombre in enumerate(nombres)}
+    aristas = [[(indice[a.destino.nombre], a.peso) for a in v.aristas]
+               for v in grafo.vertices.values()]
+    return nombres, aristas
+
+
+def _potenciales(aristas):
+    """Bellman-Ford desde un origen virtual unido a todos con peso 0."""
+    n = len(aristas)
+    h = [0] * n
+    for _ in range(n):
+        cambio = False
+        for u, salientes in enumerate(aristas):
+            hu = h[u]
+            for v, p in salientes:
+                if hu + p < h[v]:
+                    h[v] = hu + p
+                    cambio = True
+        if not cambio:
+            return h
+    raise ValueError("El grafo tiene un ciclo de peso negativo")
+
+
+def johnson(grafo):
+    """
+    Args:
+        grafo: dijkstra_mochila.Grafo (admite pesos negativos sin ciclos negativos)
+
+    Returns:
+        DistanciasTodosPares
+    """
+    nombres, aristas = _aristas_por_indice(grafo)
+    n = len(nombres)
+    if any(p < 0 for salientes in aristas for _, p in salientes):
+        h = _potenciales(aristas)
+        # Reponderación: p' = p + h[u] - h[v] >= 0 conserva los caminos mínimos
+        aristas = [[(v, p + h[u] - h[v]) for v, p in salientes]
+                   for u, salientes in enumerate(aristas)]
+    else:
+        h = None
+
+    filas = []
+    for origen in range(n):
+        distancia = [INF] * n
+        distancia[origen] = 0
+        cola = Monticulo(es_min=True, aridad=4)
+        cola.agregar((0, origen))
+        while cola.tamano:
+            d, u = cola.quitar()
+            if d > distancia[u]:
+                continue  # entrada obsoleta
+            for v, p in aristas[u]:
+                nueva = d + p
+                if nueva < distancia[v]:
+                    distancia[v] = nueva
+                    cola.agregar((nueva, v))
+        if h is not None:
+            hu = h[origen]
+            distancia = [dv - hu + h[v] for v, dv in enumerate(distancia)]
+        filas.append(array('d', distancia))
+    return DistanciasTodosPares(nombres, filas)
+
+
+# ===========================================================
+# ELECCIÓN AUTOMÁTICA
+# ===========================================================
+# Floyd-Warshall cuesta ~c·V³ y Johnson ~V·E·log2(V) relajaciones en Python,
+# así que compensa Floyd-Warshall si la densidad E/V² supera c / log2(V).
+# 'c' es el coste medido de un paso de Floyd-Warshall relativo a una
+# relajación de Johnson: con NumPy es ~50 veces más barato; en Python puro
+# algo más caro.
+COSTE_RELATIVO_FLOYD = {True: 0.02, False: 1.6}
+
+
+def elegir_metodo(num_vertices, num_aristas, con_numpy=None):
+    """Devuelve "floyd" o "johnson" según la densidad del grafo."""
+    if num_vertices < 2:
+        return "floyd"
+    con_numpy = (np is not None) if con_numpy is None else con_numpy
+    densidad = num_aristas / (num_vertices * num_vertices)
+    umbral = COSTE_RELATIVO_FLOYD[con_numpy] / max(1.0, math.log2(num_vertices))
+    return "floyd" if densidad >= umbral else "johnson"
+
+
+def distancias_todos_pares(grafo, metodo=None, usar_numpy=None):
+    """
+    Args:
+        grafo: dijkstra_mochila.Grafo o MatrizAdyacencia
+        metodo: "floyd", "johnson" o None para elegir por densidad
+
+    Returns:
+        DistanciasTodosPares
+    """
+    if isinstance(grafo, MatrizAdyacencia):
+        if metodo not in (None, "floyd"):
+            raise ValueError("Una MatrizAdyacencia solo admite Floyd-Warshall")
+        return floyd_warshall(grafo)
+    if metodo is None:
+        m = sum(len(v.aristas) for v in grafo.vertices.values())
+        metodo = elegir_metodo(len(grafo.vertices), m, usar_numpy)
+    if metodo == "floyd":
+        return floyd_warshall(MatrizAdyacencia.desde_grafo(grafo, usar_numpy))
+    if metodo == "johnson":
+        return johnson(grafo)
+    raise ValueError(f"Método desconocido: {metodo!r}")
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    from dijkstra_mochila import Grafo
+
+    g = Grafo()
+    for u, v, p in [("A", "B", 4), ("A", "C", 1), ("C", "B", -2), ("B", "D", 5), ("D", "A", 3)]:
+        g.agregar_arista(u, v, p)
+
+    for metodo in ("floyd", "johnson"):
+        tabla = distancias_todos_pares(g, metodo)
+        print(f"{metodo:8} A->D = {tabla.distancia('A', 'D')}   D->B = {tabla.distancia('D', 'B')}")
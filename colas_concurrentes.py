@@ -0,0 +1,209 @@
+"""
+Colas de prioridad concurrentes construidas sobre ejercicio2.Monticulo.
+
+- ColaPrioridadAsync: para tareas de asyncio (agregar/quitar con await).
+- ColaPrioridadHilos: para productores y consumidores en hilos.
+
+Ambas admiten capacidad máxima (el productor espera si la cola está llena)
+y operaciones por lotes que despiertan de una vez a tantos esperando como
+elementos haya, en vez de despertar a todos.
+"""
+
+import asyncio
+import collections
+import queue
+import threading
+import time
+
+from ejercicio2 import Monticulo
+
+
+# ===========================================================
+# COLA DE PRIORIDAD PARA ASYNCIO
+# ===========================================================
+class ColaPrioridadAsync:
+    """
+    Cola de prioridad para asyncio.
+
+    Atributos:
+        capacidad: Número máximo de elementos (0 = sin límite)
+    """
+
+    def __init__(self, capacidad=0, es_min=True, aridad=4, clave=None):
+        self.capacidad = capacidad
+        # estable=True: a igual prioridad se atiende por orden de llegada
+        self._monticulo = Monticulo(es_min, aridad=aridad, clave=clave, estable=True)
+        self._consumidores = collections.deque()  # futuros de quien espera datos
+        self._productores = collections.deque()   # futuros de quien espera hueco
+
+    # -------- consultas --------
+    @property
+    def tamano(self):
+        return self._monticulo.tamano
+
+    def vacia(self):
+        return self._monticulo.tamano == 0
+
+    def llena(self):
+        return 0 < self.capacidad <= self._monticulo.tamano
+
+    def _huecos(self):
+        if self.capacidad <= 0:
+            return None
+        return self.capacidad - self._monticulo.tamano
+
+    # -------- despertar por lotes --------
+    @staticmethod
+    def _despertar(esperando, n):
+        """Despierta como mucho a n tareas que sigan esperando."""
+        while n > 0 and esperando:
+            futuro = esperando.popleft()
+            if not futuro.done():
+                futuro.set_result(None)
+                n -= 1
+
+    async def _esperar(self, esperando, sigue_bloqueada, propia):
+        """Espera hasta que 'sigue_bloqueada()' sea falso."""
+        while sigue_bloqueada():
+            futuro = asyncio.get_running_loop().create_future()
+            esperando.append(futuro)
+            try:
+                await futuro
+            except BaseException:
+                futuro.cancel()
+                # Si nos despertaron justo al cancelar, pasamos el turno
+                if not sigue_bloqueada():
+                    self._despertar(propia, 1)
+                raise
+
+    # -------- inserción --------
+    def agregar_nowait(self, dato, prioridad=None):
+        if self.llena():
+            raise asyncio.QueueFull
+        self._monticulo.agregar(dato, prioridad)
+        self._despertar(self._consumidores, 1)
+
+    async def agregar(self, dato, prioridad=None):
+        await self._esperar(self._productores, self.llena, self._productores)
+        self.agregar_nowait(dato, prioridad)
+
+    async def agregar_muchos(self, datos):
+        """Inserta todos los datos, esperando hueco cuando haga falta."""
+        datos = list(datos)
+        while datos:
+            await self._esperar(self._productores, self.llena, self._productores)
+            huecos = self._huecos()
+            lote = datos if huecos is None else datos[:huecos]
+            datos = datos[len(lote):]
+            self._monticulo.agregar_muchos(lote)
+            self._despertar(self._consumidores, len(lote))
+
+    # -------- extracción --------
+    def quitar_nowait(self):
+        if self.vacia():
+            raise asyncio.QueueEmpty
+        dato = self._monticulo.quitar()
+        self._despertar(self._productores, 1)
+        return dato
+
+    async def quitar(self):
+        await self._esperar(self._consumidores, self.vacia, self._consumidores)
+        return self.quitar_nowait()
+
+    async def quitar_muchos(self, k):
+        """Espera a que haya al menos un dato y devuelve hasta k."""
+        await self._esperar(self._consumidores, self.vacia, self._consumidores)
+        datos = self._monticulo.quitar_muchos(k)
+        self._despertar(self._productores, len(datos))
+        return datos
+
+
+# ===========================================================
+# COLA DE PRIORIDAD PARA HILOS
+# ===========================================================
+class ColaPrioridadHilos:
+    """
+    Hermana de ColaPrioridadAsync para hilos: un único cerrojo protege el
+    montículo y dos condiciones separan a productores y consumidores.
+    """
+
+    def __init__(self, capacidad=0, es_min=True, aridad=4, clave=None):
+        self.capacidad = capacidad
+        self._monticulo = Monticulo(es_min, aridad=aridad, clave=clave, estable=True)
+        self._cerrojo = threading.Lock()
+        self._no_vacia = threading.Condition(self._cerrojo)
+        self._no_llena = threading.Condition(self._cerrojo)
+
+    @property
+    def tamano(self):
+        with self._cerrojo:
+            return self._monticulo.tamano
+
+    def _llena(self):
+        return 0 < self.capacidad <= self._monticulo.tamano
+
+    def _esperar(self, condicion, sigue_bloqueada, bloquear, tiempo, excepcion):
+        """Debe llamarse con el cerrojo tomado."""
+        if not bloquear:
+            if sigue_bloqueada():
+                raise excepcion
+            return
+        limite = None if tiempo is None else time.monotonic() + tiempo
+        while sigue_bloqueada():
+            restante = None if limite is None else limite - time.monotonic()
+            if restante is not None and restante <= 0:
+                raise excepcion
+            condicion.wait(restante)
+
+    def agregar(self, dato, prioridad=None, bloquear=True, tiempo=None):
+        with self._cerrojo:
+            self._esperar(self._no_llena, self._llena, bloquear, tiempo, queue.Full)
+            self._monticulo.agregar(dato, prioridad)
+            self._no_vacia.notify()
+
+    def agregar_muchos(self, datos):
+        datos = list(datos)
+        with self._cerrojo:
+            while datos:
+                self._esperar(self._no_llena, self._llena, True, None, queue.Full)
+                huecos = None if self.capacidad <= 0 else self.capacidad - self._monticulo.tamano
+                lote = datos if huecos is None else datos[:huecos]
+                datos = datos[len(lote):]
+                self._monticulo.agregar_muchos(lote)
+                self._no_vacia.notify(len(lote))
+
+    def quitar(self, bloquear=True, tiempo=None):
+        with self._cerrojo:
+            self._esperar(self._no_vacia, lambda: self._monticulo.tamano == 0,
+                          bloquear, tiempo, queue.Empty)
+            dato = self._monticulo.quitar()
+            self._no_llena.notify()
+            return dato
+
+    def quitar_muchos(self, k, bloquear=True, tiempo=None):
+        with self._cerrojo:
+            self._esperar(self._no_vacia, lambda: self._monticulo.tamano == 0,
+                          bloquear, tiempo, queue.Empty)
+            datos = self._monticulo.quitar_muchos(k)
+            self._no_llena.notify(len(datos))
+            return datos
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    async def demo():
+        cola = ColaPrioridadAsync(capacidad=2)
+
+        async def productor():
+            for prioridad, tarea in [(3, "c"), (1, "a"), (2, "b")]:
+                await cola.agregar(tarea, prioridad)  # espera si la cola está llena
+                print(f"Encolada: {tarea}")
+
+        async def consumidor():
+            for _ in range(3):
+                print(f"Atendida: {await cola.quitar()}")
+
+        await asyncio.gather(productor(), consumidor())
+
+    asyncio.run(demo())
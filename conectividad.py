@@ -0,0 +1,270 @@
+"""
+Conectividad dirigida para podar las búsquedas de caminos mínimos.
+
+Sobre dijkstra_mochila.Grafo o ejercicio3.Grafo (ambos se pasan a
+sucesores por índice entero) se precalculan, sin recursión:
+
+- Componentes fuertemente conexas (Tarjan iterativo). Tarjan las emite en
+  orden topológico inverso: si la componente A llega a la B, id(B) <= id(A).
+- El DAG de condensación (y su inverso) entre componentes.
+- Etiquetas baratas que descartan en O(1) casi todas las consultas
+  imposibles: componente débil, orden topológico y nivel en el DAG.
+
+Los resultados son una foto del grafo: si cambia, hay que reconstruirlos.
+"""
+
+from array import array
+
+from arbol_expansion import ConjuntosDisjuntos
+
+
+# ===========================================================
+# ADAPTADOR: GRAFO -> SUCESORES POR ÍNDICE
+# ===========================================================
+def sucesores_por_indice(grafo):
+    """
+    Devuelve (nombres, sucesores): sucesores[i] son los índices de los
+    destinos del vértice i. ejercicio3.Grafo ya guarda índices, así que sus
+    arrays se usan tal cual, sin copiar.
+    """
+    if hasattr(grafo, "lista_vertices"):  # ejercicio3.Grafo
+        vertices = grafo.lista_vertices
+        return [v.id for v in vertices], [v.destinos for v in vertices]
+    nombres = list(grafo.vertices)  # dijkstra_mochila.Grafo
+    indice = {nombre: i for i, nombre in enumerate(nombres)}
+    sucesores = [array('q', [indice[a.destino.nombre] for a in v.aristas])
+                 for v in grafo.vertices.values()]
+    return nombres, sucesores
+
+
+# ===========================================================
+# ALGORITMOS BÁSICOS
+# ===========================================================
+def componentes_fuertes(sucesores):
+    """
+    Tarjan con pila explícita de llamadas.
+
+    Returns:
+        tuple: (componente, número de componentes), con componente[v] el id
+               de la componente de v en orden topológico inverso
+    """
+    n = len(sucesores)
+    orden = [-1] * n          # instante de descubrimiento
+    bajo = [0] * n            # menor 'orden' alcanzable desde el subárbol
+    siguiente = [0] * n       # próximo sucesor por explorar de cada vértice
+    en_pila = bytearray(n)
+    componente = array('q', [-1]) * n
+    pila = []
+    contador = num = 0
+
+    for raiz in range(n):
+        if orden[raiz] >= 0:
+            continue
+        orden[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila[raiz] = 1
+        llamadas = [raiz]
+        while llamadas:
+            v = llamadas[-1]
+            vecinos = sucesores[v]
+            i = siguiente[v]
+            if i < len(vecinos):
+                siguiente[v] = i + 1
+                w = vecinos[i]
+                if orden[w] < 0:
+                    orden[w] = bajo[w] = contador
+                    contador += 1
+                    pila.append(w)
+                    en_pila[w] = 1
+                    llamadas.append(w)
+                elif en_pila[w] and orden[w] < bajo[v]:
+                    bajo[v] = orden[w]
+                continue
+
+            # 'Retorno' de v: propaga su 'bajo' al padre y cierra componente
+            llamadas.pop()
+            if llamadas and bajo[v] < bajo[llamadas[-1]]:
+                bajo[llamadas[-1]] = bajo[v]
+            if bajo[v] == orden[v]:
+                while True:
+                    w = pila.pop()
+                    en_pila[w] = 0
+                    componente[w] = num
+                    if w == v:
+                        break
+                num += 1
+    return componente, num
+
+
+def alcanzables(sucesores, origenes, permitido=None):
+    """
+    BFS desde 'origenes'. Devuelve un bytearray con 1 en cada vértice
+    alcanzado. Si se da 'permitido(v)', no se entra en los que devuelva False.
+    """
+    visto = bytearray(len(sucesores))
+    frontera = []
+    for o in origenes:
+        if not visto[o]:
+            visto[o] = 1
+            frontera.append(o)
+    while frontera:
+        nueva = []
+        for v in frontera:
+            for w in sucesores[v]:
+                if not visto[w] and (permitido is None or permitido(w)):
+                    visto[w] = 1
+                    nueva.append(w)
+        frontera = nueva
+    return visto
+
+
+# ===========================================================
+# ÍNDICE DE CONECTIVIDAD
+# ===========================================================
+class Conectividad:
+    """
+    Atributos:
+        nombres, indice: Traducción entre nombre de vértice e índice
+        componente: Componente fuerte de cada vértice
+        num_componentes: Número de componentes fuertes
+        miembros: Vértices de cada componente
+        dag, dag_inverso: Sucesores/predecesores de cada componente en la condensación
+        debil: Componente débil de cada componente fuerte
+        nivel: Longitud del camino más largo desde una fuente del DAG
+    """
+
+    def __init__(self, grafo):
+        self.nombres, self.sucesores = sucesores_por_indice(grafo)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self.componente, self.num_componentes = componentes_fuertes(self.sucesores)
+        c = self.num_componentes
+
+        self.miembros = [[] for _ in range(c)]
+        for v, cv in enumerate(self.componente):
+            self.miembros[cv].append(v)
+
+        # Condensación sin aristas repetidas
+        salientes = [set() for _ in range(c)]
+        componente = self.componente
+        for v, vecinos in enumerate(self.sucesores):
+            cv = componente[v]
+            for w in vecinos:
+                cw = componente[w]
+                if cw != cv:
+                    salientes[cv].add(cw)
+        self.dag = [array('q', sorted(s)) for s in salientes]
+        entrantes = [array('q') for _ in range(c)]
+        for a, destinos in enumerate(self.dag):
+            for b in destinos:
+                entrantes[b].append(a)
+        self.dag_inverso = entrantes
+
+        # Componentes débiles y niveles (ids decrecientes = orden topológico)
+        conjuntos = ConjuntosDisjuntos(c)
+        self.nivel = array('q', [0]) * c
+        for a in range(c - 1, -1, -1):
+            for b in self.dag[a]:
+                conjuntos.unir(a, b)
+                if self.nivel[a] + 1 > self.nivel[b]:
+                    self.nivel[b] = self.nivel[a] + 1
+        self.debil = array('q', [conjuntos.encontrar(a) for a in range(c)])
+
+    # -------- consultas O(1) --------
+    def componente_de(self, nombre):
+        """Id de la componente fuerte del vértice, o -1 si no existe."""
+        i = self.indice.get(nombre, -1)
+        return -1 if i < 0 else self.componente[i]
+
+    def fuertemente_conexos(self, a, b):
+        ca, cb = self.componente_de(a), self.componente_de(b)
+        return ca >= 0 and ca == cb
+
+    def descartado(self, ca, cb):
+        """True si las etiquetas prueban que la componente ca no llega a cb (ca != cb)."""
+        return (cb > ca
+                or self.debil[ca] != self.debil[cb]
+                or self.nivel[cb] <= self.nivel[ca])
+
+    # -------- consultas con búsqueda --------
+    def _buscar(self, ca, cb):
+        """
+        BFS por el DAG desde ca que solo entra en componentes que aún
+        podrían llegar a cb según las etiquetas, y para al encontrarla.
+        """
+        dag, nivel, debil = self.dag, self.nivel, self.debil
+        tope, grupo = nivel[cb], debil[cb]
+        visto = {ca}
+        frontera = [ca]
+        while frontera:
+            nueva = []
+            for x in frontera:
+                for y in dag[x]:
+                    if y == cb:
+                        return True
+                    if y > cb and nivel[y] < tope and y not in visto and debil[y] == grupo:
+                        visto.add(y)
+                        nueva.append(y)
+            frontera = nueva
+        return False
+
+    def puede_alcanzar(self, origen, destino):
+        """True si existe un camino dirigido de 'origen' a 'destino'."""
+        ca, cb = self.componente_de(origen), self.componente_de(destino)
+        if ca < 0 or cb < 0:
+            return False
+        if ca == cb:
+            return True
+        if self.descartado(ca, cb):
+            return False
+        return self._buscar(ca, cb)
+
+    def componentes_relevantes(self, ca, cb):
+        """
+        Componentes que están en algún camino de ca a cb (alcanzables desde
+        ca y que a la vez llegan a cb), o None si no hay camino.
+        """
+        if ca == cb:
+            return [ca]
+        if self.descartado(ca, cb):
+            return None
+        # Solo pueden estar entre ambas en orden topológico: cb <= id <= ca
+        hacia_delante = alcanzables(self.dag, [ca], lambda x: x >= cb)
+        if not hacia_delante[cb]:
+            return None
+        hacia_atras = alcanzables(self.dag_inverso, [cb], lambda x: x <= ca)
+        return [x for x in range(cb, ca + 1) if hacia_delante[x] and hacia_atras[x]]
+
+    def relevantes(self, origen, destino):
+        """
+        Máscara (bytearray por índice de vértice) de los vértices que pueden
+        aparecer en un camino de 'origen' a 'destino', o None si no existe
+        ninguno. Un Dijkstra hacia 'destino' puede ignorar el resto.
+        """
+        ca, cb = self.componente_de(origen), self.componente_de(destino)
+        if ca < 0 or cb < 0:
+            return None
+        componentes = self.componentes_relevantes(ca, cb)
+        if componentes is None:
+            return None
+        mascara = bytearray(len(self.nombres))
+        for c in componentes:
+            for v in self.miembros[c]:
+                mascara[v] = 1
+        return mascara
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    from dijkstra_mochila import Grafo
+
+    g = Grafo()
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E"), ("E", "D"), ("X", "Y")]:
+        g.agregar_arista(u, v, 1)
+
+    con = Conectividad(g)
+    print(f"Componentes: {[[con.nombres[v] for v in m] for m in con.miembros]}")
+    print(f"DAG de condensación: {[list(d) for d in con.dag]}")
+    for a, b in [("A", "E"), ("E", "A"), ("A", "Y")]:
+        print(f"{a} -> {b}: {con.puede_alcanzar(a, b)}")
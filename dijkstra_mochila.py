@@ -1,3 +1,8 @@
+import time
+
+from instrumentacion import instrumentar_arbol
+
+
 # ===========================================================
 # TDA: VÉRTICE
 # ===========================================================
@@ -80,8 +85,21 @@ class ArbolAVL:
     Árbol AVL usado como cola de prioridad para Dijkstra.
     Métodos principales: insertar(clave, valor) y extraer_min().
     """
-    def __init__(self):
+    def __init__(self, medidor=None):
         self.raiz = None
+        self.instrumentar(medidor)
+
+    # -------- instrumentación (opcional) --------
+    def instrumentar(self, medidor, prefijo="cola"):
+        """Mide comparaciones, nodos visitados, profundidad y rotaciones (None la quita)."""
+        instrumentar_arbol(self, medidor, prefijo, ("insertar", "extraer_min"), {
+            "_insertar": lambda nodo, clave, valor: 1,
+            "_extraer_min": lambda nodo: 0,
+        })
+
+    def _anotar_rotacion(self, caso):
+        if self.medidor is not None:
+            self.medidor.sumar(f"{self.prefijo_medidor}.rotaciones.{caso}")
 
     # -------- utilidades --------
     def _altura(self, nodo):
@@ -143,19 +161,23 @@ class ArbolAVL:
 
         # Caso Izq-Izq
         if equilibrio > 1 and clave < nodo.izq.clave:
+            self._anotar_rotacion("izq-izq")
             return self._rotar_derecha(nodo)
 
         # Caso Der-Der
         if equilibrio < -1 and clave >= nodo.der.clave:
+            self._anotar_rotacion("der-der")
             return self._rotar_izquierda(nodo)
 
         # Caso Izq-Der
         if equilibrio > 1 and clave >= nodo.izq.clave:
+            self._anotar_rotacion("izq-der")
             nodo.izq = self._rotar_izquierda(nodo.izq)
             return self._rotar_derecha(nodo)
 
         # Caso Der-Izq
         if equilibrio < -1 and clave < nodo.der.clave:
+            self._anotar_rotacion("der-izq")
             nodo.der = self._rotar_derecha(nodo.der)
             return self._rotar_izquierda(nodo)
 
@@ -185,14 +207,18 @@ class ArbolAVL:
         # Rebalanceo igual que en inserción
         if equilibrio > 1:
             if self._factor_equilibrio(nodo.izq) >= 0:
+                self._anotar_rotacion("izq-izq")
                 nodo = self._rotar_derecha(nodo)
             else:
+                self._anotar_rotacion("izq-der")
                 nodo.izq = self._rotar_izquierda(nodo.izq)
                 nodo = self._rotar_derecha(nodo)
         elif equilibrio < -1:
             if self._factor_equilibrio(nodo.der) <= 0:
+                self._anotar_rotacion("der-der")
                 nodo = self._rotar_izquierda(nodo)
             else:
+                self._anotar_rotacion("der-izq")
                 nodo.der = self._rotar_derecha(nodo.der)
                 nodo = self._rotar_izquierda(nodo)
 
@@ -205,35 +231,75 @@ class ArbolAVL:
 # ===========================================================
 # ALGORITMO DE DIJKSTRA CON AVL
 # ===========================================================
-def dijkstra_con_avl(grafo, inicio_nombre):
-    # 1) reiniciar distancias en el grafo
-    grafo.reiniciar_distancias()
-
-    # 2) vértice de inicio
-    inicio = grafo.obtener_vertice(inicio_nombre)
-    inicio.distancia = 0
-
-    # 3) cola de prioridad (AVL) con el vértice inicial
-    cola = ArbolAVL()
-    cola.insertar(inicio.distancia, inicio)
-
-    # 4) bucle principal
-    while not cola.esta_vacio():
-        dist_actual, vertice_actual = cola.extraer_min()
-
-        # si es una entrada obsoleta, la saltamos
-        if dist_actual > vertice_actual.distancia:
-            continue
-
-        # 5) Relajación de las aristas salientes
-        for arista in vertice_actual.aristas:
-            destino = arista.destino
-            nueva_dist = vertice_actual.distancia + arista.peso
-
-            if nueva_dist < destino.distancia:
-                destino.distancia = nueva_dist
-                destino.anterior = vertice_actual
-                cola.insertar(destino.distancia, destino)
+def dijkstra_con_avl(grafo, inicio_nombre, medidor=None, destino_nombre=None, conectividad=None):
+    # medidor (opcional): instrumentacion.Medidor que recibe los contadores
+    # de la búsqueda y de su cola AVL
+    # destino_nombre (opcional): se para al asentar ese vértice; el resto de
+    # distancias pueden quedar sin terminar
+    # conectividad (opcional, con destino): conectividad.Conectividad del
+    # grafo; si el destino es inalcanzable se vuelve sin explorar nada, y
+    # solo se relajan aristas hacia vértices que pueden llevar al destino
+    if medidor is not None:
+        t0 = t1 = time.perf_counter()
+    extracciones = obsoletas = relajaciones = mejoras = 0
+    try:
+        # 1) reiniciar distancias en el grafo
+        grafo.reiniciar_distancias()
+
+        # 2) vértice de inicio
+        inicio = grafo.obtener_vertice(inicio_nombre)
+        inicio.distancia = 0
+        destino_final = None if destino_nombre is None else grafo.obtener_vertice(destino_nombre)
+        relevantes = indice = None
+        if conectividad is not None and destino_nombre is not None:
+            relevantes = conectividad.relevantes(inicio_nombre, destino_nombre)
+            if relevantes is None:
+                return  # inalcanzable: también se registra (finally)
+            indice = conectividad.indice
+
+        # 3) cola de prioridad (AVL) con el vértice inicial
+        cola = ArbolAVL(medidor)
+        cola.insertar(inicio.distancia, inicio)
+
+        if medidor is not None:
+            t1 = time.perf_counter()
+
+        # 4) bucle principal
+        while not cola.esta_vacio():
+            dist_actual, vertice_actual = cola.extraer_min()
+            extracciones += 1
+
+            # si es una entrada obsoleta, la saltamos
+            if dist_actual > vertice_actual.distancia:
+                obsoletas += 1
+                continue
+            if vertice_actual is destino_final:
+                break
+
+            # 5) Relajación de las aristas salientes
+            relajaciones += len(vertice_actual.aristas)
+            for arista in vertice_actual.aristas:
+                destino = arista.destino
+                if relevantes is not None and not relevantes[indice[destino.nombre]]:
+                    continue
+                nueva_dist = vertice_actual.distancia + arista.peso
+
+                if nueva_dist < destino.distancia:
+                    destino.distancia = nueva_dist
+                    destino.anterior = vertice_actual
+                    cola.insertar(destino.distancia, destino)
+                    mejoras += 1
+    finally:
+        if medidor is not None:
+            t2 = time.perf_counter()
+            medidor.registrar_operacion("dijkstra_con_avl", {
+                "relajaciones": relajaciones,
+                "mejoras": mejoras,
+                "extracciones_obsoletas": obsoletas,
+                "vertices_asentados": extracciones - obsoletas,
+                "tiempo_inicializacion": t1 - t0,
+                "tiempo_bucle": t2 - t1,
+            })
 
 
 # ===========================================================
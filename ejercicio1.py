@@ -1,13 +1,18 @@
+import math
+import random
+
 # -------------------------------------------------------
 # TDA: Nodo del Árbol
 # -------------------------------------------------------
 
 class NodoArbol:
-    def __init__(self, valor):
+    def __init__(self, valor, prioridad=None):
         self.valor = valor
         self.izquierdo = None
         self.derecho = None
         self.altura = 1 
+        self.prioridad = prioridad # Solo se usa en modo treap
+        self.borrado = False       # Lápida del modo de eliminación perezosa
 
     def __repr__(self):
         return f"Nodo({self.valor})"
@@ -17,12 +22,56 @@ class NodoArbol:
 # TDA: Árbol Binario de Búsqueda (ABB)
 # -------------------------------------------------------
 
+MODOS_EQUILIBRIO = (None, "chivo", "treap", "splay")
+
 class ArbolABB:
-    def __init__(self):
+    """
+    ABB con estrategia de equilibrio opcional (se elige al construirlo):
+        None    -> ABB clásico sin equilibrar
+        "chivo" -> Chivo expiatorio: reconstruye el subárbol desequilibrado
+        "treap" -> Prioridades aleatorias: altura O(log n) esperada
+        "splay" -> Sube lo accedido a la raíz (bueno con accesos sesgados)
+
+    Con perezoso=True, eliminar solo marca el nodo (lápida) y el árbol se
+    compacta en O(n) cuando las lápidas superan 'umbral_lapidas' del total.
+    """
+    def __init__(self, modo=None, alfa=0.7, semilla=None, perezoso=False, umbral_lapidas=0.25):
+        if modo not in MODOS_EQUILIBRIO:
+            raise ValueError(f"Modo de equilibrio desconocido: {modo!r}")
+        if not 0.5 < alfa < 1:
+            raise ValueError("alfa debe estar entre 0.5 y 1")
         self.raiz = None
+        self.modo = modo
+        self.alfa = alfa                  # Solo modo chivo: tolerancia de desequilibrio
+        self._n = 0                       # Solo modo chivo: nodos actuales
+        self._max_n = 0                   # Solo modo chivo: máximo desde la última reconstrucción
+        self._azar = random.Random(semilla)
+        self.perezoso = perezoso
+        self.umbral_lapidas = umbral_lapidas
+        self._nodos = 0                   # Solo modo perezoso: nodos físicos (vivos + lápidas)
+        self._lapidas = 0                 # Solo modo perezoso: nodos marcados como borrados
+
+        # Se elige la estrategia una sola vez
+        self._insertar, self._eliminar, self._buscar = {
+            None:    (self._insertar_simple, self._eliminar_simple, self._buscar_simple),
+            "chivo": (self._insertar_chivo, self._eliminar_chivo, self._buscar_simple),
+            "treap": (self._insertar_treap, self._eliminar_treap, self._buscar_simple),
+            "splay": (self._insertar_splay, self._eliminar_splay, self._buscar_splay),
+        }[modo]
     
     # --- 1. Inserción ---
     def insertar(self, valor):
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            if nodo is not None:
+                if nodo.borrado: # Reinsertar = quitar la lápida
+                    nodo.borrado = False
+                    self._lapidas -= 1
+                return
+            self._nodos += 1
+        self._insertar(valor)
+
+    def _insertar_simple(self, valor):
         self.raiz = self._insertar_recursivo(self.raiz, valor)
     
     def _insertar_recursivo(self, nodo_actual, valor):
@@ -38,6 +87,17 @@ class ArbolABB:
         
     # --- 2. Eliminación (Con Criterio de Reemplazo) ---
     def eliminar(self, valor):
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            if nodo is not None and not nodo.borrado:
+                nodo.borrado = True
+                self._lapidas += 1
+                if self._lapidas > self.umbral_lapidas * self._nodos:
+                    self.compactar()
+            return
+        self._eliminar(valor)
+
+    def _eliminar_simple(self, valor):
         self.raiz = self._eliminar_recursivo(self.raiz, valor)
 
     def _eliminar_recursivo(self, nodo_actual, valor):
@@ -69,47 +129,344 @@ class ArbolABB:
             actual = actual.izquierdo
         return actual
 
-    # --- 3. Recorrido In-orden ---
+    # --- 3. Búsqueda ---
+    def buscar(self, valor):
+        if self.perezoso:
+            nodo = self._buscar_nodo(valor)
+            return nodo is not None and not nodo.borrado
+        return self._buscar(valor)
+
+    def _buscar_simple(self, valor):
+        return self._buscar_nodo(valor) is not None
+
+    def _buscar_nodo(self, valor):
+        actual = self.raiz
+        while actual is not None:
+            if valor < actual.valor:
+                actual = actual.izquierdo
+            elif valor > actual.valor:
+                actual = actual.derecho
+            else:
+                return actual
+        return None
+
+    # --- 4. Recorrido In-orden (iterativo: no depende de la altura) ---
     def inorden(self):
-        resultado = []
-        self._recorrido_inorden(self.raiz, resultado)
-        return resultado
-        
-    def _recorrido_inorden(self, nodo_actual, resultado):
-        if nodo_actual is not None:
-            self._recorrido_inorden(nodo_actual.izquierdo, resultado)
-            resultado.append(nodo_actual.valor)
-            self._recorrido_inorden(nodo_actual.derecho, resultado)
+        return [nodo.valor for nodo in self._nodos_inorden() if not nodo.borrado]
+
+    def _nodos_inorden(self):
+        pila = []
+        nodo_actual = self.raiz
+        while pila or nodo_actual is not None:
+            while nodo_actual is not None:
+                pila.append(nodo_actual)
+                nodo_actual = nodo_actual.izquierdo
+            nodo_actual = pila.pop()
+            yield nodo_actual
+            nodo_actual = nodo_actual.derecho
+
+    # --- 5. Eliminación por lotes y compactación ---
+    def eliminar_muchos(self, valores):
+        """
+        Elimina un lote de valores en una sola pasada: recorre el árbol en
+        orden mezclándolo con el lote ordenado y reconstruye con lo que queda.
+        O(n + k log k); para unos pocos valores sale más barato 'eliminar'.
+        """
+        lote = sorted(valores)
+        if not lote or self.raiz is None:
+            return
+        supervivientes = []
+        i = 0
+        for nodo in self._nodos_inorden():
+            while i < len(lote) and lote[i] < nodo.valor:
+                i += 1
+            if nodo.borrado or (i < len(lote) and not nodo.valor < lote[i]):
+                continue # Borrado (o lápida): no sobrevive
+            supervivientes.append(nodo)
+        self._reconstruir_con(supervivientes)
+
+    def compactar(self):
+        """Quita físicamente las lápidas reconstruyendo el árbol en O(n)."""
+        self._reconstruir_con([nodo for nodo in self._nodos_inorden() if not nodo.borrado])
+
+    def _reconstruir_con(self, nodos):
+        """Deja como árbol los 'nodos' (ya en orden), equilibrado y sin lápidas."""
+        self.raiz = self._construir_equilibrado(nodos, 0, len(nodos))
+        self._n = self._max_n = len(nodos)
+        self._nodos = len(nodos)
+        self._lapidas = 0
+        if self.modo == "treap":
+            self._repartir_prioridades()
+
+    def _repartir_prioridades(self):
+        """Prioridades aleatorias decrecientes por niveles: respeta el montículo del treap."""
+        nivel = [self.raiz] if self.raiz is not None else []
+        orden = []
+        while nivel:
+            orden.extend(nivel)
+            nivel = [h for n in nivel for h in (n.izquierdo, n.derecho) if h is not None]
+        prioridades = sorted((self._azar.random() for _ in orden), reverse=True)
+        for nodo, prioridad in zip(orden, prioridades):
+            nodo.prioridad = prioridad
+
+    # --- Rotaciones (treap) ---
+    def _rotar_derecha(self, nodo):
+        nuevo_padre = nodo.izquierdo
+        nodo.izquierdo = nuevo_padre.derecho
+        nuevo_padre.derecho = nodo
+        return nuevo_padre
+
+    def _rotar_izquierda(self, nodo):
+        nuevo_padre = nodo.derecho
+        nodo.derecho = nuevo_padre.izquierdo
+        nuevo_padre.izquierdo = nodo
+        return nuevo_padre
+
+    # -------------------------------------------------------
+    # MODO CHIVO EXPIATORIO (Scapegoat)
+    # -------------------------------------------------------
+    def _altura_maxima(self, n):
+        """Profundidad a partir de la cual el árbol deja de estar alfa-equilibrado."""
+        return math.floor(math.log(n, 1 / self.alfa))
+
+    def _insertar_chivo(self, valor):
+        if self.raiz is None:
+            self.raiz = NodoArbol(valor)
+            self._n = self._max_n = 1
+            return
+
+        # Descenso iterativo guardando el camino
+        camino = []
+        nodo_actual = self.raiz
+        while nodo_actual is not None:
+            camino.append(nodo_actual)
+            if valor < nodo_actual.valor:
+                nodo_actual = nodo_actual.izquierdo
+            elif valor > nodo_actual.valor:
+                nodo_actual = nodo_actual.derecho
+            else:
+                return # Duplicado: no se inserta
+
+        nuevo = NodoArbol(valor)
+        padre = camino[-1]
+        if valor < padre.valor:
+            padre.izquierdo = nuevo
+        else:
+            padre.derecho = nuevo
+        self._n += 1
+        self._max_n = max(self._max_n, self._n)
+
+        if len(camino) <= self._altura_maxima(self._n):
+            return
+
+        # Demasiado profundo: subimos hasta el chivo expiatorio (hijo con más de alfa*tamaño)
+        hijo, tam_hijo = nuevo, 1
+        for i in range(len(camino) - 1, -1, -1):
+            nodo_actual = camino[i]
+            hermano = nodo_actual.derecho if nodo_actual.izquierdo is hijo else nodo_actual.izquierdo
+            tam = tam_hijo + 1 + self._tamano_subarbol(hermano)
+            if tam_hijo > self.alfa * tam:
+                reconstruido = self._reconstruir(nodo_actual)
+                if i == 0:
+                    self.raiz = reconstruido
+                elif camino[i - 1].izquierdo is nodo_actual:
+                    camino[i - 1].izquierdo = reconstruido
+                else:
+                    camino[i - 1].derecho = reconstruido
+                return
+            hijo, tam_hijo = nodo_actual, tam
+
+    def _eliminar_chivo(self, valor):
+        if not self._buscar_simple(valor):
+            return
+        self.raiz = self._eliminar_recursivo(self.raiz, valor)
+        self._n -= 1
+        # Si se ha borrado mucho desde la última reconstrucción, se rehace todo
+        if self._n < self.alfa * self._max_n:
+            self.raiz = self._reconstruir(self.raiz)
+            self._max_n = self._n
+
+    def _tamano_subarbol(self, nodo):
+        tam = 0
+        pila = [nodo] if nodo is not None else []
+        while pila:
+            nodo = pila.pop()
+            tam += 1
+            if nodo.izquierdo is not None: pila.append(nodo.izquierdo)
+            if nodo.derecho is not None: pila.append(nodo.derecho)
+        return tam
+
+    def _reconstruir(self, nodo):
+        """Rehace el subárbol perfectamente equilibrado reutilizando sus nodos."""
+        nodos = []
+        pila = []
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            nodo = pila.pop()
+            nodos.append(nodo)
+            nodo = nodo.derecho
+        return self._construir_equilibrado(nodos, 0, len(nodos))
+
+    def _construir_equilibrado(self, nodos, inicio, fin):
+        if inicio >= fin:
+            return None
+        medio = (inicio + fin) // 2
+        nodo = nodos[medio]
+        nodo.izquierdo = self._construir_equilibrado(nodos, inicio, medio)
+        nodo.derecho = self._construir_equilibrado(nodos, medio + 1, fin)
+        return nodo
+
+    # -------------------------------------------------------
+    # MODO TREAP (ABB por valor + montículo máximo por prioridad)
+    # -------------------------------------------------------
+    def _insertar_treap(self, valor):
+        self.raiz = self._insertar_treap_recursivo(self.raiz, valor)
+
+    def _insertar_treap_recursivo(self, nodo_actual, valor):
+        if nodo_actual is None:
+            return NodoArbol(valor, self._azar.random())
+
+        if valor < nodo_actual.valor:
+            nodo_actual.izquierdo = self._insertar_treap_recursivo(nodo_actual.izquierdo, valor)
+            if nodo_actual.izquierdo.prioridad > nodo_actual.prioridad:
+                nodo_actual = self._rotar_derecha(nodo_actual)
+        elif valor > nodo_actual.valor:
+            nodo_actual.derecho = self._insertar_treap_recursivo(nodo_actual.derecho, valor)
+            if nodo_actual.derecho.prioridad > nodo_actual.prioridad:
+                nodo_actual = self._rotar_izquierda(nodo_actual)
+
+        return nodo_actual
+
+    def _eliminar_treap(self, valor):
+        self.raiz = self._eliminar_treap_recursivo(self.raiz, valor)
+
+    def _eliminar_treap_recursivo(self, nodo_actual, valor):
+        if nodo_actual is None:
+            return None
+
+        if valor < nodo_actual.valor:
+            nodo_actual.izquierdo = self._eliminar_treap_recursivo(nodo_actual.izquierdo, valor)
+        elif valor > nodo_actual.valor:
+            nodo_actual.derecho = self._eliminar_treap_recursivo(nodo_actual.derecho, valor)
+        else:
+            if nodo_actual.izquierdo is None:
+                return nodo_actual.derecho
+            if nodo_actual.derecho is None:
+                return nodo_actual.izquierdo
+            # Hundimos el nodo rotando hacia el hijo de mayor prioridad
+            if nodo_actual.izquierdo.prioridad > nodo_actual.derecho.prioridad:
+                nodo_actual = self._rotar_derecha(nodo_actual)
+                nodo_actual.derecho = self._eliminar_treap_recursivo(nodo_actual.derecho, valor)
+            else:
+                nodo_actual = self._rotar_izquierda(nodo_actual)
+                nodo_actual.izquierdo = self._eliminar_treap_recursivo(nodo_actual.izquierdo, valor)
+
+        return nodo_actual
+
+    # -------------------------------------------------------
+    # MODO SPLAY (Top-down, iterativo)
+    # -------------------------------------------------------
+    def _splay(self, nodo, valor):
+        """Sube a la raíz el nodo con 'valor' (o el último visitado si no está)."""
+        if nodo is None:
+            return None
+        cabecera = NodoArbol(None)
+        izq = der = cabecera
+        while True:
+            if valor < nodo.valor:
+                if nodo.izquierdo is None: break
+                if valor < nodo.izquierdo.valor:
+                    nodo = self._rotar_derecha(nodo) # Zig-zig
+                    if nodo.izquierdo is None: break
+                der.izquierdo = nodo # Enlazar a la derecha
+                der = nodo
+                nodo = nodo.izquierdo
+            elif valor > nodo.valor:
+                if nodo.derecho is None: break
+                if valor > nodo.derecho.valor:
+                    nodo = self._rotar_izquierda(nodo) # Zag-zag
+                    if nodo.derecho is None: break
+                izq.derecho = nodo # Enlazar a la izquierda
+                izq = nodo
+                nodo = nodo.derecho
+            else:
+                break
+        # Reensamblar
+        izq.derecho = nodo.izquierdo
+        der.izquierdo = nodo.derecho
+        nodo.izquierdo = cabecera.derecho
+        nodo.derecho = cabecera.izquierdo
+        return nodo
+
+    def _insertar_splay(self, valor):
+        if self.raiz is None:
+            self.raiz = NodoArbol(valor)
+            return
+        raiz = self._splay(self.raiz, valor)
+        if valor < raiz.valor:
+            nuevo = NodoArbol(valor)
+            nuevo.izquierdo, nuevo.derecho = raiz.izquierdo, raiz
+            raiz.izquierdo = None
+            raiz = nuevo
+        elif valor > raiz.valor:
+            nuevo = NodoArbol(valor)
+            nuevo.izquierdo, nuevo.derecho = raiz, raiz.derecho
+            raiz.derecho = None
+            raiz = nuevo
+        self.raiz = raiz
+
+    def _eliminar_splay(self, valor):
+        if self.raiz is None:
+            return
+        raiz = self._splay(self.raiz, valor)
+        if not (valor < raiz.valor or valor > raiz.valor):
+            if raiz.izquierdo is None:
+                raiz = raiz.derecho
+            else:
+                # El máximo del subárbol izquierdo sube y adopta al derecho
+                derecho = raiz.derecho
+                raiz = self._splay(raiz.izquierdo, valor)
+                raiz.derecho = derecho
+        self.raiz = raiz
+
+    def _buscar_splay(self, valor):
+        if self.raiz is None:
+            return False
+        self.raiz = self._splay(self.raiz, valor)
+        return not (valor < self.raiz.valor or valor > self.raiz.valor)
 
 # =======================================================
 # LÍNEAS PARA INSERTAR Y ELIMINAR (PRUEBA)
 # =======================================================
 
-# 1. Crear el árbol
-abb = ArbolABB()
-valores_a_insertar = [50, 30, 70, 20, 45, 65, 80, 40]
-
-# 2. Insertar valores
-print("--- INSERCIÓN DE VALORES ---")
-for valor in valores_a_insertar:
-    abb.insertar(valor)
-    print(f"Insertado: {valor}")
-
-print(f"\nContenido In-orden inicial: {abb.inorden()}") # Debe ser [20, 30, 40, 45, 50, 65, 70, 80]
-
-# 3. Eliminar casos específicos:
-
-# Prueba 3.a: Eliminar una hoja (fácil)
-valor_eliminar_hoja = 40
-abb.eliminar(valor_eliminar_hoja)
-print(f"\n--- ELIMINACIÓN de hoja ({valor_eliminar_hoja}) ---")
-print(f"Contenido In-orden tras eliminar 40: {abb.inorden()}") 
-# Debe ser [20, 30, 45, 50, 65, 70, 80]
-
-# Prueba 3.b: Eliminar un nodo con dos hijos (difícil, aplica el criterio de reemplazo)
-valor_eliminar_dos_hijos = 70 
-# El sucesor de 70 es 80.
-abb.eliminar(valor_eliminar_dos_hijos) 
-print(f"\n--- ELIMINACIÓN de nodo con dos hijos ({valor_eliminar_dos_hijos}) ---")
-print(f"Contenido In-orden tras eliminar 70: {abb.inorden()}")
-# Debe ser [20, 30, 45, 50, 65, 80] (El 70 fue reemplazado por 80, y el 80 original fue eliminado)
\ No newline at end of file
+if __name__ == "__main__":
+    # 1. Crear el árbol
+    abb = ArbolABB()
+    valores_a_insertar = [50, 30, 70, 20, 45, 65, 80, 40]
+
+    # 2. Insertar valores
+    print("--- INSERCIÓN DE VALORES ---")
+    for valor in valores_a_insertar:
+        abb.insertar(valor)
+        print(f"Insertado: {valor}")
+
+    print(f"\nContenido In-orden inicial: {abb.inorden()}") # Debe ser [20, 30, 40, 45, 50, 65, 70, 80]
+
+    # 3. Eliminar casos específicos:
+
+    # Prueba 3.a: Eliminar una hoja (fácil)
+    valor_eliminar_hoja = 40
+    abb.eliminar(valor_eliminar_hoja)
+    print(f"\n--- ELIMINACIÓN de hoja ({valor_eliminar_hoja}) ---")
+    print(f"Contenido In-orden tras eliminar 40: {abb.inorden()}") 
+    # Debe ser [20, 30, 45, 50, 65, 70, 80]
+
+    # Prueba 3.b: Eliminar un nodo con dos hijos (difícil, aplica el criterio de reemplazo)
+    valor_eliminar_dos_hijos = 70 
+    # El sucesor de 70 es 80.
+    abb.eliminar(valor_eliminar_dos_hijos) 
+    print(f"\n--- ELIMINACIÓN de nodo con dos hijos ({valor_eliminar_dos_hijos}) ---")
+    print(f"Contenido In-orden tras eliminar 70: {abb.inorden()}")
+    # Debe ser [20, 30, 45, 50, 65, 80] (El 70 fue reemplazado por 80, y el 80 original fue eliminado)
@@ -1,61 +1,115 @@
+import itertools
+import operator
+from itertools import islice
+
 # ======================================================
 # CLASE MONTÍCULO HÍBRIDA (SIRVE PARA TODO)
 # ======================================================
 class Monticulo:
-    def _init_(self, es_min=True): # Por defecto es Min (para Dijkstra)
-        self.vector = []
-        self.tamano = 0
+    def __init__(self, es_min=True, datos=None, aridad=2, clave=None, estable=False):
+        # Por defecto es Min (para Dijkstra)
+        if aridad < 2:
+            raise ValueError("La aridad del montículo debe ser al menos 2")
         self.es_min = es_min         # True = El menor sube. False = El mayor sube.
+        self.aridad = aridad         # Hijos por nodo (2, 4, 8...): más aridad = menos niveles
+        self.clave = clave           # Función que extrae la prioridad de cada dato
+        # Con clave o estable, el vector guarda entradas (prioridad, secuencia, dato):
+        # la secuencia desempata en orden de llegada y evita comparar los datos.
+        self.con_entradas = estable or clave is not None
+        self._secuencia = itertools.count(0, 1 if es_min else -1)
+
+        # --- ¿Es 'a' más prioritario que 'b'? Se decide una sola vez ---
+        self.es_mejor = operator.lt if es_min else operator.gt
+
+        self.vector = [self._envolver(d) for d in datos] if datos is not None else []
+        self.tamano = len(self.vector)
+        self.monticulizar()
 
-    # --- FUNCIÓN AUXILIAR: ¿Es 'a' más prioritario que 'b'? ---
-    def es_mejor(self, a, b):
-        if self.es_min: return a < b  # Modo Min-Heap
-        else:           return a > b  # Modo Max-Heap
+    # --- FUNCIONES AUXILIARES: entradas (prioridad, secuencia, dato) ---
+    def _envolver(self, dato, prioridad=None):
+        if not self.con_entradas:
+            if prioridad is not None:
+                raise ValueError("'prioridad' solo se admite con clave o estable=True")
+            return dato
+        if prioridad is None:
+            prioridad = dato if self.clave is None else self.clave(dato)
+        return (prioridad, next(self._secuencia), dato)
+
+    def _desenvolver(self, entrada):
+        return entrada[2] if self.con_entradas else entrada
 
     # ---------------------------------------------------------
     # FLOTAR (INSERTAR)
     # ---------------------------------------------------------
     def flotar(self, i):
-        while i > 0:
-            padre = (i - 1) // 2
+        vector = self.vector
+        es_mejor = self.es_mejor
+        aridad = self.aridad
+        dato = vector[i]
 
-            # Usamos nuestra función auxiliar para decidir
-            if self.es_mejor(self.vector[i], self.vector[padre]):
-                self.vector[i], self.vector[padre] = self.vector[padre], self.vector[i]
+        # Bajamos los padres peores en vez de intercambiar en cada nivel
+        while i > 0:
+            padre = (i - 1) // aridad
+            if es_mejor(dato, vector[padre]):
+                vector[i] = vector[padre]
                 i = padre
             else:
                 break
+        vector[i] = dato
 
     # ---------------------------------------------------------
     # HUNDIR (ELIMINAR)
     # ---------------------------------------------------------
     def hundir(self, i):
-        while True:
-            izq = 2 * i + 1
-            der = 2 * i + 2
-            mejor = i
+        vector = self.vector
+        es_mejor = self.es_mejor
+        aridad = self.aridad
+        tamano = self.tamano
+        dato = vector[i]
 
-            # Comparamos hijo izq con el actual
-            if izq < self.tamano and self.es_mejor(self.vector[izq], self.vector[mejor]):
-                mejor = izq
+        while True:
+            primero = aridad * i + 1
+            if primero >= tamano: break
 
-            # Comparamos hijo der con el mejor que llevamos
-            if der < self.tamano and self.es_mejor(self.vector[der], self.vector[mejor]):
-                mejor = der
+            # Buscamos el mejor de los hijos
+            mejor = primero
+            for hijo in range(primero + 1, min(primero + aridad, tamano)):
+                if es_mejor(vector[hijo], vector[mejor]):
+                    mejor = hijo
 
-            if mejor == i: break
+            if not es_mejor(vector[mejor], dato): break
 
-            self.vector[i], self.vector[mejor] = self.vector[mejor], self.vector[i]
+            vector[i] = vector[mejor]
             i = mejor
+        vector[i] = dato
+
+    # ---------------------------------------------------------
+    # MONTICULIZAR (CONSTRUCCIÓN EN O(n))
+    # ---------------------------------------------------------
+    def monticulizar(self):
+        # Hundimos de abajo arriba empezando por el último nodo con hijos
+        for i in range((self.tamano - 2) // self.aridad, -1, -1):
+            self.hundir(i)
 
     # ---------------------------------------------------------
     # FUNCIONES PÚBLICAS
     # ---------------------------------------------------------
-    def agregar(self, dato):
-        self.vector.append(dato)
+    def agregar(self, dato, prioridad=None):
+        # 'prioridad' solo en modo entradas (clave o estable); si no, ValueError
+        self.vector.append(self._envolver(dato, prioridad))
         self.tamano += 1
         self.flotar(self.tamano - 1)
 
+    def consultar(self):
+        # El dato prioritario sin sacarlo (None si está vacío)
+        if self.tamano == 0: return None
+        return self._desenvolver(self.vector[0])
+
+    def ver_prioridad(self):
+        # La prioridad del dato prioritario (sin entradas es el propio dato)
+        if self.tamano == 0: return None
+        return self.vector[0][0] if self.con_entradas else self.vector[0]
+
     def quitar(self):
         if self.tamano == 0: return None
         dato = self.vector[0]
@@ -64,12 +118,241 @@ class Monticulo:
         if self.tamano > 0:
             self.vector[0] = ultimo
             self.hundir(0)
+        return self._desenvolver(dato)
+
+    def agregar_muchos(self, datos):
+        self._insertar_entradas([self._envolver(d) for d in datos])
+
+    def _insertar_entradas(self, entradas):
+        # Si el lote es grande frente al montículo, reconstruir sale más barato
+        if len(entradas) > self.tamano:
+            self.vector.extend(entradas)
+            self.tamano = len(self.vector)
+            self.monticulizar()
+        else:
+            for entrada in entradas:
+                self.vector.append(entrada)
+                self.tamano += 1
+                self.flotar(self.tamano - 1)
+
+    def quitar_muchos(self, k):
+        # Devuelve hasta k datos en orden de prioridad
+        resultado = []
+        while k > 0 and self.tamano > 0:
+            resultado.append(self.quitar())
+            k -= 1
+        return resultado
+
+    def reemplazar(self, dato, prioridad=None):
+        # Saca el prioritario y mete 'dato' con un solo hundir (más barato que quitar + agregar)
+        if self.tamano == 0:
+            self.agregar(dato, prioridad)
+            return None
+        saliente = self.vector[0]
+        self.vector[0] = self._envolver(dato, prioridad)
+        self.hundir(0)
+        return self._desenvolver(saliente)
+
+    # ---------------------------------------------------------
+    # SELECCIÓN DE LOS K MEJORES EN FLUJO (MEMORIA O(k))
+    # ---------------------------------------------------------
+    @staticmethod
+    def seleccionar_k(datos, k, mayores=True, clave=None, tamano_bloque=65536, aridad=4):
+        """
+        Devuelve los k mayores (o menores) de cualquier iterable, ordenados,
+        en O(n log k) tiempo y O(k) memoria. Los empates conservan el orden
+        de llegada.
+        """
+        if k <= 0:
+            return []
+
+        # Truco: para quedarnos con los k MAYORES usamos un montículo MIN de
+        # tamaño k (su raíz es el peor guardado), y al revés para los menores.
+        monticulo = Monticulo(es_min=mayores, aridad=aridad)
+        vector = monticulo.vector
+        # La secuencia va con el signo que hace salir antes al más reciente
+        signo = -1 if mayores else 1
+        supera = operator.gt if mayores else operator.lt
+        leidos = 0
+
+        iterador = iter(datos)
+        while True:
+            bloque = list(islice(iterador, tamano_bloque))
+            if not bloque:
+                break
+            prioridades = bloque if clave is None else list(map(clave, bloque))
+
+            # 1. Llenado hasta tener k elementos
+            inicio = 0
+            while monticulo.tamano < k and inicio < len(bloque):
+                monticulo.agregar((prioridades[inicio], signo * (leidos + inicio), bloque[inicio]))
+                inicio += 1
+
+            # 2. Prefiltro del bloque con el umbral actual (la raíz)
+            if inicio < len(bloque):
+                umbral = vector[0][0]
+                candidatos = [j for j in range(inicio, len(bloque)) if supera(prioridades[j], umbral)]
+                for j in candidatos:
+                    if supera(prioridades[j], vector[0][0]):
+                        monticulo.reemplazar((prioridades[j], signo * (leidos + j), bloque[j]))
+
+            leidos += len(bloque)
+
+        # Sale del peor al mejor: se invierte para devolverlo ordenado
+        resultado = [entrada[2] for entrada in monticulo.quitar_muchos(k)]
+        resultado.reverse()
+        return resultado
+
+# ======================================================
+# MONTÍCULO DIRECCIONABLE (COLA DE PRIORIDAD INDEXADA)
+# ======================================================
+class Asa(list):
+    """
+    Referencia a un dato dentro de un MonticuloDireccionable.
+    Internamente es la propia entrada [prioridad, secuencia, dato, posicion],
+    así que se compara igual que una tupla y se actualiza en O(1).
+    """
+    __slots__ = ()
+
+    @property
+    def prioridad(self):
+        return self[0]
+
+    @property
+    def dato(self):
+        return self[2]
+
+    @property
+    def activa(self):
+        # False cuando el dato ya salió del montículo
+        return self[3] >= 0
+
+
+class MonticuloDireccionable(Monticulo):
+    """
+    Montículo que devuelve un asa por cada dato que entra ('agregar',
+    'agregar_muchos', 'reemplazar') y mantiene la posición
+    de cada entrada, de modo que cambiar_prioridad y eliminar son O(log n).
+    """
+    def __init__(self, es_min=True, datos=None, aridad=2, clave=None):
+        super().__init__(es_min, datos, aridad, clave, estable=True)
+
+    def _envolver(self, dato, prioridad=None):
+        if prioridad is None:
+            prioridad = dato if self.clave is None else self.clave(dato)
+        return Asa((prioridad, next(self._secuencia), dato, -1))
+
+    # ---------------------------------------------------------
+    # FLOTAR / HUNDIR (ACTUALIZANDO POSICIONES)
+    # ---------------------------------------------------------
+    def flotar(self, i):
+        vector = self.vector
+        es_mejor = self.es_mejor
+        aridad = self.aridad
+        dato = vector[i]
+
+        while i > 0:
+            padre = (i - 1) // aridad
+            if es_mejor(dato, vector[padre]):
+                vector[i] = vector[padre]
+                vector[i][3] = i
+                i = padre
+            else:
+                break
+        vector[i] = dato
+        dato[3] = i
+
+    def hundir(self, i):
+        vector = self.vector
+        es_mejor = self.es_mejor
+        aridad = self.aridad
+        tamano = self.tamano
+        dato = vector[i]
+
+        while True:
+            primero = aridad * i + 1
+            if primero >= tamano: break
+
+            mejor = primero
+            for hijo in range(primero + 1, min(primero + aridad, tamano)):
+                if es_mejor(vector[hijo], vector[mejor]):
+                    mejor = hijo
+
+            if not es_mejor(vector[mejor], dato): break
+
+            vector[i] = vector[mejor]
+            vector[i][3] = i
+            i = mejor
+        vector[i] = dato
+        dato[3] = i
+
+    def monticulizar(self):
+        for i, entrada in enumerate(self.vector):
+            entrada[3] = i
+        super().monticulizar()
+
+    # ---------------------------------------------------------
+    # FUNCIONES PÚBLICAS
+    # ---------------------------------------------------------
+    def agregar(self, dato, prioridad=None):
+        asa = self._envolver(dato, prioridad)
+        self.vector.append(asa)
+        self.tamano += 1
+        self.flotar(self.tamano - 1)
+        return asa
+
+    def agregar_muchos(self, datos):
+        asas = [self._envolver(d) for d in datos]
+        self._insertar_entradas(asas)
+        return asas
+
+    def quitar(self):
+        if self.tamano == 0: return None
+        asa = self.vector[0]
+        dato = super().quitar()
+        asa[3] = -1
         return dato
 
+    def reemplazar(self, dato, prioridad=None):
+        # Devuelve (dato saliente, asa del nuevo); saliente None si estaba vacío
+        if self.tamano == 0:
+            return None, self.agregar(dato, prioridad)
+        saliente = self.vector[0]
+        asa = self._envolver(dato, prioridad)
+        self.vector[0] = asa
+        self.hundir(0)
+        saliente[3] = -1
+        return saliente[2], asa
+
+    def contiene(self, asa):
+        i = asa[3]
+        return 0 <= i < self.tamano and self.vector[i] is asa
+
+    def cambiar_prioridad(self, asa, prioridad):
+        if not self.contiene(asa):
+            raise ValueError("El asa no pertenece a este montículo")
+        asa[0] = prioridad
+        # Solo uno de los dos movimientos hará algo
+        self.flotar(asa[3])
+        self.hundir(asa[3])
+
+    def eliminar(self, asa):
+        if not self.contiene(asa):
+            raise ValueError("El asa no pertenece a este montículo")
+        i = asa[3]
+        ultimo = self.vector.pop()
+        self.tamano -= 1
+        if i < self.tamano:
+            self.vector[i] = ultimo
+            self.flotar(i)
+            self.hundir(ultimo[3])
+        asa[3] = -1
+        return asa[2]
+
 # ======================================================
 # MAIN DE PRUEBA (DEMOSTRACIÓN)
 # ======================================================
-if _name_ == "_main_":
+if __name__ == "__main__":
     datos = [50, 10, 80, 5, 30]
 
     # --- CASO A: MONTÍCULO MÍNIMO (Para Dijkstra) ---
@@ -88,4 +371,37 @@ if _name_ == "_main_":
 
     for x in datos: max_heap.agregar(x)
     print(f"Vector Max: {max_heap.vector} (El 80 debe estar en pos 0)")
-    print(f"Sacamos el prioritario: {max_heap.quitar()}") # Sale 80
\ No newline at end of file
+    print(f"Sacamos el prioritario: {max_heap.quitar()}") # Sale 80
+
+    print("\n" + "="*30 + "\n")
+
+    # --- CASO C: CONSTRUCCIÓN EN BLOQUE ---
+    print("--- PRUEBA MONTICULIZAR (Carga de golpe en O(n)) ---")
+    bloque = Monticulo(es_min=True, datos=datos)
+    print(f"Vector Min: {bloque.vector}")
+    print(f"Sacamos los 3 prioritarios: {bloque.quitar_muchos(3)}") # [5, 10, 30]
+
+    print("\n" + "="*30 + "\n")
+
+    # --- CASO D: 4-ARIO CON CLAVE (Empates en orden de llegada) ---
+    print("--- PRUEBA 4-ARIO CON CLAVE ---")
+    tareas = Monticulo(es_min=True, aridad=4, clave=lambda t: t[0])
+    for t in [(2, "b"), (1, "a"), (2, "c"), (1, "d")]: tareas.agregar(t)
+    print(f"Orden de salida: {tareas.quitar_muchos(4)}") # a, d, b, c
+
+    print("\n" + "="*30 + "\n")
+
+    # --- CASO E: DIRECCIONABLE (Reprogramar y cancelar) ---
+    print("--- PRUEBA DIRECCIONABLE ---")
+    cola = MonticuloDireccionable(es_min=True)
+    asas = {nombre: cola.agregar(nombre, p) for nombre, p in [("a", 5), ("b", 3), ("c", 8)]}
+    cola.cambiar_prioridad(asas["c"], 1)  # 'c' pasa delante
+    cola.eliminar(asas["b"])              # 'b' se cancela
+    print(f"Orden de salida: {cola.quitar_muchos(3)}") # ['c', 'a']
+
+    print("\n" + "="*30 + "\n")
+
+    # --- CASO F: TOP-K EN FLUJO ---
+    print("--- PRUEBA TOP-K ---")
+    print(f"3 mayores: {Monticulo.seleccionar_k(iter(datos), 3)}")                # [80, 50, 30]
+    print(f"2 menores: {Monticulo.seleccionar_k(iter(datos), 2, mayores=False)}") # [5, 10]
\ No newline at end of file
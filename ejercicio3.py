@@ -1,3 +1,6 @@
+import time
+from array import array
+
 # -------------------------------------------------------
 # TDA: Arista (NodoArista)
 # -------------------------------------------------------
@@ -16,14 +19,49 @@ class NodoArista:
 # -------------------------------------------------------
 
 class NodoVertice:
-    """Modela un nodo del grafo con su lista de adyacencia."""
-    def __init__(self, id: str):
+    """
+    Modela un nodo del grafo con su lista de adyacencia.
+
+    La adyacencia se guarda empaquetada en dos arrays paralelos:
+    `destinos` (índice entero del vértice destino) y `pesos`. Así cada
+    arista ocupa unos pocos bytes en lugar de un objeto NodoArista.
+    """
+    def __init__(self, id: str, indice: int = -1, grafo=None):
         self.id = id
-        self.conexiones = [] # Lista de objetos NodoArista (Lista de adyacencia)
-        
+        self.indice = indice         # Índice denso asignado por el grafo
+        self.destinos = array('q')   # Índices de los vértices destino
+        self.pesos = array('q')      # Pesos (pasa a 'd' con un float o un int fuera de 64 bits)
+        self._grafo = grafo
+
     def agregar_vecino(self, destino_id: str, peso: int):
         """Agrega una arista a la lista de conexiones."""
-        self.conexiones.append(NodoArista(destino_id, peso))
+        if self._grafo is None:
+            raise ValueError(f"El vértice {self.id!r} no pertenece a ningún grafo")
+        destino = self._grafo.agregar_vertice(destino_id)
+        self.agregar_vecino_indice(destino.indice, peso)
+
+    def agregar_vecino_indice(self, destino: int, peso):
+        """Agrega una arista usando directamente el índice del destino."""
+        if self.pesos.typecode == 'q' and not isinstance(peso, int):
+            self.pesos = array('d', self.pesos)
+        try:
+            self.pesos.append(peso)
+        except OverflowError:
+            self.pesos = array('d', self.pesos)
+            self.pesos.append(peso)
+        self.destinos.append(destino)
+
+    @property
+    def conexiones(self):
+        """
+        Vista de compatibilidad: lista de NodoArista construida al vuelo.
+        No se guarda; usar `destinos`/`pesos` en los recorridos. Fuera de
+        un grafo no hay nombres y el destino es el índice.
+        """
+        if self._grafo is None:
+            return [NodoArista(d, p) for d, p in zip(self.destinos, self.pesos)]
+        nombres = self._grafo.lista_vertices
+        return [NodoArista(nombres[d].id, p) for d, p in zip(self.destinos, self.pesos)]
 
     def __repr__(self):
         return f"V({self.id})"
@@ -37,13 +75,14 @@ class Grafo:
     def __init__(self):
         self.lista_vertices = [] # Almacena los objetos NodoVertice
         # *Mapeo auxiliar interno: Necesario para buscar por ID sin diccionarios*
+        # Internado: cada ID se traduce una sola vez a un índice entero denso
         self._mapeo_id = {} 
 
     def agregar_vertice(self, id: str) -> NodoVertice:
         """Añade un vértice al grafo o devuelve el existente."""
         if id not in self._mapeo_id:
-            nuevo_vertice = NodoVertice(id)
-            self._mapeo_id[id] = len(self.lista_vertices)
+            nuevo_vertice = NodoVertice(id, len(self.lista_vertices), self)
+            self._mapeo_id[id] = nuevo_vertice.indice
             self.lista_vertices.append(nuevo_vertice)
             return nuevo_vertice
         return self.lista_vertices[self._mapeo_id[id]]
@@ -51,107 +90,139 @@ class Grafo:
     def agregar_arista(self, origen_id: str, destino_id: str, peso: int):
         """Agrega la arista (dirigida) entre el origen y el destino."""
         vertice_origen = self.agregar_vertice(origen_id)
-        self.agregar_vertice(destino_id)
+        vertice_destino = self.agregar_vertice(destino_id)
             
-        vertice_origen.agregar_vecino(destino_id, peso)
+        vertice_origen.agregar_vecino_indice(vertice_destino.indice, peso)
+
+    def indice(self, id: str) -> int:
+        """Devuelve el índice entero del vértice, o -1 si no existe."""
+        return self._mapeo_id.get(id, -1)
+
+    @property
+    def tamano(self) -> int:
+        return len(self.lista_vertices)
+
+    def contar_aristas(self) -> int:
+        return sum(len(v.destinos) for v in self.lista_vertices)
 
 # ======================================================
 # 3. ALGORITMO DIJKSTRA (SIN DICCIONARIOS EN LA LÓGICA)
 # ======================================================
 
 def buscar_vertice(grafo, info):
-    """Función de búsqueda mantenida."""
-    aux = grafo.inicio
-    while aux is not None:
-        if aux.info == info:
-            return aux
-        aux = aux.sig
-    return None
-
-def dijkstra_sin_dict(grafo, origen_id, destino_id):
+    """Función de búsqueda mantenida: devuelve el NodoVertice o None."""
+    i = grafo.indice(info)
+    if i < 0:
+        return None
+    return grafo.lista_vertices[i]
+
+def dijkstra_sin_dict(grafo, origen_id, destino_id, medidor=None, conectividad=None):
+    # medidor (opcional): instrumentacion.Medidor. Aquí no hay cola, así que
+    # no existen entradas obsoletas: se cuentan relajaciones, mejoras y
+    # vértices asentados, y el tiempo de cada fase.
+    # conectividad (opcional): conectividad.Conectividad del mismo grafo. Los
+    # destinos imposibles salen en O(1) y los vértices que no están en ningún
+    # camino origen -> destino se dan por visitados desde el principio.
+    if medidor is not None:
+        reloj = time.perf_counter
+        t_inicio = reloj()
+        t_inicializacion = None  # None: se salió antes de acabar la preparación
+        t_seleccion = t_relajacion = 0.0
+    relajaciones = mejoras = asentados = 0
     
-    # --- A. PREPARACIÓN E INICIALIZACIÓN ---
-    # Reiniciar todos los nodos (necesario si dijkstra se llama varias veces)
-    aux = grafo.inicio
-    while aux is not None:
-        aux.distancia = float('inf')
-        aux.anterior = None
-        aux.visitado = False
-        aux = aux.sig
+    try:
+        # --- A. PREPARACIÓN E INICIALIZACIÓN ---
+        # Todo el estado vive en listas indexadas por el índice entero del vértice
+        n = grafo.tamano
+        INF = float('inf')
+        distancia = [INF] * n
+        anterior = [-1] * n
+        visitado = [False] * n
+        vertices = grafo.lista_vertices
     
-    # Nodo de origen
-    nodo_origen = buscar_vertice(grafo, origen_id)
-    if nodo_origen is None:
-        return [], float('inf')
-        
-    nodo_origen.distancia = 0
-
-    # --- B. BUCLE PRINCIPAL (Vuelve al inicio del grafo en cada iteración) ---
-    for _ in range(grafo.tamano):
+        # Nodo de origen
+        origen = grafo.indice(origen_id)
+        if origen < 0:
+            return [], INF
+        if conectividad is not None:
+            relevantes = conectividad.relevantes(origen_id, destino_id)
+            if relevantes is None:
+                return [], INF
+            visitado = [not r for r in relevantes]
         
-        # 1. SELECCIÓN: Buscar el nodo NO visitado con la distancia más pequeña
-        actual_id = None
-        menor_distancia = float('inf')
+        distancia[origen] = 0
+        if medidor is not None:
+            t_inicializacion = reloj() - t_inicio
+
+        # --- B. BUCLE PRINCIPAL (Vuelve al inicio del grafo en cada iteración) ---
+        for _ in range(n):
+            if medidor is not None:
+                t0 = reloj()
         
-        # Recorremos la lista completa de vértices del grafo
-        aux = grafo.inicio
-        while aux is not None:
-            if not aux.visitado and aux.distancia < menor_distancia:
-                menor_distancia = aux.distancia
-                actual_id = aux.info
-            aux = aux.sig
-            
-        # Si no encontramos nada, paramos (grafo desconectado o terminado)
-        if actual_id is None:
-            break
-            
-        # 2. OBTENER Y MARCAR
-        nodo_actual = buscar_vertice(grafo, actual_id)
-        if nodo_actual is None: continue 
+            # 1. SELECCIÓN: Buscar el nodo NO visitado con la distancia más pequeña
+            actual = -1
+            menor_distancia = INF
         
-        nodo_actual.visitado = True # Marcar como visitado
-
-        # 3. RELAJACIÓN (Actualizar vecinos)
-        arista = nodo_actual.adyacentes
-        while arista is not None:
+            # Recorremos la lista completa de vértices del grafo
+            for i in range(n):
+                if not visitado[i] and distancia[i] < menor_distancia:
+                    menor_distancia = distancia[i]
+                    actual = i
             
-            vecino_id = arista.destino
-            costo_viaje = arista.peso
+            # Si no encontramos nada, paramos (grafo desconectado o terminado)
+            if actual < 0:
+                break
             
-            # Buscamos el objeto nodo del vecino
-            nodo_vecino = buscar_vertice(grafo, vecino_id)
-            if nodo_vecino is None: 
-                arista = arista.sig
-                continue
-
-            # Relajación
-            nueva_distancia = nodo_actual.distancia + costo_viaje
+            # 2. MARCAR
+            visitado[actual] = True
+            asentados += 1
+            if medidor is not None:
+                t1 = reloj()
+                t_seleccion += t1 - t0
+
+            # 3. RELAJACIÓN (Actualizar vecinos): los destinos ya son índices
+            nodo_actual = vertices[actual]
+            relajaciones += len(nodo_actual.destinos)
+            for vecino, costo_viaje in zip(nodo_actual.destinos, nodo_actual.pesos):
+                nueva_distancia = menor_distancia + costo_viaje
             
-            if not nodo_vecino.visitado and nueva_distancia < nodo_vecino.distancia:
+                if not visitado[vecino] and nueva_distancia < distancia[vecino]:
                 
-                # SÍ: Actualizamos la distancia y el predecesor
-                nodo_vecino.distancia = nueva_distancia
-                nodo_vecino.anterior = nodo_actual # Guardamos el puntero al nodo
-
-            arista = arista.sig
+                    # SÍ: Actualizamos la distancia y el predecesor
+                    distancia[vecino] = nueva_distancia
+                    anterior[vecino] = actual
+                    mejoras += 1
+            if medidor is not None:
+                t_relajacion += reloj() - t1
+    finally:
+        if medidor is not None:
+            medidor.registrar_operacion("dijkstra_sin_dict", {
+                "relajaciones": relajaciones,
+                "mejoras": mejoras,
+                "vertices_asentados": asentados,
+                "tiempo_inicializacion": reloj() - t_inicio if t_inicializacion is None
+                                         else t_inicializacion,
+                "tiempo_seleccion": t_seleccion,
+                "tiempo_relajacion": t_relajacion,
+            })
 
     # ==========================================
     # 4. RECONSTRUCCIÓN DEL CAMINO
     # ==========================================
-    
     camino = []
-    nodo_destino = buscar_vertice(grafo, destino_id)
+    destino = grafo.indice(destino_id)
 
-    if nodo_destino is None or nodo_destino.distancia == float('inf'):
-        return [], float('inf')
+    if destino < 0 or distancia[destino] == INF:
+        return [], INF
 
-    # Saltamos hacia atrás usando los punteros 'anterior'
-    curr = nodo_destino
-    while curr is not None:
-        camino.insert(0, curr.info)
-        curr = curr.anterior # Usamos el puntero anterior
+    # Saltamos hacia atrás usando los índices 'anterior'
+    curr = destino
+    while curr >= 0:
+        camino.append(vertices[curr].id)
+        curr = anterior[curr]
+    camino.reverse()
 
-    return camino, nodo_destino.distancia
+    return camino, distancia[destino]
 
 # ==========================================
 # MAIN PARA PROBARLO
@@ -160,38 +231,14 @@ if __name__ == "__main__":
     # 1. Crear el grafo
     mi_grafo = Grafo()
     
-    # 2. Insertar vértices y aristas (Usamos las funciones definidas arriba para crear la estructura)
-    # Nota: Tendrías que definir las funciones insertar_vertice e insertar_arista con la misma lógica
-    # que en tu código original, pero usando las nuevas clases.
-    
-    # Ejemplo de inserción usando las funciones originales (asumiendo que están disponibles)
-    def insertar_vertice(grafo, info):
-        nuevo = NodoVertice(info)
-        if grafo.inicio is None:
-            grafo.inicio = nuevo
-        else:
-            aux = grafo.inicio
-            while aux.sig is not None:
-                aux = aux.sig
-            aux.sig = nuevo
-        grafo.tamano += 1
-
-    def insertar_arista(grafo, origen, destino, peso):
-        nodo_origen = buscar_vertice(grafo, origen)
-        if nodo_origen:
-            nueva = NodoArista(destino, peso)
-            nueva.sig = nodo_origen.adyacentes
-            nodo_origen.adyacentes = nueva
-
-    insertar_vertice(mi_grafo, "Madrid")
-    insertar_vertice(mi_grafo, "Paris")
-    insertar_vertice(mi_grafo, "Berlin")
-    insertar_arista(mi_grafo, "Madrid", "Paris", 10)
-    insertar_arista(mi_grafo, "Paris", "Berlin", 5)
-    insertar_arista(mi_grafo, "Madrid", "Berlin", 20)
+    # 2. Insertar vértices y aristas (los IDs se internan a enteros al añadirlos)
+    mi_grafo.agregar_arista("Madrid", "Paris", 10)
+    mi_grafo.agregar_arista("Paris", "Berlin", 5)
+    mi_grafo.agregar_arista("Madrid", "Berlin", 20)
     
+    print(f"Conexiones de Madrid: {mi_grafo.lista_vertices[0].conexiones}")
     print("Calculando ruta...")
     ruta, coste = dijkstra_sin_dict(mi_grafo, "Madrid", "Berlin")
 
     print(f"La ruta más rápida es: {ruta}")
-    print(f"El coste total es: {coste}")
\ No newline at end of file
+    print(f"El coste total es: {coste}")
@@ -0,0 +1,156 @@
+"""
+Generadores de grafos sintéticos para pruebas y benchmarks.
+
+Todos devuelven (número de vértices, iterador de aristas (origen, destino,
+peso)) con vértices 0..n-1 y pesos enteros, así que las distancias son
+exactas y se pueden comparar entre motores sin tolerancias. Las aristas se
+generan sobre la marcha: con 1e7 vértices no hace falta tenerlas todas en
+memoria antes de construir el grafo.
+
+    rejilla              Rejilla 2D, aristas en ambos sentidos
+    geometrico           Puntos al azar en el cuadrado unidad unidos si están cerca
+    erdos_renyi          G(n, p) dirigido
+    ley_potencia         Barabási-Albert (grados con cola pesada)
+"""
+
+import math
+import random
+
+
+# ===========================================================
+# GENERADORES
+# ===========================================================
+def rejilla(n, semilla=None, peso_maximo=100):
+    """Rejilla de lado ~sqrt(n) con vecinos arriba/abajo/izquierda/derecha."""
+    rnd = random.Random(semilla)
+    lado = max(1, math.isqrt(n))
+
+    def aristas():
+        for f in range(lado):
+            for c in range(lado):
+                v = f * lado + c
+                if c + 1 < lado:
+                    yield v, v + 1, rnd.randint(1, peso_maximo)
+                    yield v + 1, v, rnd.randint(1, peso_maximo)
+                if f + 1 < lado:
+                    yield v, v + lado, rnd.randint(1, peso_maximo)
+                    yield v + lado, v, rnd.randint(1, peso_maximo)
+    return lado * lado, aristas()
+
+
+def geometrico(n, semilla=None, grado_medio=8, escala=1_000_000):
+    """
+    Grafo geométrico aleatorio: une los puntos a distancia <= r (en ambos
+    sentidos), con r elegido para el grado medio pedido. El peso es la
+    distancia euclídea multiplicada por 'escala' y redondeada hacia arriba.
+    Los puntos se reparten en celdas de lado r para no comparar todos.
+    """
+    rnd = random.Random(semilla)
+    radio = math.sqrt(grado_medio / (math.pi * max(1, n)))
+    celdas = max(1, int(1 / radio))
+    xs = [rnd.random() for _ in range(n)]
+    ys = [rnd.random() for _ in range(n)]
+    cubos = {}
+    for v in range(n):
+        cubos.setdefault((int(xs[v] * celdas), int(ys[v] * celdas)), []).append(v)
+
+    def aristas():
+        r2 = radio * radio
+        for (cx, cy), miembros in cubos.items():
+            # Cada par de celdas vecinas se visita una vez (mitad del vecindario)
+            for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+                otros = cubos.get((cx + dx, cy + dy))
+                if otros is None:
+                    continue
+                misma = dx == 0 and dy == 0
+                for i, u in enumerate(miembros):
+                    for w in (miembros[i + 1:] if misma else otros):
+                        d2 = (xs[u] - xs[w]) ** 2 + (ys[u] - ys[w]) ** 2
+                        if d2 <= r2:
+                            peso = max(1, math.ceil(math.sqrt(d2) * escala))
+                            yield u, w, peso
+                            yield w, u, peso
+    return n, aristas()
+
+
+def erdos_renyi(n, semilla=None, grado_medio=8, peso_maximo=100):
+    """
+    G(n, p) dirigido sin lazos, p = grado_medio / (n - 1). Salta entre
+    aristas con saltos geométricos (Batagelj-Brandes): O(n + E), no O(n²).
+    """
+    rnd = random.Random(semilla)
+    p = min(1.0, grado_medio / max(1, n - 1))
+
+    def aristas():
+        if p <= 0:
+            return
+        total = n * n
+        log_q = math.log(1 - p) if p < 1 else None
+        posicion = -1
+        while True:
+            if log_q is None:
+                posicion += 1
+            else:
+                posicion += 1 + int(math.log(1 - rnd.random()) / log_q)
+            if posicion >= total:
+                return
+            u, w = divmod(posicion, n)
+            if u != w:
+                yield u, w, rnd.randint(1, peso_maximo)
+    return n, aristas()
+
+
+def ley_potencia(n, semilla=None, aristas_por_vertice=4, peso_maximo=100):
+    """
+    Barabási-Albert: cada vértice nuevo se une (en ambos sentidos) a
+    'aristas_por_vertice' vértices elegidos con probabilidad proporcional
+    a su grado, usando la lista de extremos repetidos.
+    """
+    rnd = random.Random(semilla)
+    m = max(1, min(aristas_por_vertice, n - 1))
+
+    def aristas():
+        extremos = list(range(m))
+        for v in range(m, n):
+            objetivos = set()
+            while len(objetivos) < m:
+                objetivos.add(rnd.choice(extremos))
+            for w in objetivos:
+                peso = rnd.randint(1, peso_maximo)
+                yield v, w, peso
+                yield w, v, peso
+            extremos.extend(objetivos)
+            extremos.extend([v] * m)
+    return n, aristas()
+
+
+GENERADORES = {
+    "rejilla": rejilla,
+    "geometrico": geometrico,
+    "erdos_renyi": erdos_renyi,
+    "ley_potencia": ley_potencia,
+}
+
+
+def construir(n, aristas, clase):
+    """
+    Construye un grafo de 'clase' (dijkstra_mochila.Grafo o ejercicio3.Grafo,
+    que comparten agregar_vertice/agregar_arista) con vértices 0..n-1.
+    """
+    grafo = clase()
+    for v in range(n):
+        grafo.agregar_vertice(v)
+    for origen, destino, peso in aristas:
+        grafo.agregar_arista(origen, destino, peso)
+    return grafo
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    for nombre, generador in GENERADORES.items():
+        n, aristas = generador(10_000, semilla=1)
+        grados = [0] * n
+        for u, _, _ in aristas:
+            grados[u] += 1
+        print(f"{nombre:13} V={n:6}  E={sum(grados):7}  grado máximo {max(grados)}")
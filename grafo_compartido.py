@@ -0,0 +1,308 @@
+"""
+Grafo de solo lectura en memoria compartida para varios procesos.
+
+Un dijkstra_mochila.Grafo se exporta una vez a un bloque plano (formato CSR):
+
+    cabecera | desplazamientos (V+1 x int64) | destinos (E x int64)
+             | pesos (E x int64 o float64) | nombres (pickle)
+
+Los pesos se guardan como int64 si todos son enteros (así las distancias
+salen enteras, igual que con dijkstra_mochila) y como float64 si no.
+
+El bloque vive en multiprocessing.shared_memory o en un fichero mapeado
+con mmap (p. ej. en /dev/shm). Los trabajadores se adjuntan por nombre o
+ruta sin copiar nada: los arrays son memoryviews de solo lectura sobre la
+memoria compartida, así que adjuntarse cuesta milisegundos y la memoria
+total no crece con el número de procesos. Los nombres y el índice
+nombre -> vértice se decodifican solo si se piden.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from multiprocessing import shared_memory
+
+from ejercicio2 import Monticulo
+
+_MAGIA = b"GRAFOCSR"
+_CABECERA = struct.Struct("<8sQQQQc")  # magia, V, E, inicio y longitud de los nombres, tipo de los pesos
+_MIN_Q, _MAX_Q = -2 ** 63, 2 ** 63 - 1
+
+
+def _alinear(x, a=8):
+    return (x + a - 1) // a * a
+
+
+# ===========================================================
+# GRAFO COMPARTIDO
+# ===========================================================
+class GrafoCompartido:
+    """
+    Vista CSR de solo lectura sobre un bloque de memoria compartida.
+
+    Atributos:
+        num_vertices, num_aristas: Tamaño del grafo
+        desplazamientos, destinos, pesos: memoryviews de solo lectura; las
+            aristas de v son destinos[desplazamientos[v]:desplazamientos[v + 1]]
+        nombre: Nombre del bloque de shared_memory (None si es un fichero)
+        ruta: Fichero mapeado (None si es shared_memory)
+    """
+
+    def __init__(self, buffer, shm=None, mapa=None, ruta=None, propietario=False):
+        self._shm = shm
+        self._mapa = mapa
+        self.nombre = shm.name if shm is not None else None
+        self.ruta = ruta
+        self.propietario = propietario
+
+        magia, n, m, inicio_nombres, largo_nombres, tipo = _CABECERA.unpack_from(buffer, 0)
+        if magia != _MAGIA:
+            raise ValueError("El bloque no contiene un grafo exportado")
+        self.num_vertices, self.num_aristas = n, m
+
+        vista = memoryview(buffer).toreadonly()
+        pos = _alinear(_CABECERA.size)
+        self.desplazamientos = vista[pos:pos + 8 * (n + 1)].cast('q')
+        pos += 8 * (n + 1)
+        self.destinos = vista[pos:pos + 8 * m].cast('q')
+        pos += 8 * m
+        self.pesos = vista[pos:pos + 8 * m].cast(tipo.decode())
+        self._nombres_crudos = vista[inicio_nombres:inicio_nombres + largo_nombres]
+        self._vistas = [vista, self.desplazamientos, self.destinos, self.pesos, self._nombres_crudos]
+        self._nombres = None
+        self._indice = None
+
+    # -------- creación y conexión --------
+    @classmethod
+    def exportar(cls, grafo, ruta=None, nombre=None):
+        """
+        Copia un dijkstra_mochila.Grafo a memoria compartida (o al fichero
+        'ruta') y devuelve el GrafoCompartido propietario del bloque.
+        """
+        nombres = list(grafo.vertices)
+        indice = {v: i for i, v in enumerate(nombres)}
+        n = len(nombres)
+        m = sum(len(v.aristas) for v in grafo.vertices.values())
+        enteros = all(type(a.peso) is int and _MIN_Q <= a.peso <= _MAX_Q
+                      for v in grafo.vertices.values() for a in v.aristas)
+        tipo = 'q' if enteros else 'd'
+        blob = pickle.dumps(nombres, protocol=pickle.HIGHEST_PROTOCOL)
+
+        pos_desp = _alinear(_CABECERA.size)
+        pos_dest = pos_desp + 8 * (n + 1)
+        pos_pesos = pos_dest + 8 * m
+        pos_nombres = pos_pesos + 8 * m
+        total = pos_nombres + len(blob)
+
+        if ruta is None:
+            shm = shared_memory.SharedMemory(name=nombre, create=True, size=max(1, total))
+            buffer, mapa = shm.buf, None
+        else:
+            shm = None
+            with open(ruta, "wb") as archivo:
+                archivo.truncate(max(1, total))
+            with open(ruta, "r+b") as archivo:
+                mapa = mmap.mmap(archivo.fileno(), 0)
+            buffer = mapa
+
+        escritura = memoryview(buffer)
+        _CABECERA.pack_into(escritura, 0, _MAGIA, n, m, pos_nombres, len(blob), tipo.encode())
+        desplazamientos = escritura[pos_desp:pos_dest].cast('q')
+        destinos = escritura[pos_dest:pos_pesos].cast('q')
+        pesos = escritura[pos_pesos:pos_nombres].cast(tipo)
+        j = 0
+        for i, vertice in enumerate(grafo.vertices.values()):
+            desplazamientos[i] = j
+            for arista in vertice.aristas:
+                destinos[j] = indice[arista.destino.nombre]
+                pesos[j] = arista.peso
+                j += 1
+        desplazamientos[n] = j
+        escritura[pos_nombres:total] = blob
+        for v in (desplazamientos, destinos, pesos, escritura):
+            v.release()
+
+        if mapa is not None:
+            mapa.flush()
+            # Los lectores del propio proceso también ven el bloque como solo lectura
+            with open(ruta, "rb") as archivo:
+                lectura = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            mapa.close()
+            return cls(lectura, mapa=lectura, ruta=ruta, propietario=True)
+        return cls(shm.buf, shm=shm, propietario=True)
+
+    @classmethod
+    def adjuntar(cls, nombre=None, ruta=None):
+        """
+        Se conecta sin copiar a un grafo ya exportado, por nombre de
+        shared_memory o por ruta de fichero.
+
+        Con shared_memory el proceso debe haberse lanzado con
+        multiprocessing (comparte así el resource_tracker del padre): un
+        proceso independiente que se adjunte borraría el bloque al salir en
+        Python < 3.13.
+        """
+        if (nombre is None) == (ruta is None):
+            raise ValueError("Hay que dar 'nombre' o 'ruta', no ambos")
+        if ruta is not None:
+            with open(ruta, "rb") as archivo:
+                mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(mapa, mapa=mapa, ruta=ruta)
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=nombre, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=nombre)
+        return cls(shm.buf, shm=shm)
+
+    def identificador(self):
+        """Argumentos para adjuntar() desde otro proceso."""
+        return {"ruta": self.ruta} if self.ruta is not None else {"nombre": self.nombre}
+
+    def cerrar(self):
+        """Suelta la vista local. El propietario además libera el bloque."""
+        for vista in self._vistas:
+            vista.release()
+        self._vistas = []
+        if self._shm is not None:
+            self._shm.close()
+            if self.propietario:
+                self._shm.unlink()
+            self._shm = None
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+            if self.propietario:
+                os.remove(self.ruta)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # -------- nombres (perezosos) --------
+    @property
+    def nombres(self):
+        if self._nombres is None:
+            self._nombres = pickle.loads(self._nombres_crudos)
+        return self._nombres
+
+    def indice(self, nombre):
+        """Índice del vértice 'nombre', o -1 si no existe."""
+        if self._indice is None:
+            self._indice = {v: i for i, v in enumerate(self.nombres)}
+        return self._indice.get(nombre, -1)
+
+    # -------- consultas --------
+    def distancias_desde(self, origen, destino=-1, destinos=None):
+        """
+        Dijkstra por índices (con un montículo 4-ario y entradas perezosas).
+        Si se da 'destino' se para al asentarlo; con 'destinos' (varios
+        índices), al asentarlos todos.
+
+        Returns:
+            tuple: (distancia, anterior), listas indexadas por vértice
+        """
+        INF = float('inf')
+        desplazamientos, dest_aristas, pesos = self.desplazamientos, self.destinos, self.pesos
+        distancia = [INF] * self.num_vertices
+        anterior = [-1] * self.num_vertices
+        distancia[origen] = 0
+        pendientes = set(destinos) if destinos else None
+        cola = Monticulo(es_min=True, aridad=4)
+        cola.agregar((0, origen))
+        while cola.tamano:
+            d, u = cola.quitar()
+            if d > distancia[u]:
+                continue  # entrada obsoleta
+            if u == destino:
+                break
+            if pendientes is not None:
+                pendientes.discard(u)
+                if not pendientes:
+                    break
+            for j in range(desplazamientos[u], desplazamientos[u + 1]):
+                w = dest_aristas[j]
+                nueva = d + pesos[j]
+                if nueva < distancia[w]:
+                    distancia[w] = nueva
+                    anterior[w] = u
+                    cola.agregar((nueva, w))
+        return distancia, anterior
+
+    def _camino(self, distancia, anterior, destino):
+        if distancia[destino] == float('inf'):
+            return [], distancia[destino]
+        camino = []
+        v = destino
+        while v >= 0:
+            camino.append(self.nombres[v])
+            v = anterior[v]
+        camino.reverse()
+        return camino, distancia[destino]
+
+    def camino_minimo(self, origen_nombre, destino_nombre):
+        """Devuelve (camino, distancia), o ([], inf) si no hay camino."""
+        origen, destino = self.indice(origen_nombre), self.indice(destino_nombre)
+        if origen < 0 or destino < 0:
+            return [], float('inf')
+        distancia, anterior = self.distancias_desde(origen, destino)
+        return self._camino(distancia, anterior, destino)
+
+    def caminos_desde(self, origen_nombre, destinos_nombres):
+        """
+        Caminos mínimos desde un origen a varios destinos con una sola
+        búsqueda (se para al asentar el último).
+
+        Returns:
+            list: (camino, distancia) por destino, en el orden dado
+        """
+        origen = self.indice(origen_nombre)
+        destinos = [self.indice(d) for d in destinos_nombres]
+        conocidos = [d for d in destinos if d >= 0]
+        if origen < 0 or not conocidos:
+            return [([], float('inf')) for _ in destinos]
+        distancia, anterior = self.distancias_desde(origen, destinos=conocidos)
+        return [self._camino(distancia, anterior, d) if d >= 0 else ([], float('inf'))
+                for d in destinos]
+
+
+# ===========================================================
+# TRABAJADORES (multiprocessing.Pool / ProcessPoolExecutor)
+# ===========================================================
+_GRAFO = None  # grafo adjunto en cada proceso trabajador
+
+
+def inicializar_trabajador(identificador):
+    """initializer= del pool: adjunta el grafo una vez por proceso."""
+    global _GRAFO
+    _GRAFO = GrafoCompartido.adjuntar(**identificador)
+
+
+def consultar(par):
+    """Tarea del pool: camino mínimo entre (origen, destino) en el grafo adjunto."""
+    return _GRAFO.camino_minimo(*par)
+
+
+def consultar_origen(origen, destinos):
+    """Tarea del pool: caminos desde un origen a varios destinos con una búsqueda."""
+    return _GRAFO.caminos_desde(origen, destinos)
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    from multiprocessing import Pool
+
+    from dijkstra_mochila import Grafo
+
+    g = Grafo()
+    for u, v, p in [("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 5)]:
+        g.agregar_arista(u, v, p)
+
+    with GrafoCompartido.exportar(g) as compartido:
+        with Pool(2, initializer=inicializar_trabajador, initargs=(compartido.identificador(),)) as pool:
+            for camino, distancia in pool.map(consultar, [("A", "D"), ("C", "D"), ("D", "A")]):
+                print(f"{camino} -> {distancia}")
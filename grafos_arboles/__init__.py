@@ -0,0 +1,93 @@
+"""
+Árboles, montículos y motores de grafos del repositorio como una sola
+biblioteca.
+
+Importar el paquete no carga nada: cada módulo se importa la primera vez
+que se accede a él o a uno de sus nombres (PEP 562).
+
+    import grafos_arboles as ga
+    arbol = ga.ArbolAVL()                  # carga arboles
+    ga.dijkstra_mochila.dijkstra_con_avl   # carga dijkstra_mochila
+
+Limitación deliberada: el paquete es una fachada, no contiene los
+módulos. Siguen en la raíz del repositorio (se importan entre sí por su
+nombre y se ejecutan como scripts), así que la raíz debe estar en
+sys.path y grafos_arboles.arboles es el mismo objeto que el módulo de
+nivel superior 'arboles', no un grafos_arboles.arboles propio. Copiar
+solo la carpeta grafos_arboles no basta: hay que distribuir el
+repositorio entero.
+
+Nombres repetidos entre módulos: Grafo y ArbolAVL aquí son los de
+dijkstra_mochila y arboles. El grafo de índices compactos y la cola AVL
+de Dijkstra siguen disponibles como ejercicio3.Grafo y
+dijkstra_mochila.ArbolAVL.
+"""
+
+MODULOS = (
+    "arbol_b_disco", "arbol_expansion", "arbol_particionado", "arboles", "banco_caminos",
+    "caminos_todos_pares", "colas_concurrentes", "conectividad", "dijkstra_mochila",
+    "ejercicio1", "ejercicio2", "ejercicio3", "generadores_grafos", "grafo_compartido",
+    "instrumentacion", "lista_bloques", "ordenacion_externa", "servidor_caminos",
+)
+
+# nombre público -> módulo que lo define
+_NOMBRES = {
+    # árboles
+    "ArbolABB": "ejercicio1",
+    "ArbolAVL": "arboles",
+    "crear_arbol": "arboles",
+    "MapaAVL": "arboles",
+    "ArbolIntervalos": "arboles",
+    "ListaBloques": "lista_bloques",
+    "ArbolBDisco": "arbol_b_disco",
+    "ArbolParticionado": "arbol_particionado",
+    # montículos y colas
+    "Monticulo": "ejercicio2",
+    "MonticuloDireccionable": "ejercicio2",
+    "ColaPrioridadAsync": "colas_concurrentes",
+    "ColaPrioridadHilos": "colas_concurrentes",
+    "ordenar_externo": "ordenacion_externa",
+    "ordenar_archivo": "ordenacion_externa",
+    # grafos
+    "Grafo": "dijkstra_mochila",
+    "dijkstra_con_avl": "dijkstra_mochila",
+    "reconstruir_camino": "dijkstra_mochila",
+    "dijkstra_sin_dict": "ejercicio3",
+    "Conectividad": "conectividad",
+    "arbol_expansion_minima": "arbol_expansion",
+    "distancias_todos_pares": "caminos_todos_pares",
+    "MatrizAdyacencia": "caminos_todos_pares",
+    "GrafoCompartido": "grafo_compartido",
+    "ServidorCaminos": "servidor_caminos",
+    "GENERADORES": "generadores_grafos",
+    # utilidades
+    "Medidor": "instrumentacion",
+}
+
+__all__ = list(MODULOS) + list(_NOMBRES)
+
+
+def __getattr__(nombre):
+    from importlib import import_module
+
+    if nombre in MODULOS:
+        modulo = nombre
+    elif nombre in _NOMBRES:
+        modulo = _NOMBRES[nombre]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    try:
+        valor = import_module(modulo)
+    except ModuleNotFoundError as error:
+        if error.name != modulo:
+            raise
+        raise ImportError(f"grafos_arboles necesita la raíz del repositorio en sys.path "
+                          f"para cargar {modulo!r}") from error
+    if modulo != nombre:
+        valor = getattr(valor, nombre)
+    globals()[nombre] = valor  # los siguientes accesos no pasan por aquí
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
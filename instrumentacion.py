@@ -0,0 +1,172 @@
+"""
+Instrumentación opcional de árboles y caminos mínimos.
+
+Un Medidor acumula contadores, máximos y tiempos por fase, avisa a los
+suscriptores tras cada operación medida y se puede volcar a JSON.
+
+Las estructuras solo pagan el coste cuando se les da un Medidor: los árboles
+sustituyen sus métodos recursivos por envolturas en la propia instancia (la
+clase no cambia) y Dijkstra solo consulta el reloj si hay medidor.
+"""
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+# ===========================================================
+# MEDIDOR
+# ===========================================================
+class Medidor:
+    """
+    Atributos:
+        contadores: Counter con los eventos acumulados ("avl.rotaciones.izq-izq"...)
+        maximos: Máximo observado de cada magnitud ("profundidad_maxima"...)
+        tiempos: Segundos acumulados por fase ("dijkstra.bucle"...)
+    """
+
+    def __init__(self):
+        self.contadores = Counter()
+        self.maximos = {}
+        self.tiempos = defaultdict(float)
+        self._suscriptores = []
+
+    # -------- acumulación --------
+    def sumar(self, nombre, cantidad=1):
+        self.contadores[nombre] += cantidad
+
+    def maximo(self, nombre, valor):
+        if valor > self.maximos.get(nombre, float('-inf')):
+            self.maximos[nombre] = valor
+
+    def tiempo(self, nombre, segundos):
+        self.tiempos[nombre] += segundos
+
+    @contextmanager
+    def fase(self, nombre):
+        """Cronometra el bloque 'with' y lo suma a la fase 'nombre'."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tiempos[nombre] += time.perf_counter() - inicio
+
+    # -------- ganchos --------
+    def suscribir(self, funcion):
+        """
+        Registra funcion(operacion, estadisticas) que se llama tras cada
+        operación medida. Devuelve la propia función (sirve de decorador).
+        """
+        self._suscriptores.append(funcion)
+        return funcion
+
+    def desuscribir(self, funcion):
+        self._suscriptores.remove(funcion)
+
+    def registrar_operacion(self, operacion, estadisticas):
+        """Acumula las estadísticas de una operación y avisa a los suscriptores."""
+        self.contadores[f"{operacion}.operaciones"] += 1
+        for nombre, valor in estadisticas.items():
+            if nombre.startswith("profundidad"):
+                self.maximo(f"{operacion}.{nombre}", valor)
+            elif nombre.startswith("tiempo"):
+                self.tiempos[f"{operacion}.{nombre}"] += valor
+            else:
+                self.contadores[f"{operacion}.{nombre}"] += valor
+        for funcion in self._suscriptores:
+            funcion(operacion, estadisticas)
+
+    # -------- salida --------
+    def instantanea(self):
+        return {
+            "contadores": dict(self.contadores),
+            "maximos": dict(self.maximos),
+            "tiempos": dict(self.tiempos),
+        }
+
+    def a_json(self, ruta=None, indent=2):
+        """Devuelve el estado como JSON y, si se da 'ruta', lo escribe ahí."""
+        import json  # aquí y no arriba: json (re, enum) pesa en cada import del módulo
+        texto = json.dumps(self.instantanea(), indent=indent, sort_keys=True)
+        if ruta is not None:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+        return texto
+
+    def reiniciar(self):
+        self.contadores.clear()
+        self.maximos.clear()
+        self.tiempos.clear()
+
+
+# ===========================================================
+# ENVOLTURAS PARA ÁRBOLES
+# ===========================================================
+class EstadoOperacion:
+    """Contadores de la operación en curso de un árbol instrumentado."""
+
+    __slots__ = ("visitados", "comparaciones", "profundidad", "profundidad_maxima")
+
+    def __init__(self):
+        self.visitados = self.comparaciones = 0
+        self.profundidad = self.profundidad_maxima = 0
+
+
+def envolver_descenso(estado, funcion, comparaciones):
+    """
+    Envuelve un método recursivo cuyo primer argumento es el nodo actual.
+    Cada llamada con nodo cuenta como un nodo visitado, y 'comparaciones'
+    dice cuántas comparaciones de clave hace el método en ese nodo.
+    """
+    def envoltura(nodo, *args):
+        estado.profundidad += 1
+        if estado.profundidad > estado.profundidad_maxima:
+            estado.profundidad_maxima = estado.profundidad
+        if nodo is not None:
+            estado.visitados += 1
+            estado.comparaciones += comparaciones(nodo, *args)
+        try:
+            return funcion(nodo, *args)
+        finally:
+            estado.profundidad -= 1
+    return envoltura
+
+
+def envolver_operacion(medidor, estado, nombre, funcion):
+    """Envuelve una operación pública: reinicia el estado y lo registra al terminar."""
+    def envoltura(*args, **kwargs):
+        estado.visitados = estado.comparaciones = 0
+        estado.profundidad = estado.profundidad_maxima = 0
+        resultado = funcion(*args, **kwargs)
+        medidor.registrar_operacion(nombre, {
+            "nodos_visitados": estado.visitados,
+            "comparaciones": estado.comparaciones,
+            "profundidad_maxima": estado.profundidad_maxima,
+        })
+        return resultado
+    return envoltura
+
+
+def instrumentar_arbol(arbol, medidor, prefijo, operaciones, descensos):
+    """
+    Instala (o con medidor=None retira) las envolturas en la instancia.
+
+    Args:
+        arbol: Árbol a instrumentar (se le asignan 'medidor' y 'prefijo_medidor')
+        medidor: Medidor o None
+        prefijo: Prefijo de los contadores ("avl", "cola"...)
+        operaciones: Nombres de los métodos públicos a medir
+        descensos: {nombre del método recursivo: función de comparaciones}
+    """
+    for nombre in list(operaciones) + list(descensos):
+        arbol.__dict__.pop(nombre, None)
+    arbol.medidor = medidor
+    arbol.prefijo_medidor = prefijo
+    if medidor is None:
+        return
+    estado = EstadoOperacion()
+    for nombre, comparaciones in descensos.items():
+        setattr(arbol, nombre, envolver_descenso(estado, getattr(arbol, nombre), comparaciones))
+    for nombre in operaciones:
+        setattr(arbol, nombre,
+                envolver_operacion(medidor, estado, f"{prefijo}.{nombre}", getattr(arbol, nombre)))
@@ -0,0 +1,308 @@
+"""
+Conjunto ordenado en bloques (B-list) con la misma interfaz que arboles.ArbolAVL.
+
+Los valores viven en una lista de bloques ordenados y contiguos de entre
+tamano_bloque/2 y 2*tamano_bloque elementos (un bloque único puede ser
+más pequeño). Una lista paralela con el
+máximo de cada bloque hace de índice: buscar es un bisect sobre los
+máximos y otro dentro del bloque, sin perseguir punteros entre nodos. En
+vez de rotaciones, los bloques se parten al crecer demasiado y se funden
+con un vecino al quedarse pequeños.
+
+El índice posicional (tamaños acumulados de los bloques) se reconstruye
+solo cuando se pide una posición tras una modificación.
+
+Se puede crear directamente o con arboles.crear_arbol("bloques").
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+
+class ListaBloques:
+    """
+    Atributos:
+        tamano_bloque: Tamaño objetivo de cada bloque
+    """
+
+    def __init__(self, valores=None, tamano_bloque=1000):
+        """
+        Args:
+            valores: Iterable inicial (opcional; los repetidos se ignoran)
+            tamano_bloque: Tamaño objetivo de los bloques
+        """
+        if tamano_bloque < 2:
+            raise ValueError("tamano_bloque debe ser al menos 2")
+        self.tamano_bloque = tamano_bloque
+        self._bloques = []      # listas ordenadas y disjuntas
+        self._maximos = []      # último valor de cada bloque
+        self._acumulados = None # índice posicional (None = hay que rehacerlo)
+        self._total = 0
+        if valores is not None:
+            self._cargar(sorted(set(valores)))
+
+    def _cargar(self, ordenados):
+        """Sustituye el contenido por una lista ya ordenada y sin repetidos."""
+        t = self.tamano_bloque
+        self._bloques = [ordenados[i:i + t] for i in range(0, len(ordenados), t)]
+        if len(self._bloques) > 1 and len(self._bloques[-1]) < t // 2:
+            # Cola corta: al penúltimo, que se queda en menos de 1.5 * t
+            self._bloques[-2].extend(self._bloques.pop())
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+        self._total = len(ordenados)
+        self._acumulados = None
+
+    def _localizar(self, valor):
+        """
+        Returns:
+            tuple: (bloque, posición) donde está o debería estar 'valor';
+                   bloque = len(bloques) si es mayor que todos
+        """
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return i, 0
+        return i, bisect_left(self._bloques[i], valor)
+
+    # ==================== INSERCIÓN ====================
+
+    def insertar(self, valor):
+        """
+        Inserta un valor (los duplicados se ignoran).
+
+        Args:
+            valor: Valor a insertar
+        """
+        if not self._bloques:
+            self._bloques.append([valor])
+            self._maximos.append(valor)
+            self._total = 1
+            self._acumulados = None
+            return
+        i, j = self._localizar(valor)
+        if i == len(self._bloques):
+            i -= 1  # mayor que todos: va al final del último bloque
+            j = len(self._bloques[i])
+        bloque = self._bloques[i]
+        if j < len(bloque) and bloque[j] == valor:
+            return
+        bloque.insert(j, valor)
+        self._maximos[i] = bloque[-1]
+        self._total += 1
+        self._acumulados = None
+        if len(bloque) > 2 * self.tamano_bloque:
+            self._partir(i)
+
+    def _partir(self, i):
+        bloque = self._bloques[i]
+        mitad = len(bloque) // 2
+        nuevo = bloque[mitad:]
+        del bloque[mitad:]
+        self._bloques.insert(i + 1, nuevo)
+        self._maximos[i] = bloque[-1]
+        self._maximos.insert(i + 1, nuevo[-1])
+
+    # ==================== BÚSQUEDA ====================
+
+    def buscar(self, valor):
+        """
+        Busca un valor.
+
+        Returns:
+            bool: True si el valor existe
+        """
+        i, j = self._localizar(valor)
+        if i == len(self._bloques):
+            return False
+        bloque = self._bloques[i]
+        return j < len(bloque) and bloque[j] == valor
+
+    def __contains__(self, valor):
+        return self.buscar(valor)
+
+    # ==================== ELIMINACIÓN ====================
+
+    def eliminar(self, valor):
+        """
+        Elimina un valor si existe.
+
+        Args:
+            valor: Valor a eliminar
+        """
+        i, j = self._localizar(valor)
+        if i == len(self._bloques):
+            return
+        bloque = self._bloques[i]
+        if j == len(bloque) or bloque[j] != valor:
+            return
+        del bloque[j]
+        self._total -= 1
+        self._acumulados = None
+        if not bloque:
+            del self._bloques[i]
+            del self._maximos[i]
+            return
+        self._maximos[i] = bloque[-1]
+        if len(bloque) < self.tamano_bloque // 2 and len(self._bloques) > 1:
+            self._fundir(i)
+
+    def _fundir(self, i):
+        """Funde el bloque i con un vecino y lo vuelve a partir si queda grande."""
+        if i == len(self._bloques) - 1:
+            i -= 1
+        self._bloques[i].extend(self._bloques[i + 1])
+        del self._bloques[i + 1]
+        del self._maximos[i + 1]
+        self._maximos[i] = self._bloques[i][-1]
+        if len(self._bloques[i]) > 2 * self.tamano_bloque:
+            self._partir(i)
+
+    def eliminar_muchos(self, valores):
+        """
+        Elimina un lote de valores mezclándolo en una pasada con el
+        contenido y reconstruyendo los bloques: O(n + k log k).
+
+        Args:
+            valores: Iterable de valores a eliminar
+        """
+        lote = sorted(valores)
+        if not lote or not self._total:
+            return
+        supervivientes = []
+        i = 0
+        for valor in self:
+            while i < len(lote) and lote[i] < valor:
+                i += 1
+            if i < len(lote) and not valor < lote[i]:
+                continue
+            supervivientes.append(valor)
+        self._cargar(supervivientes)
+
+    # ==================== ÍNDICE POSICIONAL ====================
+
+    def _indice_posicional(self):
+        if self._acumulados is None:
+            acumulados, total = [], 0
+            for bloque in self._bloques:
+                total += len(bloque)
+                acumulados.append(total)
+            self._acumulados = acumulados
+        return self._acumulados
+
+    def __getitem__(self, posicion):
+        """Valor en la posición dada del orden (admite índices negativos)."""
+        if posicion < 0:
+            posicion += self._total
+        if not 0 <= posicion < self._total:
+            raise IndexError("posición fuera de rango")
+        acumulados = self._indice_posicional()
+        i = bisect_right(acumulados, posicion)
+        anteriores = acumulados[i - 1] if i else 0
+        return self._bloques[i][posicion - anteriores]
+
+    def posicion(self, valor):
+        """Número de valores menores que 'valor' (su posición si existe)."""
+        i, j = self._localizar(valor)
+        if i == 0:
+            return j
+        return self._indice_posicional()[i - 1] + j
+
+    # ==================== RECORRIDOS ====================
+
+    def __iter__(self):
+        return chain.from_iterable(self._bloques)
+
+    def __len__(self):
+        return self._total
+
+    def rango(self, desde=None, hasta=None):
+        """
+        Genera en orden los valores del intervalo [desde, hasta].
+
+        Args:
+            desde: Límite inferior (None = desde el mínimo)
+            hasta: Límite superior (None = hasta el máximo)
+        """
+        i, j = (0, 0) if desde is None else self._localizar(desde)
+        while i < len(self._bloques):
+            bloque = self._bloques[i]
+            if hasta is not None and bloque[-1] > hasta:
+                yield from bloque[j:bisect_right(bloque, hasta)]
+                return
+            yield from bloque[j:] if j else bloque
+            i, j = i + 1, 0
+
+    def recorrido_inorden(self):
+        """
+        Returns:
+            list: Lista con los valores en orden
+        """
+        return list(self)
+
+    def recorrido_preorden(self):
+        """
+        No hay jerarquía de nodos: se devuelve el orden de los valores, como
+        hace arbol_b_disco.ArbolBDisco. Se mantiene por compatibilidad.
+
+        Returns:
+            list: Lista con los valores
+        """
+        return list(self)
+
+    def recorrido_postorden(self):
+        """Ver recorrido_preorden."""
+        return list(self)
+
+    # ==================== CONSULTAS ====================
+
+    def es_vacio(self):
+        return self._total == 0
+
+    def obtener_altura_arbol(self):
+        """
+        Returns:
+            int: Niveles (índice de máximos + bloques): 0 vacía, 1 con un bloque, 2 si hay más
+        """
+        return min(len(self._bloques), 2)
+
+    def contar_nodos(self):
+        """
+        Returns:
+            int: Número de valores almacenados
+        """
+        return self._total
+
+    def contar_hojas(self):
+        """
+        Returns:
+            int: Número de bloques
+        """
+        return len(self._bloques)
+
+    def obtener_minimo(self):
+        return self._bloques[0][0] if self._bloques else None
+
+    def obtener_maximo(self):
+        return self._maximos[-1] if self._maximos else None
+
+    # ==================== VISUALIZACIÓN ====================
+
+    def mostrar_arbol(self):
+        """Muestra los bloques (primer y último valor de cada uno) en la consola."""
+        if not self._bloques:
+            print("Lista vacía")
+            return
+        for i, bloque in enumerate(self._bloques):
+            print(f"[bloque {i}] {len(bloque)} valores: {bloque[0]} .. {bloque[-1]}")
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    lista = ListaBloques(tamano_bloque=4)
+    for valor in [50, 25, 75, 10, 30, 60, 80, 5, 15, 27, 55, 65, 90]:
+        lista.insertar(valor)
+    lista.mostrar_arbol()
+    lista.eliminar(25)
+    print(f"Inorden: {lista.recorrido_inorden()}")
+    print(f"Rango [20, 60]: {list(lista.rango(20, 60))}")
+    print(f"Posición 3: {lista[3]}   posición de 55: {lista.posicion(55)}")
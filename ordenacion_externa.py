@@ -0,0 +1,232 @@
+"""
+Ordenación externa (más datos que memoria) con ejercicio2.Monticulo.
+
+1. Selección por reemplazo: un montículo de 'memoria' registros genera
+   corridas ordenadas de unas 2x su tamaño en media.
+2. Las corridas se vuelcan a ficheros temporales en binario compacto
+   (registros de tamaño fijo descritos con un formato de 'struct').
+3. Mezcla de k vías con el montículo, leyendo con buffers grandes. Si hay
+   más corridas que 'max_vias' se mezclan por pasadas.
+"""
+
+import os
+import struct
+import tempfile
+from itertools import count
+
+from ejercicio2 import Monticulo
+
+_FIN = object()  # marca de fin de un iterador
+
+
+# ===========================================================
+# FORMATO BINARIO DE LOS REGISTROS
+# ===========================================================
+class FormatoRegistro:
+    """
+    Registros de tamaño fijo. Con un solo campo ('<d', '<q'...) se leen y
+    escriben escalares; con varios ('<qd'...) tuplas.
+    """
+
+    def __init__(self, formato="<d"):
+        self.struct = struct.Struct(formato)
+        self.tamano = self.struct.size
+        self.escalar = len(self.struct.unpack(bytes(self.tamano))) == 1
+
+    def escribir(self, archivo, registros):
+        """Empaqueta una lista de registros de una sola escritura."""
+        empaquetar = self.struct.pack
+        if self.escalar:
+            archivo.write(b"".join([empaquetar(r) for r in registros]))
+        else:
+            archivo.write(b"".join([empaquetar(*r) for r in registros]))
+
+    def leer(self, ruta, tamano_buffer):
+        """Genera los registros de un fichero leyendo bloques grandes."""
+        bloque = max(1, tamano_buffer // self.tamano) * self.tamano
+        with open(ruta, "rb", buffering=0) as archivo:
+            while True:
+                datos = archivo.read(bloque)
+                if not datos:
+                    break
+                if self.escalar:
+                    for (registro,) in self.struct.iter_unpack(datos):
+                        yield registro
+                else:
+                    yield from self.struct.iter_unpack(datos)
+
+
+class _Escritor:
+    """Acumula registros y los vuelca al llegar a 'tamano_buffer' bytes."""
+
+    def __init__(self, ruta, formato, tamano_buffer):
+        self.archivo = open(ruta, "wb", buffering=0)
+        self.formato = formato
+        self.pendientes = []
+        self.limite = max(1, tamano_buffer // formato.tamano)
+
+    def escribir(self, registro):
+        self.pendientes.append(registro)
+        if len(self.pendientes) >= self.limite:
+            self.vaciar()
+
+    def vaciar(self):
+        if self.pendientes:
+            self.formato.escribir(self.archivo, self.pendientes)
+            self.pendientes = []
+
+    def cerrar(self):
+        self.vaciar()
+        self.archivo.close()
+
+
+# ===========================================================
+# FASE 1: CORRIDAS POR SELECCIÓN DE REEMPLAZO
+# ===========================================================
+def generar_corridas(datos, directorio, formato, memoria=1_000_000, clave=None,
+                     tamano_buffer=1 << 22, aridad=4):
+    """
+    Escribe corridas ordenadas en 'directorio' y devuelve sus rutas.
+
+    El montículo guarda entradas (corrida, clave, secuencia, registro): un
+    registro menor que el último escrito ya no cabe en la corrida actual y
+    se marca para la siguiente, así que la corrida sigue mientras quede algo.
+    """
+    if memoria < 1:
+        raise ValueError("La memoria debe admitir al menos un registro")
+    clave = clave or (lambda x: x)
+    secuencia = count()
+    iterador = iter(datos)
+
+    monticulo = Monticulo(es_min=True, aridad=aridad)
+    for registro in iterador:
+        monticulo.agregar((0, clave(registro), next(secuencia), registro))
+        if monticulo.tamano >= memoria:
+            break
+
+    rutas = []
+    escritor = None
+    corrida_actual = -1
+    vector = monticulo.vector
+
+    while monticulo.tamano:
+        corrida, k, _, registro = vector[0]
+        if corrida != corrida_actual:
+            if escritor is not None:
+                escritor.cerrar()
+            corrida_actual = corrida
+            rutas.append(os.path.join(directorio, f"corrida_{len(rutas):06d}.bin"))
+            escritor = _Escritor(rutas[-1], formato, tamano_buffer)
+        escritor.escribir(registro)
+
+        siguiente = next(iterador, _FIN)
+        if siguiente is _FIN:
+            monticulo.quitar()
+        else:
+            k_siguiente = clave(siguiente)
+            destino = corrida if k_siguiente >= k else corrida + 1
+            monticulo.reemplazar((destino, k_siguiente, next(secuencia), siguiente))
+
+    if escritor is not None:
+        escritor.cerrar()
+    return rutas
+
+
+# ===========================================================
+# FASE 2: MEZCLA DE K VÍAS
+# ===========================================================
+def mezclar(fuentes, clave=None, aridad=4):
+    """
+    Mezcla iterables ya ordenados. Las entradas del montículo son
+    (clave, índice de fuente, registro): a igual clave sale antes la
+    fuente anterior, así que la mezcla es estable.
+    """
+    clave = clave or (lambda x: x)
+    iteradores = [iter(f) for f in fuentes]
+    monticulo = Monticulo(es_min=True, aridad=aridad)
+    entradas = []
+    for i, it in enumerate(iteradores):
+        registro = next(it, _FIN)
+        if registro is not _FIN:
+            entradas.append((clave(registro), i, registro))
+    monticulo.agregar_muchos(entradas)
+
+    vector = monticulo.vector
+    while monticulo.tamano:
+        _, i, registro = vector[0]
+        yield registro
+        siguiente = next(iteradores[i], _FIN)
+        if siguiente is _FIN:
+            monticulo.quitar()
+        else:
+            monticulo.reemplazar((clave(siguiente), i, siguiente))
+
+
+def _mezclar_por_pasadas(rutas, directorio, formato, clave, max_vias, tamano_buffer, aridad):
+    """Reduce el número de corridas a como mucho 'max_vias'."""
+    pasada = 0
+    while len(rutas) > max_vias:
+        nuevas = []
+        for inicio in range(0, len(rutas), max_vias):
+            grupo = rutas[inicio:inicio + max_vias]
+            ruta = os.path.join(directorio, f"pasada_{pasada:03d}_{len(nuevas):06d}.bin")
+            escritor = _Escritor(ruta, formato, tamano_buffer)
+            for registro in mezclar([formato.leer(r, tamano_buffer) for r in grupo], clave, aridad):
+                escritor.escribir(registro)
+            escritor.cerrar()
+            for r in grupo:
+                os.remove(r)
+            nuevas.append(ruta)
+        rutas = nuevas
+        pasada += 1
+    return rutas
+
+
+# ===========================================================
+# API PÚBLICA
+# ===========================================================
+def ordenar_externo(datos, formato="<d", memoria=1_000_000, max_vias=64, clave=None,
+                    tamano_buffer=1 << 22, directorio=None, aridad=4):
+    """
+    Genera los registros de 'datos' ordenados usando como mucho 'memoria'
+    registros en el montículo y 'max_vias' ficheros abiertos a la vez.
+
+    Args:
+        datos: Iterable de registros compatibles con 'formato'
+        formato: Formato de 'struct' de cada registro
+        memoria: Registros que caben en el montículo de selección
+        max_vias: Máximo de corridas mezcladas a la vez (fan-in)
+        clave: Función de ordenación (por defecto el propio registro)
+        tamano_buffer: Bytes por lectura/escritura en cada fichero
+        directorio: Dónde crear los temporales (por defecto el del sistema)
+    """
+    if max_vias < 2:
+        raise ValueError("max_vias debe ser al menos 2")
+    formato = FormatoRegistro(formato)
+    with tempfile.TemporaryDirectory(prefix="ordenacion_", dir=directorio) as temporal:
+        rutas = generar_corridas(datos, temporal, formato, memoria, clave, tamano_buffer, aridad)
+        rutas = _mezclar_por_pasadas(rutas, temporal, formato, clave, max_vias, tamano_buffer, aridad)
+        # Cada fuente lee con su propio buffer: repartimos para no pasarnos
+        buffer_por_fuente = max(formato.tamano, tamano_buffer // max(1, len(rutas)))
+        yield from mezclar([formato.leer(r, buffer_por_fuente) for r in rutas], clave, aridad)
+
+
+def ordenar_archivo(entrada, salida, formato="<d", **opciones):
+    """Ordena un fichero binario de registros y escribe el resultado en 'salida'."""
+    formato_registro = FormatoRegistro(formato)
+    tamano_buffer = opciones.get("tamano_buffer", 1 << 22)
+    registros = formato_registro.leer(entrada, tamano_buffer)
+    escritor = _Escritor(salida, formato_registro, tamano_buffer)
+    for registro in ordenar_externo(registros, formato, **opciones):
+        escritor.escribir(registro)
+    escritor.cerrar()
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    import random
+
+    datos = [random.randint(0, 99) for _ in range(20)]
+    print(f"Entrada:  {datos}")
+    print(f"Ordenado: {list(ordenar_externo(datos, formato='<q', memoria=4, max_vias=2))}")
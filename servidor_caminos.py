@@ -0,0 +1,318 @@
+"""
+Servidor asyncio de caminos mínimos sobre un único dijkstra_mochila.Grafo.
+
+Cada petición (origen, destino) pasa por tres filtros antes de buscar:
+
+1. Fusión: si ya hay una búsqueda en vuelo para el mismo par, se espera
+   su resultado en vez de lanzar otra.
+2. Microlotes: las peticiones se agrupan por origen y cada origen se
+   resuelve con una sola búsqueda de Dijkstra que se para al asentar
+   todos sus destinos. Se despacha tras una ventana corta (o al llenar un
+   lote), pero nunca más búsquedas a la vez que trabajadores: mientras
+   están ocupados las peticiones se acumulan, y cuanto más carga hay,
+   más grandes salen los lotes.
+3. Ejecutor: las búsquedas nunca corren en el bucle de eventos. Con
+   procesos > 0 van a un ProcessPoolExecutor cuyos trabajadores se adjuntan
+   al grafo exportado a memoria compartida (grafo_compartido); con
+   procesos = 0, a un único hilo que usa dijkstra_con_avl sobre el propio
+   Grafo (un solo hilo porque la búsqueda escribe en los vértices).
+
+servir_http() expone el servidor como GET /camino?origen=A&destino=B y
+generar_carga() mide latencias p50/p99 y peticiones por segundo en local.
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from urllib.parse import parse_qs, urlsplit
+
+INF = float('inf')
+
+
+# ===========================================================
+# SERVIDOR
+# ===========================================================
+class ServidorCaminos:
+    """
+    Atributos:
+        grafo: dijkstra_mochila.Grafo servido (no debe cambiar mientras se sirve)
+        procesos: Trabajadores del pool (0 = un hilo en este proceso)
+        ventana: Segundos que se espera a juntar peticiones antes de despachar
+        max_lote: Peticiones pendientes que fuerzan el despacho sin esperar
+        estadisticas: Contadores de peticiones, fusiones, búsquedas y lotes
+    """
+
+    def __init__(self, grafo, procesos=None, ventana=0.001, max_lote=256):
+        self.grafo = grafo
+        self.procesos = (os.cpu_count() or 1) if procesos is None else procesos
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self.estadisticas = {"peticiones": 0, "fusionadas": 0, "busquedas": 0, "lotes": 0}
+        self._en_vuelo = {}     # (origen, destino) -> futuro compartido
+        self._pendientes = {}   # origen -> {destino: None} (orden de llegada)
+        self._num_pendientes = 0
+        self._temporizador = None
+        self._en_curso = 0      # búsquedas lanzadas al ejecutor y sin terminar
+        self._ejecutor = None
+        self._compartido = None
+
+    # -------- ciclo de vida --------
+    def iniciar(self):
+        """Crea el ejecutor (y exporta el grafo si se usan procesos)."""
+        if self._ejecutor is not None:
+            return self
+        if self.procesos > 0:
+            from grafo_compartido import GrafoCompartido, inicializar_trabajador
+            self._compartido = GrafoCompartido.exportar(self.grafo)
+            # 'spawn': los trabajadores no heredan (ni copian) la memoria del servidor
+            self._ejecutor = ProcessPoolExecutor(
+                self.procesos, mp_context=get_context("spawn"),
+                initializer=inicializar_trabajador, initargs=(self._compartido.identificador(),))
+        else:
+            self._ejecutor = ThreadPoolExecutor(max_workers=1)
+        return self
+
+    async def cerrar(self):
+        """Espera a que se resuelva todo lo pendiente y libera el ejecutor."""
+        if self._pendientes:
+            self._despachar()
+        while self._en_vuelo:
+            await asyncio.gather(*list(self._en_vuelo.values()), return_exceptions=True)
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown()
+            self._ejecutor = None
+        if self._compartido is not None:
+            self._compartido.cerrar()
+            self._compartido = None
+
+    async def __aenter__(self):
+        return self.iniciar()
+
+    async def __aexit__(self, *exc):
+        await self.cerrar()
+
+    # -------- consultas --------
+    async def camino(self, origen, destino):
+        """
+        Returns:
+            tuple: (camino, distancia), o ([], inf) si no hay camino o
+                   algún vértice no existe
+        """
+        self.estadisticas["peticiones"] += 1
+        clave = (origen, destino)
+        futuro = self._en_vuelo.get(clave)
+        if futuro is not None:
+            self.estadisticas["fusionadas"] += 1
+        else:
+            if self._ejecutor is None:
+                raise RuntimeError("El servidor no está iniciado")
+            loop = asyncio.get_running_loop()
+            futuro = self._en_vuelo[clave] = loop.create_future()
+            self._pendientes.setdefault(origen, {})[destino] = None
+            self._num_pendientes += 1
+            if self._num_pendientes >= self.max_lote:
+                self._despachar()
+            elif self._temporizador is None:
+                self._temporizador = loop.call_later(self.ventana, self._despachar)
+        # shield: si un cliente se cancela, el resto sigue esperando el mismo futuro
+        resultado = await asyncio.shield(futuro)
+        return list(resultado[0]), resultado[1]
+
+    def _despachar(self):
+        """Lanza una búsqueda por origen pendiente mientras haya trabajadores libres."""
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        libres = max(1, self.procesos) - self._en_curso
+        if libres <= 0 or not self._pendientes:
+            return  # al terminar una búsqueda se vuelve a despachar
+        self.estadisticas["lotes"] += 1
+        loop = asyncio.get_running_loop()
+        while self._pendientes and libres > 0:
+            origen = next(iter(self._pendientes))  # el origen que más lleva esperando
+            destinos = list(self._pendientes.pop(origen))
+            self._num_pendientes -= len(destinos)
+            self._en_curso += 1
+            libres -= 1
+            self.estadisticas["busquedas"] += 1
+            if self._compartido is not None:
+                from grafo_compartido import consultar_origen
+                tarea = loop.run_in_executor(self._ejecutor, consultar_origen, origen, destinos)
+            else:
+                tarea = loop.run_in_executor(self._ejecutor, self._caminos_locales, origen, destinos)
+            tarea.add_done_callback(lambda t, o=origen, ds=destinos: self._resolver(o, ds, t))
+
+    def _resolver(self, origen, destinos, tarea):
+        self._en_curso -= 1
+        error = asyncio.CancelledError() if tarea.cancelled() else tarea.exception()
+        resultados = None if error is not None else tarea.result()
+        for i, destino in enumerate(destinos):
+            futuro = self._en_vuelo.pop((origen, destino))
+            if futuro.done():
+                continue
+            if error is not None:
+                futuro.set_exception(error)
+            else:
+                futuro.set_result(resultados[i])
+        if self._pendientes:
+            self._despachar()
+
+    def _caminos_locales(self, origen, destinos):
+        """Una búsqueda con dijkstra_con_avl en el hilo del ejecutor."""
+        from dijkstra_mochila import dijkstra_con_avl, reconstruir_camino
+        vertices = self.grafo.vertices
+        if origen not in vertices:
+            return [([], INF) for _ in destinos]
+        conocidos = [d for d in destinos if d in vertices]
+        # Con un solo destino se puede parar al asentarlo; con varios se
+        # recorre todo (dijkstra_con_avl solo admite un destino)
+        dijkstra_con_avl(self.grafo, origen,
+                         destino_nombre=conocidos[0] if len(conocidos) == 1 else None)
+        resultados = []
+        for d in destinos:
+            distancia = vertices[d].distancia if d in vertices else INF
+            if distancia == INF:
+                resultados.append(([], INF))
+            else:
+                resultados.append((reconstruir_camino(self.grafo, origen, d), distancia))
+        return resultados
+
+
+# ===========================================================
+# FRENTE HTTP
+# ===========================================================
+def _nombre_vertice(grafo, texto):
+    """Los nombres llegan como texto: si no existe tal cual, se prueba como entero."""
+    if texto in grafo.vertices:
+        return texto
+    try:
+        numero = int(texto)
+    except ValueError:
+        return texto
+    return numero if numero in grafo.vertices else texto
+
+
+async def servir_http(servidor, host="127.0.0.1", puerto=8080):
+    """
+    Sirve GET /camino?origen=A&destino=B con respuestas JSON
+    {"camino": [...], "distancia": d} (distancia null si no hay camino).
+    Conexiones keep-alive; no pretende ser un servidor HTTP completo.
+
+    Returns:
+        asyncio.Server ya escuchando
+    """
+    async def atender(lector, escritor):
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                while (await lector.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # cabeceras ignoradas
+                partes = linea.decode("latin-1").split()
+                url = urlsplit(partes[1] if len(partes) > 1 else "/")
+                parametros = parse_qs(url.query)
+                if url.path != "/camino" or "origen" not in parametros or "destino" not in parametros:
+                    estado, cuerpo = "404 Not Found", {"error": "uso: /camino?origen=A&destino=B"}
+                else:
+                    origen = _nombre_vertice(servidor.grafo, parametros["origen"][0])
+                    destino = _nombre_vertice(servidor.grafo, parametros["destino"][0])
+                    try:
+                        camino, distancia = await servidor.camino(origen, destino)
+                    except Exception as error:  # p. ej. BrokenProcessPool: se responde igual
+                        estado, cuerpo = "500 Internal Server Error", {"error": repr(error)}
+                    else:
+                        estado = "200 OK"
+                        cuerpo = {"camino": camino, "distancia": None if distancia == INF else distancia}
+                datos = json.dumps(cuerpo).encode()
+                escritor.write(f"HTTP/1.1 {estado}\r\nContent-Type: application/json\r\n"
+                               f"Content-Length: {len(datos)}\r\n\r\n".encode() + datos)
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    return await asyncio.start_server(atender, host, puerto)
+
+
+# ===========================================================
+# GENERADOR DE CARGA
+# ===========================================================
+def _percentil(ordenados, p):
+    if not ordenados:
+        return float('nan')
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+async def generar_carga(consultar, pares, concurrencia=64):
+    """
+    Lanza 'concurrencia' clientes que se reparten los pares y piden cada
+    uno con 'await consultar(origen, destino)'. Mide además el mayor
+    retraso del bucle de eventos (un tic cada milisegundo), que delata las
+    búsquedas que bloquean el bucle.
+
+    Returns:
+        dict: peticiones, segundos, qps, p50, p99 y maximo (latencias en s)
+              y retraso_bucle (s)
+    """
+    latencias = []
+    pendientes = iter(pares)
+    retraso = 0.0
+    terminado = False
+
+    async def cliente():
+        for origen, destino in pendientes:  # iterador compartido entre clientes
+            t = time.perf_counter()
+            await consultar(origen, destino)
+            latencias.append(time.perf_counter() - t)
+
+    async def reloj():
+        nonlocal retraso
+        while not terminado:
+            t = time.perf_counter()
+            await asyncio.sleep(0.001)
+            retraso = max(retraso, time.perf_counter() - t - 0.001)
+
+    tic = asyncio.ensure_future(reloj())
+    t0 = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(concurrencia)))
+    segundos = time.perf_counter() - t0
+    terminado = True
+    await tic
+    latencias.sort()
+    return {
+        "peticiones": len(latencias),
+        "segundos": segundos,
+        "qps": len(latencias) / segundos if segundos > 0 else float('inf'),
+        "p50": _percentil(latencias, 50),
+        "p99": _percentil(latencias, 99),
+        "maximo": latencias[-1] if latencias else float('nan'),
+        "retraso_bucle": retraso,
+    }
+
+
+# ==================== EJEMPLO DE USO ====================
+
+if __name__ == "__main__":
+    import random
+
+    from dijkstra_mochila import Grafo
+    from generadores_grafos import construir, rejilla
+
+    async def principal():
+        n, aristas = rejilla(10_000, semilla=1)
+        grafo = construir(n, aristas, Grafo)
+        rnd = random.Random(2)
+        origenes = [rnd.randrange(n) for _ in range(20)]
+        pares = [(rnd.choice(origenes), rnd.randrange(n)) for _ in range(2_000)]
+        async with ServidorCaminos(grafo, procesos=2) as servidor:
+            print(await servidor.camino(0, n - 1))
+            informe = await generar_carga(servidor.camino, pares)
+            print(f"{informe['qps']:.0f} peticiones/s   p50 {informe['p50'] * 1000:.1f} ms   "
+                  f"p99 {informe['p99'] * 1000:.1f} ms   {servidor.estadisticas}")
+
+    asyncio.run(principal())
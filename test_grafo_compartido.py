@@ -0,0 +1,43 @@
+"""Pruebas de grafo_compartido.GrafoCompartido."""
+
+from dijkstra_mochila import Grafo
+from grafo_compartido import GrafoCompartido
+
+INF = float('inf')
+
+
+def camino_lineal(n):
+    g = Grafo()
+    for v in range(n):
+        g.agregar_arista(v, v + 1, 1)
+    return g
+
+
+def test_caminos_desde_se_para_al_asentar_los_destinos():
+    with GrafoCompartido.exportar(camino_lineal(1000)) as compartido:
+        distancia, _ = compartido.distancias_desde(compartido.indice(0),
+                                                   destinos=[compartido.indice(3)])
+        # Al asentar 3 se para antes de relajar sus aristas: 4 ni se alcanza
+        assert distancia[compartido.indice(3)] == 3
+        assert distancia[compartido.indice(4)] == INF
+        assert sum(d != INF for d in distancia) == 4
+
+
+def test_caminos_desde_coincide_con_camino_minimo():
+    g = camino_lineal(50)
+    g.agregar_arista(0, 10, 2)
+    with GrafoCompartido.exportar(g) as compartido:
+        destinos = [5, 20, 0, "no existe", 50]
+        lote = compartido.caminos_desde(0, destinos)
+        assert lote == [compartido.camino_minimo(0, d) for d in destinos]
+        assert lote[1] == ([0, 10] + list(range(11, 21)), 12)
+        assert lote[3] == ([], INF)
+
+
+def test_pesos_enteros_dan_distancias_enteras():
+    g = camino_lineal(3)
+    with GrafoCompartido.exportar(g) as compartido:
+        assert type(compartido.camino_minimo(0, 3)[1]) is int
+    g.agregar_arista(0, 3, 2.5)
+    with GrafoCompartido.exportar(g) as compartido:
+        assert compartido.camino_minimo(0, 3) == ([0, 3], 2.5)
@@ -0,0 +1,42 @@
+"""
+'import grafos_arboles' no debe hacer trabajo: ni cargar módulos del
+repositorio, ni escribir nada, ni pasarse del presupuesto de tiempo.
+"""
+
+import os
+import subprocess
+import sys
+
+import grafos_arboles
+from benchmarks import PRESUPUESTO_IMPORTACION_MS, tiempo_importacion
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+def importar_en_interprete_nuevo():
+    codigo = ("import sys; antes = set(sys.modules); import grafos_arboles; "
+              "sys.stderr.write(repr(sorted(set(sys.modules) - antes)))")
+    return subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ,
+                          capture_output=True, text=True, check=True)
+
+
+def test_no_carga_modulos_del_repositorio():
+    cargados = eval(importar_en_interprete_nuevo().stderr)
+    assert cargados == ["grafos_arboles"]
+    assert not set(cargados) & set(grafos_arboles.MODULOS)
+
+
+def test_no_escribe_nada():
+    assert importar_en_interprete_nuevo().stdout == ""
+
+
+def test_dentro_del_presupuesto():
+    # Mejor de varias ejecuciones: el primer arranque puede incluir compilar el .pyc
+    assert tiempo_importacion("grafos_arboles", 5) < PRESUPUESTO_IMPORTACION_MS
+
+
+def test_nombres_resueltos_a_demanda():
+    for nombre in grafos_arboles.__all__:
+        assert getattr(grafos_arboles, nombre) is not None
+    assert grafos_arboles.Grafo.__module__ == "dijkstra_mochila"
+    assert grafos_arboles.ArbolAVL.__module__ == "arboles"